@@ -1,4 +1,12 @@
 from .nmrdata import NMRData
+from .io.pipe import read_pipe, write_pipe
+from .core.chunked import process_chunked
+from .core.pipeline import Pipeline
+from .core.fft import set_fft_backend, get_fft_backend, set_fft_workers, get_fft_workers
+from .core.parallel import map_vectors, set_n_jobs, get_n_jobs
+from .core.phasing import PhaseSession
+from .core.cache import window_cache_info, clear_window_cache, set_window_cache_limit
+from .core.precision import set_precision, get_precision
 from .core.processing import (
     solvent_filter, SOL,
     linear_prediction, LP,
@@ -7,8 +15,10 @@ from .core.processing import (
     exp_mult_window, EM,
     zero_fill, ZF,
     fourier_transform, FT,
+    zero_fill_fourier_transform, ZFFT,
     hilbert_transform, HT,
     phase, PS,
+    auto_phase, APK,
     extract_region, EXT,
     polynomial_baseline_correction, POLY,
     transpose, TP, ZTP,
@@ -27,6 +37,14 @@ from .core.processing import (
 
 __all__ = [
     "NMRData",
+    "read_pipe", "write_pipe",
+    "process_chunked",
+    "Pipeline",
+    "set_fft_backend", "get_fft_backend", "set_fft_workers", "get_fft_workers",
+    "map_vectors", "set_n_jobs", "get_n_jobs",
+    "PhaseSession",
+    "window_cache_info", "clear_window_cache", "set_window_cache_limit",
+    "set_precision", "get_precision",
     "solvent_filter", "SOL",
     "linear_prediction", "LP",
     "sine_bell_window", "SP",
@@ -34,8 +52,10 @@ __all__ = [
     "exp_mult_window", "EM",
     "zero_fill", "ZF",
     "fourier_transform", "FT",
+    "zero_fill_fourier_transform", "ZFFT",
     "hilbert_transform", "HT",
     "phase", "PS",
+    "auto_phase", "APK",
     "extract_region", "EXT",
     "polynomial_baseline_correction", "POLY",
     "transpose", "TP", "ZTP",
@@ -0,0 +1,105 @@
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+import numpy as np
+
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 64 * 1024**2
+
+
+class _ArrayCache:
+    """
+    Least recently used cache of read-only arrays, bounded by a number of entries and their total bytes.
+    """
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Cached array of key, computed (and stored if it fits) on a miss."""
+        with self.lock:
+            array = self.entries.get(key)
+            if array is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return array
+            self.misses += 1
+
+        array = compute()
+        array.setflags(write=False)
+
+        with self.lock:
+            if key not in self.entries and self.max_entries > 0 and array.nbytes <= self.max_bytes:
+                self.entries[key] = array
+                self.nbytes += array.nbytes
+                self._evict()
+        return array
+
+    def _evict(self) -> None:
+        while self.entries and (len(self.entries) > self.max_entries or self.nbytes > self.max_bytes):
+            _, array = self.entries.popitem(last=False)
+            self.nbytes -= array.nbytes
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+_window_cache = _ArrayCache()
+
+
+def window_cache_info() -> dict:
+    """
+    Statistics of the cache of apodization windows used by SP, GM and EM.
+
+    Returns:
+        dict: hits, misses, entries, nbytes and the limits max_entries and max_bytes.
+    """
+    cache = _window_cache
+    with cache.lock:
+        return {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "entries": len(cache.entries),
+            "nbytes": cache.nbytes,
+            "max_entries": cache.max_entries,
+            "max_bytes": cache.max_bytes,
+        }
+
+
+def clear_window_cache() -> None:
+    """Remove all cached apodization windows and reset the hit/miss counters."""
+    _window_cache.clear()
+
+
+def set_window_cache_limit(*, max_entries: int | None = None, max_bytes: int | None = None) -> None:
+    """
+    Bound the cache of apodization windows, the least recently used windows are dropped first.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached windows, 0 disables the cache.
+            Defaults to 128.
+        max_bytes (int, optional): Maximum total size of the cached windows in bytes.
+            Defaults to 64 MB.
+    """
+    cache = _window_cache
+    with cache.lock:
+        if max_entries is not None:
+            if max_entries < 0:
+                raise ValueError("max_entries must be 0 or a positive number of windows.")
+            cache.max_entries = int(max_entries)
+        if max_bytes is not None:
+            if max_bytes < 0:
+                raise ValueError("max_bytes must be 0 or a positive number of bytes.")
+            cache.max_bytes = int(max_bytes)
+        cache._evict()
@@ -0,0 +1,225 @@
+from __future__ import annotations
+from time import perf_counter
+from pathlib import Path
+from typing import Callable, Sequence
+import numpy as np
+
+from nmr_fido.nmrdata import NMRData
+from nmr_fido.core.processing import transpose, extract_region, _format_elapsed_time
+from nmr_fido.core.pipeline import Step, _normalize_steps, _step_target, _option, _EXT_Y_OPTIONS
+from nmr_fido.io.pipe import (
+    _open_pipe, _header_to_axes, _axes_to_header, _empty_header,
+    _body_to_complex, _complex_to_body, _create_pipe,
+)
+from nmr_fido.utils.scales import LinearScale
+
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024**2 # bytes
+
+
+def _needs_planes(steps: list[tuple[Callable, dict]]) -> bool:
+    """True if a step works on the last two dimensions, so chunks have to hold whole planes."""
+    planes = False
+    for func, kwargs in steps:
+        target, keywords = _step_target(func, kwargs)
+        axis = _option(keywords, "axis", "dim", -1)
+        if axis not in (-1, -2):
+            raise ValueError(f"Chunked steps can only process axis -1 or -2 (counted from the end), got axis {axis}.")
+        if axis == -2 or target is transpose:
+            planes = True
+        if target is extract_region and any(keywords.get(key) is not None for key in _EXT_Y_OPTIONS):
+            planes = True
+    return planes
+
+
+def _run_steps(chunk: NMRData, steps: list[tuple[Callable, dict]]) -> tuple[NMRData, int]:
+    """Apply the steps to a chunk, returns the result and the peak input + output bytes of a step."""
+    peak = chunk.nbytes
+    for func, kwargs in steps:
+        target, keywords = _step_target(func, kwargs)
+        if target is transpose:
+            if keywords.get("axes") is not None:
+                raise ValueError("Chunked transpose always swaps the last two dimensions, 'axes' cannot be given.")
+            kwargs = {**kwargs, "axes": [0, 2, 1]}
+
+        result = func(chunk, **kwargs)
+        peak = max(peak, chunk.nbytes + result.nbytes)
+        chunk = result
+
+    return chunk, peak
+
+
+def _read_units(body: np.ndarray, lead_shape: tuple[int, ...], first: int, last: int) -> np.ndarray:
+    """Read units [first, last) of the flattened leading dimensions into memory."""
+    trailing_shape = body.shape[len(lead_shape):]
+    if body.flags.c_contiguous:
+        return np.array(body.reshape((-1,) + trailing_shape)[first:last])
+
+    return np.stack([body[np.unravel_index(i, lead_shape)] for i in range(first, last)])
+
+
+def process_chunked(
+    source: str | Path | np.ndarray,
+    destination: str | Path | np.ndarray,
+    steps: Sequence[Step],
+    *,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    overwrite: bool = False,
+) -> NMRData | None:
+    """
+    Run a processing chain on data that does not fit in memory, one chunk at a time.
+
+    The data is streamed from a memory mapped source in blocks of vectors (or of planes
+    if a step works on the last two dimensions, like TP or EXT with start_y/end_y),
+    taken along the leading dimensions that are not processed. Each block is run through
+    the steps and written into the memory mapped destination, so only one block and
+    its intermediate results are held in memory at a time.
+
+    Steps only see the last dimension (the last two in plane mode) and must process
+    every vector independently, e.g. SP, GM, EM, ZF, FT, PS, EXT, DI or TP.
+    TP always swaps the last two dimensions. Steps along the second to last
+    dimension (axis=-2) run in plane mode.
+
+    Example:
+        >>> process_chunked("fid.fid", "spec.ft1", [
+        ...     (SP, {"off": 0.5, "pow": 2}), ZF, FT, (PS, {"p0": -30.0}), DI,
+        ... ], memory_budget=512 * 1024**2)
+
+    Args:
+        source (str | Path | np.ndarray): NMRPipe file (memory mapped), or an array
+            or NMRData, typically backed by np.memmap.
+        destination (str | Path | np.ndarray): New NMRPipe file, or a preallocated array
+            (e.g. np.lib.format.open_memmap) with the shape and a compatible dtype of the output.
+        steps (Sequence): Processing functions, either as the function itself or
+            as a (function, kwargs) tuple.
+        memory_budget (int, optional): Approximate memory in bytes that one chunk and its
+            intermediate results may use. At least one vector (plane) is always processed.
+            Defaults to 256 MB.
+        overwrite (bool, optional): Overwrite an existing destination file. Defaults to False.
+
+    Returns:
+        NMRData | None: The destination array with the output axes and processing history,
+            None when writing to a file (read it back with read_pipe).
+    """
+    start_time = perf_counter()
+    steps = _normalize_steps(steps)
+
+    # Source data, for NMRPipe files the complex direct dimension is assembled per chunk
+    pipe_header = None
+    complex_direct = False
+    if isinstance(source, (str, Path)):
+        source = Path(source)
+        pipe_header, body, complex_direct = _open_pipe(source)
+        shape = body.shape[:-1] + (body.shape[-1] // 2,) if complex_direct else body.shape
+        source_axes = _header_to_axes(pipe_header, shape)
+        source_metadata = {"pipe_header": tuple(pipe_header.tolist()), "filename": str(source)}
+        source_history = []
+    else:
+        body = np.asarray(source)
+        shape = body.shape
+        if isinstance(source, NMRData):
+            source_axes = source.axes
+            source_metadata = source.metadata
+            source_history = source.processing_history
+            if source_metadata.get("pipe_header") is not None:
+                pipe_header = np.array(source_metadata["pipe_header"], dtype=np.float32)
+        else:
+            source_axes = [NMRData._default_axis(i, size) for i, size in enumerate(shape)]
+            source_metadata = {}
+            source_history = []
+
+    plane_mode = _needs_planes(steps)
+    chunk_ndim = 2 if plane_mode else 1
+    if len(shape) < chunk_ndim:
+        raise ValueError(f"Steps work on the last {chunk_ndim} dimensions but data only has {len(shape)}.")
+
+    n_lead = len(shape) - chunk_ndim
+    lead_shape = tuple(shape[:n_lead])
+    n_units = int(np.prod(lead_shape))
+
+    def make_chunk(first: int, last: int) -> NMRData:
+        block = _read_units(body, lead_shape, first, last)
+        if complex_direct:
+            block = _body_to_complex(block)
+        chunk_axis = {"label": "Chunk", "scale": LinearScale.points(last - first), "unit": "pts"}
+        return NMRData(block, axes=[chunk_axis] + list(source_axes[n_lead:]), metadata=source_metadata)
+
+    # Process the first unit on its own to find the output layout and the memory per unit
+    result, peak = _run_steps(make_chunk(0, 1), steps)
+    # Headroom for temporaries inside the steps
+    unit_bytes = 2 * peak
+    units_per_chunk = max(1, min(n_units, int(memory_budget // max(unit_bytes, 1))))
+
+    out_shape = lead_shape + result.shape[1:]
+    out_axes = [dict(axis) for axis in source_axes[:n_lead]] + result.axes[1:]
+    out_complex = np.iscomplexobj(result)
+
+    # Destination
+    destination_file = None
+    if isinstance(destination, (str, Path)):
+        destination_file = Path(destination)
+        if isinstance(source, Path) and destination_file.resolve() == source.resolve():
+            raise ValueError("The destination file cannot be the source file.")
+        if destination_file.exists() and not overwrite:
+            raise FileExistsError(f"{destination_file} already exists, use overwrite=True to replace it.")
+
+        header = pipe_header.copy() if pipe_header is not None else _empty_header()
+        header = _axes_to_header(header, out_shape, out_axes, out_complex)
+        out_body = _create_pipe(destination_file, header, out_shape, out_complex)
+    else:
+        out_body = destination
+        if out_body.shape != out_shape:
+            raise ValueError(f"Destination shape {out_body.shape} does not match the output shape {out_shape}.")
+
+    if not out_body.flags.c_contiguous:
+        raise ValueError("Destination must be C-contiguous.")
+    out_units = out_body.reshape((n_units,) + out_body.shape[n_lead:])
+
+    def write_chunk(first: int, last: int, chunk_result: NMRData) -> None:
+        if destination_file is not None and out_complex:
+            _complex_to_body(np.asarray(chunk_result), out_units[first:last])
+        else:
+            np.copyto(out_units[first:last], np.asarray(chunk_result), casting='same_kind')
+
+    # Accumulate the time spent in each step over all chunks
+    step_history = [dict(entry) for entry in result.processing_history]
+    write_chunk(0, 1, result)
+
+    n_chunks = 1
+    for first in range(1, n_units, units_per_chunk):
+        last = min(first + units_per_chunk, n_units)
+        chunk_result, _ = _run_steps(make_chunk(first, last), steps)
+        write_chunk(first, last, chunk_result)
+        n_chunks += 1
+
+        for entry, chunk_entry in zip(step_history, chunk_result.processing_history):
+            if "time_elapsed_s" in entry:
+                entry["time_elapsed_s"] += chunk_entry["time_elapsed_s"]
+                entry["time_elapsed_str"] = _format_elapsed_time(entry["time_elapsed_s"])
+
+    if isinstance(out_body, np.memmap):
+        out_body.flush()
+
+    elapsed = perf_counter() - start_time
+    history = list(source_history) + step_history
+    history.append({
+        'Function': "Chunked processing",
+        'chunk_mode': "planes" if plane_mode else "vectors",
+        'units_per_chunk': units_per_chunk,
+        'chunks': n_chunks,
+        'memory_budget': memory_budget,
+        'shape_before': tuple(shape),
+        'shape_after': out_shape,
+        'time_elapsed_s': elapsed,
+        'time_elapsed_str': _format_elapsed_time(elapsed),
+    })
+
+    if destination_file is not None:
+        return None
+
+    return NMRData(
+        out_body,
+        axes=out_axes,
+        metadata=result.metadata,
+        processing_history=history,
+    )
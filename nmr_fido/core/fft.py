@@ -0,0 +1,174 @@
+from __future__ import annotations
+import os
+import numpy as np
+import scipy.fft
+
+
+_BACKENDS = ("scipy", "pyfftw", "numpy")
+
+_fft_settings = {
+    "backend": "scipy",
+    "workers": -1, # All cores
+}
+
+
+def set_fft_backend(backend: str) -> None:
+    """
+    Select the FFT implementation used by the processing functions.
+
+    Args:
+        backend (str): "scipy" (default, scipy.fft), "pyfftw" (requires pyFFTW)
+            or "numpy" (np.fft, single threaded).
+    """
+    backend = backend.lower()
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown FFT backend '{backend}'. Must be one of {_BACKENDS}.")
+
+    if backend == "pyfftw":
+        try:
+            import pyfftw.interfaces.cache
+        except ImportError as error:
+            raise ImportError("The pyfftw FFT backend requires pyFFTW, install it with 'pip install pyfftw'.") from error
+        pyfftw.interfaces.cache.enable()
+
+    _fft_settings["backend"] = backend
+
+
+def get_fft_backend() -> str:
+    """Name of the FFT backend in use."""
+    return _fft_settings["backend"]
+
+
+def set_fft_workers(workers: int) -> None:
+    """
+    Set the number of threads used for FFTs.
+
+    Args:
+        workers (int): Number of threads. Negative values count back from the
+            number of CPUs, -1 uses all of them.
+    """
+    workers = int(workers)
+    if workers == 0:
+        raise ValueError("workers must be a positive number of threads or negative to count from the number of CPUs.")
+    _fft_settings["workers"] = workers
+
+
+def get_fft_workers() -> int:
+    """Number of threads used for FFTs (resolved, always positive)."""
+    return _resolve_workers(None)
+
+
+def _resolve_workers(workers: int | None) -> int:
+    if workers is None:
+        workers = _fft_settings["workers"]
+    if workers < 0:
+        workers = max(1, (os.cpu_count() or 1) + 1 + workers)
+    return workers
+
+
+def _complex_buffer(x: np.ndarray) -> np.ndarray:
+    """x as complex64/complex128, matching the precision of x (float64 for integers)."""
+    return np.asarray(x, dtype=np.result_type(x.dtype, np.complex64))
+
+
+def _transform(x: np.ndarray, n: int | None, axis: int, inverse: bool, overwrite_x: bool, workers: int | None) -> np.ndarray:
+    x = _complex_buffer(x)
+    workers = _resolve_workers(workers)
+    backend = _fft_settings["backend"]
+
+    if backend == "scipy":
+        func = scipy.fft.ifft if inverse else scipy.fft.fft
+        return func(x, n=n, axis=axis, overwrite_x=overwrite_x, workers=workers)
+
+    if backend == "pyfftw":
+        import pyfftw.interfaces.scipy_fft as fftw
+        func = fftw.ifft if inverse else fftw.fft
+        return func(x, n=n, axis=axis, overwrite_x=overwrite_x, workers=workers)
+
+    func = np.fft.ifft if inverse else np.fft.fft
+    return func(x, n=n, axis=axis).astype(x.dtype, copy=False)
+
+
+def fft(
+    x: np.ndarray,
+    *,
+    n: int | None = None,
+    axis: int = -1,
+    overwrite_x: bool = False,
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    Forward FFT along one axis with the selected backend.
+
+    complex64 (and float32) input gives complex64 output, complex128 gives complex128.
+
+    Args:
+        x (np.ndarray): Input data.
+        n (int, optional): Length of the transform, x is zero padded (by the FFT backend,
+            vector by vector) when it is longer than x. Defaults to the length of x.
+        axis (int, optional): Axis to transform. Defaults to -1.
+        overwrite_x (bool, optional): Allow the result to be computed in the memory of x. Defaults to False.
+        workers (int, optional): Number of threads, defaults to the global setting (see set_fft_workers).
+
+    Returns:
+        np.ndarray: Transformed data.
+    """
+    return _transform(x, n, axis, False, overwrite_x, workers)
+
+
+def ifft(
+    x: np.ndarray,
+    *,
+    n: int | None = None,
+    axis: int = -1,
+    overwrite_x: bool = False,
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    Inverse FFT (with 1/N normalization) along one axis with the selected backend, see fft.
+    """
+    return _transform(x, n, axis, True, overwrite_x, workers)
+
+
+def rfft(
+    x: np.ndarray,
+    *,
+    n: int | None = None,
+    axis: int = -1,
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    Forward FFT of real data along one axis with the selected backend, only the
+    npoints // 2 + 1 non-negative frequencies are computed (the rest is their conjugate).
+
+    float32 input gives complex64 output, float64 (and integers) give complex128.
+
+    Args:
+        x (np.ndarray): Real input data.
+        n (int, optional): Length of the transform, x is zero padded when it is longer. Defaults to the length of x.
+        axis (int, optional): Axis to transform. Defaults to -1.
+        workers (int, optional): Number of threads, defaults to the global setting (see set_fft_workers).
+
+    Returns:
+        np.ndarray: Half spectrum.
+    """
+    x = np.asarray(x, dtype=np.result_type(x.dtype, np.float32))
+    workers = _resolve_workers(workers)
+    backend = _fft_settings["backend"]
+
+    if backend == "scipy":
+        return scipy.fft.rfft(x, n=n, axis=axis, workers=workers)
+
+    if backend == "pyfftw":
+        import pyfftw.interfaces.scipy_fft as fftw
+        return fftw.rfft(x, n=n, axis=axis, workers=workers)
+
+    return np.fft.rfft(x, n=n, axis=axis).astype(np.result_type(x.dtype, np.complex64), copy=False)
+
+
+def next_fast_len(target: int) -> int:
+    """Smallest size >= target that the FFT backend transforms efficiently (complex data)."""
+    if _fft_settings["backend"] == "pyfftw":
+        import pyfftw
+        return pyfftw.next_fast_len(target)
+    return scipy.fft.next_fast_len(target, real=False)
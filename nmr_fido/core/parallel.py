@@ -0,0 +1,168 @@
+from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+import numpy as np
+
+
+_BACKENDS = ("threads", "processes")
+
+_parallel_settings = {
+    "n_jobs": 1, # Serial
+}
+
+
+def set_n_jobs(n_jobs: int) -> None:
+    """
+    Set the default number of workers used by the per-vector processing functions
+    (SOL, LP, POLY), see map_vectors.
+
+    Args:
+        n_jobs (int): Number of workers. Negative values count back from the
+            number of CPUs, -1 uses all of them. Defaults to 1 (serial).
+    """
+    n_jobs = int(n_jobs)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a positive number of workers or negative to count from the number of CPUs.")
+    _parallel_settings["n_jobs"] = n_jobs
+
+
+def get_n_jobs() -> int:
+    """Default number of workers for per-vector processing (resolved, always positive)."""
+    return _resolve_n_jobs(None)
+
+
+def _resolve_n_jobs(n_jobs: int | None) -> int:
+    if n_jobs is None:
+        n_jobs = _parallel_settings["n_jobs"]
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a positive number of workers or negative to count from the number of CPUs.")
+    if n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _block_bounds(n_vectors: int, n_blocks: int) -> list[tuple[int, int]]:
+    """Split [0, n_vectors) into n_blocks contiguous ranges of (nearly) equal size."""
+    edges = np.linspace(0, n_vectors, n_blocks + 1).astype(int)
+    return [(int(first), int(last)) for first, last in zip(edges[:-1], edges[1:]) if last > first]
+
+
+def _process_block(
+    func: Callable,
+    source_name: str,
+    source_shape: tuple[int, ...],
+    source_dtype: np.dtype,
+    target_name: str,
+    target_shape: tuple[int, ...],
+    target_dtype: np.dtype,
+    first: int,
+    last: int,
+) -> None:
+    """Worker of the process backend, runs func on vectors [first, last) of the shared input into the shared output."""
+    source_memory = shared_memory.SharedMemory(name=source_name)
+    target_memory = shared_memory.SharedMemory(name=target_name)
+    try:
+        source = np.ndarray(source_shape, dtype=source_dtype, buffer=source_memory.buf)
+        target = np.ndarray(target_shape, dtype=target_dtype, buffer=target_memory.buf)
+        target[first:last] = func(source[first:last])
+        del source, target
+    finally:
+        source_memory.close()
+        target_memory.close()
+
+
+def _map_processes(func: Callable, vectors: np.ndarray, out: np.ndarray, bounds: list[tuple[int, int]], n_jobs: int) -> None:
+    # Input and output live in shared memory, so only the block bounds are sent to the workers
+    source_memory = shared_memory.SharedMemory(create=True, size=max(vectors.nbytes, 1))
+    target_memory = shared_memory.SharedMemory(create=True, size=max(out.nbytes, 1))
+    try:
+        source = np.ndarray(vectors.shape, dtype=vectors.dtype, buffer=source_memory.buf)
+        source[...] = vectors
+        target = np.ndarray(out.shape, dtype=out.dtype, buffer=target_memory.buf)
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(
+                    _process_block, func,
+                    source_memory.name, vectors.shape, vectors.dtype,
+                    target_memory.name, out.shape, out.dtype,
+                    first, last,
+                )
+                for first, last in bounds
+            ]
+            for future in futures:
+                future.result()
+
+        for first, last in bounds:
+            out[first:last] = target[first:last]
+        del source, target
+    finally:
+        source_memory.close()
+        source_memory.unlink()
+        target_memory.close()
+        target_memory.unlink()
+
+
+def map_vectors(
+    func: Callable[[np.ndarray], np.ndarray],
+    data: np.ndarray,
+    *,
+    n_jobs: int | None = None,
+    backend: str = "threads",
+) -> np.ndarray:
+    """
+    Apply a function to all vectors along the last dimension, spread over several workers.
+
+    The vectors are flattened to a 2D (n_vectors, npoints) array and split into one
+    contiguous block per worker. func receives a 2D block and must return a 2D array
+    with one row per vector, all rows the same length.
+
+    The "threads" backend suits functions whose work is done in numpy/scipy kernels that
+    release the GIL (FFTs, convolutions, linear algebra). The "processes" backend suits
+    Python heavy functions (loops, curve_fit): the data is placed in shared memory once and
+    each worker process writes its block of the output there. func must then be picklable,
+    i.e. a module level function or a functools.partial of one.
+
+    Args:
+        func (Callable): Function processing a 2D block of vectors.
+        data (np.ndarray): Input data.
+        n_jobs (int, optional): Number of workers, defaults to the global setting (see set_n_jobs).
+        backend (str, optional): "threads" or "processes". Defaults to "threads".
+
+    Returns:
+        np.ndarray: Array of shape data.shape[:-1] + (output length,).
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown parallel backend '{backend}'. Must be one of {_BACKENDS}.")
+
+    array = np.asarray(data)
+    lead_shape = array.shape[:-1]
+    vectors = array.reshape(-1, array.shape[-1])
+    n_vectors = vectors.shape[0]
+
+    n_jobs = min(_resolve_n_jobs(n_jobs), n_vectors)
+    if n_jobs <= 1:
+        result = np.asarray(func(vectors))
+        return result.reshape(lead_shape + result.shape[-1:])
+
+    # The first vector is processed here to find the output length and dtype
+    first_result = np.asarray(func(vectors[:1]))
+    out = np.empty((n_vectors,) + first_result.shape[-1:], dtype=first_result.dtype)
+    out[:1] = first_result
+
+    bounds = [(first + 1, last + 1) for first, last in _block_bounds(n_vectors - 1, n_jobs)]
+
+    if backend == "threads":
+        def run_block(first: int, last: int) -> None:
+            out[first:last] = func(vectors[first:last])
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(run_block, first, last) for first, last in bounds]
+            for future in futures:
+                future.result()
+    else:
+        _map_processes(func, vectors, out, bounds, n_jobs)
+
+    return out.reshape(lead_shape + out.shape[-1:])
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import numpy as np
+
+from nmr_fido.core.processing import phase
+
+
+class _RampState:
+    """
+    Preallocated buffers for phasing one (possibly decimated) copy of the spectrum.
+
+    The spectrum rotated by the first order ramp, S e^{i p1 x}, is kept for the last p1,
+    so updates that only change p0 are a single multiplication by e^{i p0}.
+    """
+    def __init__(self, spectrum: np.ndarray, x: np.ndarray):
+        self.spectrum = spectrum
+        self.x = x # Unit ramp, point index / npoints
+        self.angle = np.empty(x.shape, dtype=np.float32)
+        self.ramp = np.empty(x.shape, dtype=np.complex64)
+        self.rotated = np.empty(spectrum.shape, dtype=np.complex64)
+        self.out = np.empty(spectrum.shape, dtype=np.complex64)
+        self.out_real = np.empty(spectrum.shape, dtype=np.float32)
+        self.scratch = np.empty(spectrum.shape, dtype=np.float32)
+        self.p1 = None
+
+    def apply(self, p0: float, p1: float, real_only: bool) -> np.ndarray:
+        if p1 != self.p1:
+            np.multiply(self.x, np.float32(np.deg2rad(p1)), out=self.angle)
+            np.cos(self.angle, out=self.ramp.real)
+            np.sin(self.angle, out=self.ramp.imag)
+            np.multiply(self.spectrum, self.ramp, out=self.rotated)
+            self.p1 = p1
+
+        p0_rad = np.deg2rad(p0)
+        if not real_only:
+            np.multiply(self.rotated, np.complex64(np.exp(1j * p0_rad)), out=self.out)
+            return self.out
+
+        # Re(R e^{i p0}) = cos(p0) Re(R) - sin(p0) Im(R), the imaginary part is never computed
+        np.multiply(self.rotated.real, np.float32(np.cos(p0_rad)), out=self.out_real)
+        np.multiply(self.rotated.imag, np.float32(np.sin(p0_rad)), out=self.scratch)
+        self.out_real -= self.scratch
+        return self.out_real
+
+
+class PhaseSession:
+    """
+    Fast repeated phase correction of one spectrum, e.g. while moving phasing sliders.
+
+    The unphased spectrum is stored once as contiguous complex64, the unit ramp
+    (point index / npoints) is computed once and every update is written into
+    preallocated buffers, so no NMRData or processing history is created per update.
+    Changing only p0 reuses the first order rotation of the previous update.
+    The phase convention is the same as phase (PS) and result() applies the
+    final values with PS to the original data.
+
+    Example:
+        >>> session = PhaseSession(spectrum)
+        >>> preview = session.update(p0=-29.0, p1=12.0, real_only=True, decimate=8)
+        >>> phased = session.result()
+    """
+    def __init__(self, data: np.ndarray, *, p0: float = 0.0, p1: float = 0.0):
+        """
+        Args:
+            data (NMRData): Unphased spectrum, phased along the last dimension.
+            p0 (float, optional): Initial zero-order phase in degrees. Defaults to 0.0.
+            p1 (float, optional): Initial first-order phase in degrees. Defaults to 0.0.
+        """
+        if not np.iscomplexobj(data):
+            raise ValueError("Phasing requires complex data, use HT to reconstruct the imaginaries.")
+
+        self.data = data
+        self.spectrum = np.ascontiguousarray(data, dtype=np.complex64)
+        npoints = self.spectrum.shape[-1]
+        self.x = (np.arange(npoints) / npoints).astype(np.float32)
+        self.p0 = p0
+        self.p1 = p1
+        self._states = {1: _RampState(self.spectrum, self.x)}
+
+
+    def _state(self, decimate: int) -> _RampState:
+        if decimate < 1:
+            raise ValueError("decimate must be a positive step between preview points.")
+        if decimate not in self._states:
+            self._states[decimate] = _RampState(
+                np.ascontiguousarray(self.spectrum[..., ::decimate]),
+                np.ascontiguousarray(self.x[::decimate]),
+            )
+        return self._states[decimate]
+
+
+    def update(
+        self,
+        p0: float | None = None,
+        p1: float | None = None,
+        *,
+        real_only: bool = False,
+        decimate: int = 1,
+    ) -> np.ndarray:
+        """
+        Phase the spectrum with new values.
+
+        The returned array is a buffer owned by the session that is overwritten by the
+        next update with the same real_only and decimate, copy it to keep it.
+
+        Args:
+            p0 (float, optional): Zero-order phase in degrees, defaults to the current value.
+            p1 (float, optional): First-order phase in degrees, defaults to the current value.
+            real_only (bool, optional): Only compute the real part (float32). Defaults to False.
+            decimate (int, optional): Only compute every decimate-th point, for previews. Defaults to 1.
+
+        Returns:
+            np.ndarray: Phased spectrum, complex64 or float32 if real_only.
+        """
+        if p0 is not None:
+            self.p0 = p0
+        if p1 is not None:
+            self.p1 = p1
+        return self._state(decimate).apply(self.p0, self.p1, real_only)
+
+
+    def preview_x(self, decimate: int = 1) -> np.ndarray:
+        """Point indices of the values returned by update with the same decimate."""
+        return np.arange(0, self.spectrum.shape[-1], decimate)
+
+
+    def result(self) -> np.ndarray:
+        """
+        Apply the current phases to the original data with PS, including its processing history.
+
+        Returns:
+            NMRData: Phased data.
+        """
+        return phase(self.data, p0=self.p0, p1=self.p1)
+
+
+    def __repr__(self) -> str:
+        return f"PhaseSession(shape={self.spectrum.shape}, p0={self.p0}, p1={self.p1})"
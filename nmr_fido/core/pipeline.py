@@ -0,0 +1,346 @@
+from __future__ import annotations
+from time import perf_counter
+from typing import Callable, Iterator, Sequence, Union
+import functools
+import numpy as np
+
+from nmr_fido.nmrdata import NMRData
+from nmr_fido.core.processing import (
+    sine_bell_window, lorentz_to_gauss_window, exp_mult_window,
+    zero_fill, fourier_transform, phase, delete_imaginaries, extract_region,
+    null, add_constant, multiply_constant,
+    _format_elapsed_time,
+)
+from nmr_fido.core.fft import ifft
+
+
+Step = Union[Callable, tuple[Callable, dict]]
+
+
+def _normalize_steps(steps: Sequence[Step]) -> list[tuple[Callable, dict]]:
+    normalized = []
+    for step in steps:
+        if isinstance(step, tuple):
+            func, kwargs = step
+            normalized.append((func, dict(kwargs)))
+        elif callable(step):
+            normalized.append((step, {}))
+        else:
+            raise TypeError(f"Invalid processing step {step!r}, expected a function or a (function, kwargs) tuple.")
+    return normalized
+
+
+def _step_target(func: Callable, kwargs: dict) -> tuple[Callable, dict]:
+    """Underlying function and keyword arguments of a step, looking through functools.partial."""
+    keywords = dict(kwargs)
+    while isinstance(func, functools.partial):
+        keywords = {**func.keywords, **keywords}
+        func = func.func
+    return func, keywords
+
+
+_WINDOWS = (sine_bell_window, lorentz_to_gauss_window, exp_mult_window)
+_FT_OPTIONS = ("real_only", "inverse", "negate_imaginaries", "sign_alteration", "bruk", "real", "inv", "neg", "alt")
+_EXT_Y_OPTIONS = ("start_y", "end_y", "y1", "yn")
+
+
+def _option(keywords: dict, name: str, alias: str, default=None):
+    """Value of an option given by its name or its NMRPipe alias."""
+    if keywords.get(name) is not None:
+        return keywords[name]
+    if keywords.get(alias) is not None:
+        return keywords[alias]
+    return default
+
+
+def _constants(keywords: dict) -> list:
+    """The constants given to ADD/MULT, None for the ones that are not given."""
+    return [
+        _option(keywords, "constant", "c"),
+        _option(keywords, "constant_real", "r"),
+        _option(keywords, "constant_imaginary", "i"),
+    ]
+
+
+def _is_identity(target: Callable, keywords: dict) -> bool:
+    """True if a step leaves the values of the data unchanged (NULL, zero phases, unit constants)."""
+    if target is null:
+        return True
+    if target is phase:
+        # With zero phases invert, exponential_correction and temporary_zero_fill still give a
+        # zero correction, reconstructing the imaginaries with HT changes the data
+        return (
+            keywords.get("p0", 0.0) == 0
+            and keywords.get("p1", 0.0) == 0
+            and not _option(keywords, "reconstruct_imaginaries", "ht")
+        )
+    if target in (add_constant, multiply_constant):
+        unit = 0 if target is add_constant else 1
+        given = [value for value in _constants(keywords) if value is not None]
+        # Without any constant the step raises, so it is left to run as usual
+        return bool(given) and all(value == unit for value in given)
+    return False
+
+
+def _fused_kind(func: Callable, kwargs: dict) -> str | None:
+    """How a step is executed in a fused pass over the last dimension, None if it cannot be fused."""
+    target, keywords = _step_target(func, kwargs)
+
+    # Fused passes work on the last dimension
+    if _option(keywords, "axis", "dim", -1) != -1:
+        return None
+    if _is_identity(target, keywords):
+        return "identity"
+    if target in _WINDOWS:
+        return "diagonal"
+    if target is phase and not _option(keywords, "reconstruct_imaginaries", "ht"):
+        return "diagonal"
+    if target is multiply_constant:
+        constant, constant_real, constant_imaginary = _constants(keywords)
+        # Separate real and imaginary constants are not a complex multiplication
+        if constant is not None and constant_real is None and constant_imaginary is None:
+            return "diagonal"
+    if target is zero_fill:
+        return "zero_fill"
+    if target is fourier_transform and not any(keywords.get(key) for key in _FT_OPTIONS):
+        return "fourier_transform"
+    if target is delete_imaginaries:
+        return "delete_imaginaries"
+    if target is extract_region and all(keywords.get(key) is None for key in _EXT_Y_OPTIONS):
+        return "extract_region"
+    return None
+
+
+class _Pending:
+    """
+    Vectors of the fused pass that are not written out yet:
+    buffer[..., (region - shift) % N] * gain, optionally keeping only the real part.
+    """
+    def __init__(self, buffer: np.ndarray, owned: bool = True):
+        self.buffer = buffer
+        self.owned = owned # False for the input data, which must not be modified or returned
+        self.shift = 0
+        self.start = 0
+        self.stop = buffer.shape[-1]
+        self.gain: np.ndarray | float | None = None
+        self.real = False
+
+    @property
+    def size(self) -> int:
+        return self.stop - self.start
+
+    def materialize(self, dtype: np.dtype, out: np.ndarray | None = None) -> np.ndarray:
+        """Evaluate the pending vectors into out (or an array of dtype)."""
+        npoints = self.buffer.shape[-1]
+        fresh = self.shift != 0
+        if self.shift == 0:
+            source = self.buffer[..., self.start:self.stop]
+        elif self.size == npoints:
+            source = np.roll(self.buffer, self.shift, axis=-1)
+        else:
+            source = np.take(self.buffer, (np.arange(self.start, self.stop) - self.shift) % npoints, axis=-1)
+
+        if self.gain is not None:
+            if fresh and np.result_type(source, self.gain) == source.dtype:
+                np.multiply(source, self.gain, out=source)
+            else:
+                source = source * self.gain
+                fresh = True
+        if self.real:
+            source = source.real
+
+        if out is not None:
+            np.copyto(out, source, casting='unsafe')
+            return out
+
+        return source.astype(dtype, copy=not (fresh or self.owned))
+
+
+def _run_fused(data: NMRData, steps: list[tuple[Callable, dict, str]]) -> NMRData:
+    """
+    Run steps that each work on the last dimension in one pass.
+
+    Identity steps are skipped and the vectors of consecutive diagonal steps are
+    multiplied together, so they cost one multiplication of the data. Every step is first traced on a single vector of ones with the axis of the last
+    dimension, which yields its window/phase values, the new axis and dtype and its
+    processing history entry. The data itself is then windowed straight into the zero
+    filled buffer, transformed in place and only the extracted (real) region is written
+    out with the fftshift, FT scaling and phase applied in the same multiplication.
+    """
+    start_time = perf_counter()
+
+    # Trace the steps on one vector
+    probe = NMRData(np.ones(data.shape[-1], dtype=data.dtype), axes=[data.axes[-1]])
+    traced = []
+    for func, kwargs, kind in steps:
+        result = func(probe, **kwargs)
+        traced.append((kind, probe.dtype, result))
+        probe = NMRData(np.ones(result.shape[-1], dtype=result.dtype), axes=result.axes)
+
+    pending = _Pending(np.asarray(data), owned=False)
+    shape = data.shape
+
+    for kind, dtype_before, result in traced:
+        if kind == "identity":
+            pass
+
+        elif kind == "diagonal":
+            window = np.asarray(result)
+            if pending.real and np.iscomplexobj(window):
+                pending = _Pending(pending.materialize(dtype_before))
+            pending.gain = window if pending.gain is None else pending.gain * window
+
+        elif kind == "zero_fill":
+            buffer = np.zeros(shape[:-1] + (result.shape[-1],), dtype=result.dtype)
+            pending.materialize(result.dtype, out=buffer[..., :pending.size])
+            pending = _Pending(buffer)
+
+        elif kind == "fourier_transform":
+            buffer = pending.materialize(result.dtype)
+            if not buffer.flags.c_contiguous:
+                buffer = np.ascontiguousarray(buffer)
+
+            # Normal FT is done as ifft * N, the fftshift and N are applied when writing out
+            npoints = buffer.shape[-1]
+            pending = _Pending(ifft(buffer, overwrite_x=True))
+            pending.shift = npoints // 2
+            pending.gain = float(npoints)
+
+        elif kind == "delete_imaginaries":
+            pending.real = True
+
+        elif kind == "extract_region":
+            entry = result.processing_history[-1]
+            start, stop = entry["start_x"], entry["end_x"] + 1
+            if isinstance(pending.gain, np.ndarray):
+                pending.gain = pending.gain[start:stop]
+            pending.start, pending.stop = pending.start + start, pending.start + stop
+
+        shape = shape[:-1] + (result.shape[-1],)
+
+    final = traced[-1][2]
+    array = pending.materialize(final.dtype)
+
+    output = NMRData(array, copy_from=data)
+    output.axes[-1] = dict(final.axes[-1])
+
+    # History entries of the traced steps, with the time of the fused pass split over them
+    elapsed = perf_counter() - start_time
+    shape = data.shape
+    for kind, dtype_before, result in traced:
+        entry = dict(result.processing_history[-1])
+        shape_after = shape[:-1] + (result.shape[-1],)
+        if kind == "extract_region":
+            if len(shape) > 1:
+                entry["start_y"], entry["end_y"] = 0, shape[-2] - 1
+            entry["shape_before"], entry["shape_after"] = shape, shape_after
+        if "time_elapsed_s" in entry:
+            entry["time_elapsed_s"] = elapsed / len(traced)
+            entry["time_elapsed_str"] = _format_elapsed_time(entry["time_elapsed_s"])
+        output.processing_history.append(entry)
+        shape = shape_after
+
+    return output
+
+
+class Pipeline:
+    """
+    A processing chain that is compiled into fused passes.
+
+    Runs of steps that work vector by vector on the last dimension (SP, GM, EM,
+    ZF, FT, PS, DI and EXT without a Y range) are executed in one pass: the window is
+    applied into the zero filled buffer, the FFT is done in place and the phase,
+    FT scaling and DI/EXT are applied while writing only the extracted region.
+    Other steps (TP, LP, POLY, ...) run as usual between the fused passes.
+    The resulting data, axes and processing history entries are the same as
+    calling the functions one after another.
+
+    The chain is optimized before the data is touched: steps that leave the values
+    unchanged (NULL, PS with zero phases, MULT by 1, ADD of 0) are dropped from the
+    pass and only keep their history entry, and consecutive diagonal operators
+    (SP, GM, EM, PS and MULT by a constant) are folded into one precomputed vector
+    that is applied in a single multiplication.
+
+    Example:
+        >>> pipeline = Pipeline([
+        ...     (SP, {"off": 0.35, "end": 0.98, "pow": 1, "c": 1.0}),
+        ...     (ZF, {"size": 4096}),
+        ...     FT,
+        ...     (PS, {"p0": -29.0, "p1": 0.0}),
+        ...     DI,
+        ...     (EXT, {"x1": "70ppm", "xn": "40ppm"}),
+        ...     TP,
+        ... ])
+        >>> spectrum = pipeline(data)
+    """
+    def __init__(self, steps: Sequence[Step]):
+        """
+        Args:
+            steps (Sequence): Processing functions, either as the function itself or
+                as a (function, kwargs) tuple.
+        """
+        self.steps = _normalize_steps(steps)
+        self.plan = self._compile(self.steps)
+
+
+    @staticmethod
+    def _compile(steps: list[tuple[Callable, dict]]) -> list[list[tuple[Callable, dict, str | None]]]:
+        """Group consecutive fusable steps, every other step is a group of its own."""
+        plan = []
+        group = []
+        for func, kwargs in steps:
+            kind = _fused_kind(func, kwargs)
+            if kind is None:
+                if group:
+                    plan.append(group)
+                    group = []
+                plan.append([(func, kwargs, None)])
+            else:
+                group.append((func, kwargs, kind))
+        if group:
+            plan.append(group)
+        return plan
+
+
+    def __call__(self, data: np.ndarray) -> np.ndarray:
+        return self.run(data)
+
+
+    def run(self, data: np.ndarray) -> np.ndarray:
+        """
+        Run the pipeline.
+
+        Args:
+            data (NMRData): Input data. Plain arrays run the steps one by one.
+
+        Returns:
+            NMRData: Processed data.
+        """
+        for group in self.plan:
+            kinds = [kind for _, _, kind in group]
+            # A lone identity step is still worth a pass, it then only copies the data
+            fusable = isinstance(data, NMRData) and (
+                all(kind == "identity" for kind in kinds)
+                or (len(group) > 1 and np.iscomplexobj(data))
+            )
+            if fusable:
+                data = _run_fused(data, group)
+                continue
+
+            for func, kwargs, _ in group:
+                data = func(data, **kwargs)
+
+        return data
+
+
+    def __iter__(self) -> Iterator[tuple[Callable, dict]]:
+        return iter(self.steps)
+
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+    def __repr__(self) -> str:
+        names = [getattr(_step_target(func, kwargs)[0], "__qualname__", repr(func)) for func, kwargs in self.steps]
+        return f"Pipeline({', '.join(names)})"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+import numpy as np
+
+
+_PRECISIONS = {
+    "single": (np.dtype(np.float32), np.dtype(np.complex64)),
+    "double": (np.dtype(np.float64), np.dtype(np.complex128)),
+}
+
+_precision_settings = {
+    "precision": None, # Keep the precision of the input data
+}
+
+
+def set_precision(precision: str | None) -> None:
+    """
+    Set the floating point precision of the processing functions.
+
+    With "single" every function works on and returns float32/complex64 data, with
+    "double" float64/complex128. Input data of another precision is converted once when
+    it enters a function. With None (the default) each function keeps the precision of its
+    input, so float32/complex64 data is never promoted to double precision.
+
+    Args:
+        precision (str | None): "single", "double" or None.
+    """
+    if precision is not None:
+        precision = precision.lower()
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}'. Must be one of {tuple(_PRECISIONS)} or None.")
+    _precision_settings["precision"] = precision
+
+
+def get_precision() -> str | None:
+    """Precision policy in use, "single", "double" or None (input precision is kept)."""
+    return _precision_settings["precision"]
+
+
+def _policy_dtype(dtype: np.dtype) -> np.dtype | None:
+    """dtype that data of dtype is converted to under the current policy, None if it is kept."""
+    precision = _precision_settings["precision"]
+    dtype = np.dtype(dtype)
+    if precision is None or dtype.kind not in "iufc":
+        return None
+
+    real_dtype, complex_dtype = _PRECISIONS[precision]
+    target = complex_dtype if dtype.kind == "c" else real_dtype
+    return None if dtype == target else target
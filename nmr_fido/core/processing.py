@@ -1,13 +1,18 @@
 from time import perf_counter
 import numpy as np
 import copy
-from nmr_fido.nmrdata import NMRData
-from nmr_fido.utils.scales import get_ppm_scale
-from nmr_fido.utils.unit_to_index import _convert_to_index
+from nmr_fido.nmrdata import NMRData, _same_memory
+from nmr_fido.utils.scales import LinearScale, roll_scale
+from nmr_fido.utils.unit_to_index import _convert_to_index, convert_to_indices
+from nmr_fido.core.fft import fft, ifft, rfft, next_fast_len
+from nmr_fido.core.parallel import map_vectors
+from nmr_fido.core.cache import _window_cache
+from nmr_fido.core.precision import _policy_dtype, get_precision
 from scipy.signal import hilbert
-from scipy import signal, odr
-from scipy.optimize import curve_fit
-from typing import TypeVar, cast
+from scipy import signal, odr, ndimage, linalg
+from typing import Callable, TypeVar, cast
+import functools
+import inspect
 
 
 NMRArrayType = TypeVar("NMRArrayType", bound=np.ndarray)
@@ -41,12 +46,163 @@ def _format_elapsed_time(elapsed: float) -> str:
     return f"{seconds}s {milliseconds}ms {microseconds}µs"
 
 
-def _interleaved_to_complex(data: NMRArrayType, dim: int = -1) -> NMRArrayType:
+def _normalize_axis(axis: int, ndim: int) -> int:
+    axis = int(axis)
+    if not -ndim <= axis < ndim:
+        raise ValueError(f"axis {axis} is out of bounds for data with {ndim} dimensions.")
+    return axis % ndim
+
+
+def _move_axis(data: NMRArrayType, source: int, destination: int) -> NMRArrayType:
+    """np.moveaxis as a view, with the axes metadata of NMRData reordered alongside."""
+    order = list(range(data.ndim))
+    order.insert(destination % data.ndim, order.pop(source % data.ndim))
+    moved = np.asarray(data).transpose(order)
+
+    if isinstance(data, NMRData):
+        result = NMRData(moved, copy_from=data)
+        result.axes = [data.axes[i] for i in order]
+        return cast(NMRArrayType, result)
+
+    return moved.view(type(data))
+
+
+def _along_axis(func: Callable) -> Callable:
+    """
+    Let a function that processes the last dimension work along any dimension.
+
+    Adds the keyword arguments axis (alias dim). The dimension is moved to the end as a
+    view, without copying the data, the function runs on it and the result is moved back.
+    Element wise kernels (windows, phases, FFT) keep the memory layout of the data, so
+    processing an inner dimension needs no transposes. The processing history entry
+    records the axis when it is not the last one. With inplace=True the metadata of the
+    processed view is handed back to data, which is returned.
+    """
+    @functools.wraps(func)
+    def wrapper(data, *args, axis: int = -1, dim: int | None = None, **kwargs):
+        if dim is not None:
+            axis = dim
+        axis = _normalize_axis(axis, np.ndim(data))
+        if axis == np.ndim(data) - 1:
+            return func(data, *args, **kwargs)
+
+        if kwargs.get("out") is not None:
+            kwargs["out"] = _move_axis(np.asarray(kwargs["out"]), axis, -1)
+        result = func(_move_axis(data, axis, -1), *args, **kwargs)
+        result = _move_axis(result, -1, axis)
+        if isinstance(result, NMRData) and result.processing_history:
+            result.processing_history[-1]["axis"] = axis
+
+        if kwargs.get("inplace"):
+            if isinstance(data, NMRData) and isinstance(result, NMRData):
+                data._share_metadata(result._get_metadata())
+            return data
+        return result
+
+    signature = inspect.signature(func)
+    wrapper.__signature__ = signature.replace(parameters=list(signature.parameters.values()) + [
+        inspect.Parameter("axis", inspect.Parameter.KEYWORD_ONLY, default=-1, annotation="int"),
+        inspect.Parameter("dim", inspect.Parameter.KEYWORD_ONLY, default=None, annotation="int | None"),
+    ])
+    return wrapper
+
+
+def _with_precision(func: Callable) -> Callable:
+    """
+    Apply the precision policy (see set_precision) to a processing function.
+
+    Data of another precision is converted once when it enters the function and the
+    result is returned in the policy precision (float32/complex64 or float64/complex128).
+    Data processed with inplace=True must already be in the policy precision and results
+    written into out keep the dtype of out.
+    """
+    @functools.wraps(func)
+    def wrapper(data, *args, **kwargs):
+        target = _policy_dtype(np.result_type(data))
+        if target is not None:
+            if kwargs.get("inplace"):
+                raise ValueError(
+                    f"inplace=True needs {target} data with the '{get_precision()}' precision policy, got {data.dtype}."
+                )
+            data = data.astype(target)
+
+        result = func(data, *args, **kwargs)
+        if kwargs.get("inplace") or kwargs.get("out") is not None:
+            return result
+
+        target = _policy_dtype(np.result_type(result))
+        if target is not None:
+            result = result.astype(target)
+        return result
+
+    return wrapper
+
+
+def _output_array(data: NMRArrayType, out: np.ndarray | None, inplace: bool) -> np.ndarray | None:
+    """Array a function writes its result into, data itself with inplace, out, or None for a new array."""
+    if inplace:
+        if out is not None:
+            raise ValueError("Give either out or inplace=True, not both.")
+        return np.asarray(data)
+
+    if out is None:
+        return None
+    if out.shape != data.shape:
+        raise ValueError(f"out has shape {out.shape}, expected the shape of the data {data.shape}.")
+    return np.asarray(out)
+
+
+def _work_array(data: NMRArrayType, out: np.ndarray | None, inplace: bool) -> np.ndarray:
+    """Copy of data for a function to modify, placed in out (or data itself with inplace) when given."""
+    target = _output_array(data, out, inplace)
+    if target is None:
+        return np.array(data)
+
+    if not _same_memory(target, np.asarray(data)):
+        np.copyto(target, data, casting='same_kind')
+    return target
+
+
+def _wrap_output(data: NMRArrayType, result: np.ndarray, inplace: bool) -> NMRArrayType:
+    """Result with the type and metadata of data, or data itself when it was processed in place."""
+    if inplace:
+        return data
+    if isinstance(data, NMRData):
+        return cast(NMRArrayType, NMRData(result, copy_from=data))
+    return result.view(type(data))
+
+
+_INPLACE_BLOCK_BYTES = 1024**2
+
+
+def _rows_in_place(array: np.ndarray, func: Callable[[np.ndarray], np.ndarray]) -> None:
+    """
+    Overwrite array with func(array) for functions that move values along the last
+    dimension (reversal, circular shift). Blocks along the first dimension are processed
+    one at a time, so only one block is buffered instead of a copy of the whole array.
+    """
+    if array.ndim < 2:
+        array[...] = func(array)
+        return
+
+    step = max(1, _INPLACE_BLOCK_BYTES // max(array[0].nbytes, 1))
+    for first in range(0, array.shape[0], step):
+        block = array[first:first + step]
+        block[...] = func(block)
+
+
+def _interleaved_to_complex(data: NMRArrayType, dim: int = -1, copy: bool = False) -> NMRArrayType:
     """Convert interleaved data [re1, im1, re2, im2, ...] to complex data [re1 + 1j*im1, re2 + 1j*im2, ....]
 
+    float32/float64 data interleaved along a contiguous last dimension already holds the
+    bytes of complex64/complex128 data and is reinterpreted without copying (the result
+    shares memory with data). Otherwise the real and imaginary vectors are copied once
+    into the complex result. Complex data (e.g. a transposed spectrum) uses its real parts.
+
     Args:
         data (NMRData): Input data.
         dim (int, optional): Target dimension to convert. Defaults to -1.
+        copy (bool, optional): Always return a new array, never a view of data. Defaults to False.
 
 
     Returns:
@@ -64,45 +220,166 @@ def _interleaved_to_complex(data: NMRArrayType, dim: int = -1) -> NMRArrayType:
 
     new_shape[dim] //= 2
 
-    # Rearrange the data along the target axis
-    slices_real = [slice(None)] * data.ndim
-    slices_imag = [slice(None)] * data.ndim
+    array = np.asarray(data)
+    complex_dtype = np.result_type(array.dtype, np.complex64)
 
-    slices_real[dim] = slice(0, None, 2)  # Real parts
-    slices_imag[dim] = slice(1, None, 2)  # Imaginary parts
+    reinterpret = (
+        not copy
+        and dim == array.ndim - 1
+        and array.dtype == np.empty(0, dtype=complex_dtype).real.dtype
+        and array.strides[-1] == array.itemsize
+    )
 
-    # Construct the complex array
-    complex_dtype = np.result_type(data, np.complex64)
-    complex_data = np.empty(new_shape, dtype=complex_dtype)
-    complex_data.real = data[tuple(slices_real)]
-    complex_data.imag = data[tuple(slices_imag)]
-    
-    result = complex_data.copy()
+    if reinterpret:
+        complex_data = array.view(complex_dtype)
+    else:
+        # Rearrange the data along the target axis
+        slices_real = [slice(None)] * data.ndim
+        slices_imag = [slice(None)] * data.ndim
+
+        slices_real[dim] = slice(0, None, 2)  # Real parts
+        slices_imag[dim] = slice(1, None, 2)  # Imaginary parts
+
+        # Construct the complex array, the only copy of the data
+        complex_data = np.empty(new_shape, dtype=complex_dtype)
+        complex_data.real = np.real(array[tuple(slices_real)])
+        complex_data.imag = np.real(array[tuple(slices_imag)])
     
     if isinstance(data, NMRData):
         result = NMRData(complex_data, copy_from=data)
         result.axes[dim]["acqu_mode"] = "Complex"
+        if result.axes[dim].get("unit") in ("pts", None, "points"):
+            result.axes[dim]["scale"] = LinearScale.points(new_shape[dim])
         return result
 
     return complex_data.view(type(data))
 
 
-def _lowpass_filter_safe(fid: NMRArrayType, filt: np.ndarray) -> NMRArrayType:
+# Kernels at least this wide are convolved via FFT, narrower ones directly
+_FFT_CONVOLVE_MIN_WIDTH = 32
+
+
+@functools.lru_cache(maxsize=32)
+def _lowpass_kernel(lowpass_shape: str, filter_width: int, dtype: np.dtype) -> np.ndarray:
+    """FIR low pass kernel normalized to unit sum, cached per (shape, width, dtype). Read-only."""
+    x = np.linspace(-0.5, 0.5, filter_width)
+    match lowpass_shape:
+        case "Boxcar":
+            filter_kernel = np.ones(filter_width)
+        
+        case "Sine":
+            filter_kernel = np.cos(np.pi * x)
+        
+        case "Sine^2":
+            filter_kernel = np.cos(np.pi * x) ** 2
+            
+        case "Gaussian":
+            filter_kernel = np.exp(-4 * (x**2) / (0.5**2))
+            
+        case _:
+            raise ValueError(f"Unknown lowpass_shape: {lowpass_shape}")
+    
+    # Normalize by sum of filter coefficients to preserve amplitude scale
+    filter_kernel = (filter_kernel / filter_kernel.sum()).astype(dtype)
+    filter_kernel.flags.writeable = False
+    return filter_kernel
+
+
+@functools.lru_cache(maxsize=32)
+def _butterworth_coeffs(butter_ord: int, butter_cutoff: float) -> tuple[np.ndarray, np.ndarray]:
+    """Digital Butterworth low pass filter (b, a), cached per (order, cutoff)."""
+    b, a = signal.butter(butter_ord, butter_cutoff, btype='low', analog=False) # type: ignore
+    b.flags.writeable = False
+    a.flags.writeable = False
+    return b, a
+
+
+def _lowpass_filter_safe(fids: np.ndarray, filt: np.ndarray) -> np.ndarray:
+    """Convolve all vectors along the last axis with a normalized, symmetric kernel, with edges padded by reflection."""
     # Half filter width
     K = len(filt) // 2
-
+    
+    if len(filt) < _FFT_CONVOLVE_MIN_WIDTH:
+        # 'mirror' is the same reflection as np.pad(mode='reflect'), without the padded copy
+        return ndimage.convolve1d(fids, filt, axis=-1, mode='mirror')
+    
     # Pad signal edges by reflection to avoid wrap-around artifacts
-    padded = np.pad(fid, (K, K), mode='reflect')
+    padded = np.pad(fids, [(0, 0)] * (fids.ndim - 1) + [(K, K)], mode='reflect')
+    
+    # 'valid' mode returns filtered signal matching original length
+    return signal.fftconvolve(padded, filt.reshape((1,) * (fids.ndim - 1) + (-1,)), mode='valid', axes=-1)
 
-    # Convolve with filter on padded data, 'valid' mode returns filtered signal matching original length
-    conv = signal.convolve(padded, filt, mode='valid')
 
-    # Normalize by sum of filter coefficients to preserve amplitude scale
-    conv /= filt.sum()
+@functools.lru_cache(maxsize=32)
+def _polynomial_basis(npoints: int, order: int, dtype: np.dtype) -> np.ndarray:
+    """Orthonormal basis (npoints, order + 1) of the polynomials up to order, cached per (size, order, dtype). Read-only."""
+    # QR of the Vandermonde matrix on [-1, 1] keeps the projection well conditioned for high orders
+    x = np.linspace(-1.0, 1.0, npoints)
+    Q, _ = np.linalg.qr(np.vander(x, order + 1, increasing=True))
+    basis = Q.astype(dtype)
+    basis.flags.writeable = False
+    return basis
+
+
+def _polynomial_lowpass(fids: np.ndarray, order: int) -> np.ndarray:
+    """Least squares polynomial of every vector along the last axis, as one projection onto the polynomial basis."""
+    basis = _polynomial_basis(fids.shape[-1], order, np.finfo(np.result_type(fids.dtype, np.float32)).dtype)
+    return (fids @ basis) @ basis.T
 
-    return conv
 
+@functools.lru_cache(maxsize=8)
+def _smoothing_spline_factor(npoints: int, smoothing: float) -> np.ndarray:
+    """Banded Cholesky factor of I + smoothing * D^T D (D: second differences), cached per (size, smoothing). Read-only."""
+    # Bands of D^T D for D with rows [1, -2, 1], in upper banded storage
+    ones = np.ones(npoints - 2)
+    bands = np.zeros((3, npoints))
+    bands[0, 2:] = ones
+    bands[1, 1:] = np.convolve(ones, [-2.0, -2.0])
+    bands[2] = np.convolve(ones, [1.0, 4.0, 1.0])
+    bands *= smoothing
+    bands[2] += 1.0
+    
+    factor = linalg.cholesky_banded(bands)
+    factor.flags.writeable = False
+    return factor
+
+
+def _smoothing_spline_lowpass(fids: np.ndarray, smoothing: float) -> np.ndarray:
+    """
+    Penalized smoothing spline (Whittaker smoother) of every vector along the last axis.
+    
+    Minimizes |y - z|^2 + smoothing * |D z|^2 with D the second difference operator,
+    i.e. solves (I + smoothing * D^T D) z = y. The pentadiagonal matrix is the same for
+    all vectors, so it is factored once and every vector is a right hand side of one solve.
+    """
+    npoints = fids.shape[-1]
+    if npoints < 3:
+        return fids.copy()
+    
+    factor = _smoothing_spline_factor(npoints, smoothing)
+    
+    # Vectors as columns, real and imaginary parts as separate right hand sides
+    columns = fids.reshape(-1, npoints).T
+    if np.iscomplexobj(columns):
+        columns = np.concatenate([columns.real, columns.imag], axis=1)
+    
+    smoothed = linalg.cho_solve_banded((factor, False), columns)
+    
+    if np.iscomplexobj(fids):
+        half = smoothed.shape[1] // 2
+        smoothed = smoothed[:, :half] + 1j * smoothed[:, half:]
+    
+    return smoothed.T.reshape(fids.shape)
 
+
+def _solvent_filter_vectors(vectors: np.ndarray, lowpass: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    """Subtract the low frequency component lowpass(vectors) from a block of vectors, all vectors at once."""
+    corrected = np.asarray(vectors - lowpass(vectors))
+    return corrected.astype(vectors.dtype, copy=False)
+
+
+@_with_precision
+@_along_axis
 def solvent_filter(
     data: NMRArrayType,
     *,
@@ -117,6 +394,7 @@ def solvent_filter(
     skip_points: int = 0,
     use_poly_ext: bool = True,
     use_mirror_ext: bool = False,
+    n_jobs: int | None = None,
     
     # Aliases
     mode: int | None = None,
@@ -136,8 +414,11 @@ def solvent_filter(
 
     Args:
         data (NMRArrayType): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
+        n_jobs (int, optional): Number of threads filtering the vectors, defaults to the global setting (see set_n_jobs).
 
     Aliases:
+        dim: Alias for axis.
 
     Returns:
         NMRArrayType: .
@@ -190,60 +471,45 @@ def solvent_filter(
                 sponds to the number of time-domain data points that are averaged. This low-fre-
                 quency component is then subtracted from the original signal (Fig. 1B)."
             """
-            filter_kernel = None
-            b = a = None  # Predeclare for Butterworth
-            match lowpass_shape:
-                case "Boxcar":
-                    filter_kernel = np.ones(filter_width, dtype=np.float32)
-                
-                case "Sine":
-                    filter_kernel = np.cos(np.pi * np.linspace(-0.5, 0.5, filter_width))
-                
-                case "Sine^2":
-                    filter_kernel = np.cos(np.pi * np.linspace(-0.5, 0.5, filter_width)) ** 2
-                    
-                case "Gaussian":
-                    filter_kernel = np.exp(-4 * (np.linspace(-0.5, 0.5, filter_width)**2) / (0.5**2))
-                    
-                case "Butterworth":
-                    b, a = signal.butter(butter_ord, butter_cutoff, btype='low', analog=False) # type: ignore
-                    
-                case _:
-                    raise ValueError(f"Unknown lowpass_shape: {lowpass_shape}")
-            
-            if filter_kernel is not None:
-                # FIR filter via convolution with safe padding
-                for index in np.ndindex(sliced_data.shape[:-1]):
-                    fid = sliced_data[index]
-                    filtered_fid = _lowpass_filter_safe(fid, filter_kernel)
-                    sliced_data[index] = fid - filtered_fid
-
-            elif lowpass_shape == "Butterworth":
+            if lowpass_shape == "Butterworth":
                 # IIR Butterworth filter applied forwards and backwards
-                for index in np.ndindex(sliced_data.shape[:-1]):
-                    fid = sliced_data[index]
-                    filtered_fid = signal.filtfilt(b, a, fid)
-                    sliced_data[index] = fid - filtered_fid
-
+                b, a = _butterworth_coeffs(butter_ord, butter_cutoff)
+                lowpass = functools.partial(signal.filtfilt, b, a, axis=-1)
             else:
-                pass
-
+                # FIR filter via convolution with safe padding
+                # Kernel in the precision of the data, so convolving does not upcast
+                kernel_dtype = np.finfo(np.result_type(sliced_data.dtype, np.float32)).dtype
+                filter_kernel = _lowpass_kernel(lowpass_shape, filter_width, kernel_dtype)
+                lowpass = functools.partial(_lowpass_filter_safe, filt=filter_kernel)
         
         case "Spline":
-            raise NotImplementedError("Spline filter mode not implemented yet.")
+            """
+            Penalized smoothing spline, see Eilers 2003 -> DOI: https://doi.org/10.1021/ac034173t
+            
+            The smoothing is chosen so that the spline follows features wider than about
+            smooth_factor * filter width points, scaled by spline_noise.
+            """
+            smoothing = spline_noise * (smooth_factor * filter_width) ** 4
+            lowpass = functools.partial(_smoothing_spline_lowpass, smoothing=smoothing)
         
         case "Polynomial":
             """
-            Possible implementation:
-            
             Bielecki and Levitt 1989 -> https://doi.org/10.1016/0022-2364(89)90218-7
+            
+            The low frequency component is a polynomial of order poly_ext_order fitted to the FID.
             """
-            raise NotImplementedError("Polynomial filter mode not implemented yet.")
+            lowpass = functools.partial(_polynomial_lowpass, order=poly_ext_order)
         
         
         case _:
             raise ValueError(f"Unknown filter mode: {filter_mode}")
-
+    
+    
+    sliced_data[...] = map_vectors(
+        functools.partial(_solvent_filter_vectors, lowpass=lowpass),
+        sliced_data,
+        n_jobs=n_jobs,
+    )
 
     result[..., skip_points:] = sliced_data
     
@@ -266,17 +532,19 @@ SOL.__doc__ = solvent_filter.__doc__  # Auto-generated
 SOL.__name__ = "SOL"  # Auto-generated
 
 
-def _fit_lp_coeff(vector: np.ndarray, pred_start_idx: int, pred_end_idx: int, order: int) -> np.ndarray:
+def _fit_lp_coeff(vectors: np.ndarray, pred_start_idx: int, pred_end_idx: int, order: int) -> np.ndarray:
     """
            m
     x_k =  Σ q_i * s_k-i
           i=1
+    
+    Fit the coefficients of every vector along the last axis at once.
+    Returns an array (..., order) where q[j] multiplies x_{k-order+j}.
     """
     
-    y_fit = vector[pred_start_idx:pred_end_idx + 1]
+    y_fit = vectors[..., pred_start_idx:pred_end_idx + 1]
     
     K = order
-    n = len(y_fit) - order
     
     """
     q1*x0      + q2*x1  + q3*x2      + ... + qK*x_{K-1}   = x_K
@@ -287,38 +555,156 @@ def _fit_lp_coeff(vector: np.ndarray, pred_start_idx: int, pred_end_idx: int, or
     
     q1*x_{n-1} + q2*x_n + q3*x_{n+1} + ... + qK*x_{n+K-2} = x_{n+K-1}
     """
-    M = np.array([y_fit[i : i + K] for i in range(n)])
+    # Rows [x_i ... x_{i+K-1} | x_{i+K}] of the Hankel system as a strided view, no copies
+    windows = np.lib.stride_tricks.sliding_window_view(y_fit, K + 1, axis=-1)
+    M = windows[..., :K]
+    r = windows[..., K]
     
-    r = y_fit[K : K + n]
+    return _batched_lstsq(M, r)
+
+
+def _batched_lstsq(M: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """Minimum norm least squares solutions of stacked systems M x = r, same as np.linalg.lstsq(rcond=None) for each."""
+    # Reduce the tall systems to square ones first, M = QR has the singular values of R
+    Q, R = np.linalg.qr(M)
+    r = np.einsum('...ji,...j->...i', Q.conj(), r)
     
-    coeffs, residuals, rank, s = np.linalg.lstsq(M, r, rcond=None)
+    U, S, Vh = np.linalg.svd(R, full_matrices=False)
     
-    return coeffs
+    # Singular values below the lstsq cutoff are treated as zero
+    cutoff = np.finfo(S.dtype).eps * max(M.shape[-2:]) * S[..., :1]
+    keep = S > cutoff
+    S_inv = np.where(keep, 1.0 / np.where(keep, S, 1.0), 0.0)
+    
+    Uh_r = np.einsum('...ji,...j->...i', U.conj(), r)
+    return np.einsum('...ji,...j->...i', Vh.conj(), S_inv * Uh_r)
 
 
 def _find_roots(coeffs: np.ndarray) -> np.ndarray:
-    char_poly = np.concatenate(([1.0+0.0j], -coeffs[::-1]))
-    return np.roots(char_poly)
+    """Roots of the characteristic polynomial of every set of coefficients (eigenvalues of the companion matrices)."""
+    order = coeffs.shape[-1]
+    companion = np.zeros(coeffs.shape[:-1] + (order, order), dtype=np.result_type(coeffs, np.complex64))
+    companion[..., 0, :] = coeffs[..., ::-1]
+    companion[..., np.arange(1, order), np.arange(order - 1)] = 1.0
+    return np.linalg.eigvals(companion)
 
 
 def _fix_roots(roots: np.ndarray, root_fix_mode: str) -> np.ndarray:
     match root_fix_mode:
         case "suppress_increasing":
             # Reflect roots outside unit circle
-            return np.array([
-                1 / np.conj(r) if abs(r) > 1 else r
-                for r in roots
-            ])
+            mask = np.abs(roots) > 1
         
         case "suppress_decreasing":
             # Reflect roots inside unit circle
-            return np.array([
-                1 / np.conj(r) if abs(r) < 1 else r
-                for r in roots
-            ])
+            mask = np.abs(roots) < 1
             
         case _:
             return roots
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(mask, 1 / np.conj(roots), roots)
+
+
+def _roots_to_coeffs(roots: np.ndarray) -> np.ndarray:
+    """Prediction coefficients with the given characteristic roots, inverse of _find_roots."""
+    poly = np.ones(roots.shape[:-1] + (1,), dtype=roots.dtype)
+    zero = np.zeros(roots.shape[:-1] + (1,), dtype=roots.dtype)
+    
+    # Multiply out (z - r_1)(z - r_2)... for all vectors at once
+    for i in range(roots.shape[-1]):
+        poly = np.concatenate([poly, zero], axis=-1) - roots[..., i:i+1] * np.concatenate([zero, poly], axis=-1)
+    
+    # Drop leading 1 and flip sign convention
+    return -poly[..., :0:-1]
+
+
+def _extrapolate_lp(work: np.ndarray, npoints: int, coeffs: np.ndarray) -> None:
+    """
+    Fill work[..., npoints:] by running the prediction from the first npoints of every vector.
+    
+    The state [x_{k-K}, ..., x_{k-1}] is advanced K points at a time with the K-th power of
+    the companion matrix, so the loop runs prediction_size / order times for all vectors together.
+    """
+    order = coeffs.shape[-1]
+    total = work.shape[-1]
+    
+    step = np.zeros(coeffs.shape[:-1] + (order, order), dtype=np.result_type(coeffs, work))
+    step[..., np.arange(order - 1), np.arange(1, order)] = 1.0
+    step[..., -1, :] = coeffs
+    block_step = np.linalg.matrix_power(step, order)
+    
+    state = work[..., npoints - order:npoints]
+    position = npoints
+    while position < total:
+        state = np.einsum('...ij,...j->...i', block_step, state)
+        count = min(order, total - position)
+        work[..., position:position + count] = state[..., :count]
+        position += count
+
+
+def _predict_vectors(
+    fids: np.ndarray,
+    *,
+    prediction_size: int,
+    pred_start_idx: int,
+    pred_end_idx: int,
+    order: int,
+    model_direction: str,
+    prediction_direction: str,
+    fix_roots: bool,
+    root_fix_mode: str | None,
+    mirror_image: bool,
+    shifted_mirror_image: bool,
+) -> np.ndarray:
+    """Linear prediction of a block of vectors, returns the vectors extended by prediction_size points."""
+    npoints = fids.shape[-1]
+    
+    predict_reverse = prediction_direction == "backward"
+    
+    # All vectors of the block are fitted and extended together
+    model_fids = fids
+    
+    if mirror_image:
+        mirror = np.conj(fids[..., ::-1])
+        model_fids = np.concatenate([mirror[..., :-1], fids], axis=-1)
+        
+    if shifted_mirror_image:
+        mirror = np.conj(fids[..., ::-1])
+        model_fids = np.concatenate([mirror, fids], axis=-1)
+    
+    match model_direction:
+        case "forward":
+            coeffs = _fit_lp_coeff(model_fids, pred_start_idx, pred_end_idx, order)
+            
+        case "backward":
+            coeffs = _fit_lp_coeff(model_fids[..., ::-1], pred_start_idx, pred_end_idx, order)
+            
+        case "both":
+            coeff_fwd = _fit_lp_coeff(model_fids, pred_start_idx, pred_end_idx, order)
+            coeff_rev = _fit_lp_coeff(model_fids[..., ::-1], pred_start_idx, pred_end_idx, order)
+            coeffs = 0.5 * (coeff_fwd + coeff_rev)
+    
+    
+    if fix_roots:
+        roots = _find_roots(coeffs)
+        
+        fixed_roots = _fix_roots(roots, root_fix_mode)
+        
+        fixed_coeffs = _roots_to_coeffs(fixed_roots)
+        # Roots of real coefficients come in conjugate pairs, so the fixed coefficients stay real
+        coeffs = fixed_coeffs if np.iscomplexobj(fids) else fixed_coeffs.real
+    
+    
+    predicted_data = np.empty(fids.shape[:-1] + (npoints + prediction_size,), dtype=np.result_type(fids, coeffs))
+    
+    # Predict backward by running the prediction forward on the reversed vectors
+    work = predicted_data[..., ::-1] if predict_reverse else predicted_data
+    work[..., :npoints] = fids[..., ::-1] if predict_reverse else fids
+    
+    _extrapolate_lp(work, npoints, coeffs)
+    
+    return predicted_data
 
 
 def _plot_roots(*roots_list: np.ndarray) -> None:
@@ -362,6 +748,8 @@ def _plot_char_poly(*coeffs_list: np.ndarray) -> None:
     fig.show()
 
 
+@_with_precision
+@_along_axis
 def linear_prediction(
     data: NMRArrayType,
     *,
@@ -375,6 +763,7 @@ def linear_prediction(
     root_fix_mode: str = "auto",
     mirror_image: bool = False,
     shifted_mirror_image: bool = False,
+    n_jobs: int | None = None,
     # Aliases
     pred: int | None = None,
     x1: int | None = None,
@@ -398,6 +787,7 @@ def linear_prediction(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         prediction_size (int): Number of points to predict (default: same as data size).
         pred_start (int): Start index for fitting.
         pred_end (int): End index for fitting.
@@ -405,6 +795,10 @@ def linear_prediction(
         direction (str): 'forward', 'backward', or 'both' (currently only 'forward' implemented).
         use_root_fixing (bool): Whether to apply root-fixing to suppress diverging behavior.
         root_fix_mode (str): Strategy to suppress diverging roots.
+        n_jobs (int, optional): Number of threads sharing the vectors, defaults to the global setting (see set_n_jobs).
+
+    Aliases:
+        dim: Alias for axis.
 
     Returns:
         NMRData: Predicted data with extended FID.
@@ -442,7 +836,7 @@ def linear_prediction(
         root_fix_mode = {-1: "suppress_decreasing", 0: None, 1: "suppress_increasing"}[fixMode]
     
     
-    result = data.copy()
+    result = data
     npoints = result.shape[-1]
     
     if prediction_size == -1: prediction_size = npoints
@@ -462,62 +856,29 @@ def linear_prediction(
     # Predict points
     original_shape = result.shape
     new_last_dim = original_shape[-1] + prediction_size
-    new_shape = original_shape[:-1] + (new_last_dim,)
-    predicted_data = np.zeros(new_shape)
-    
     
-    predict_reverse = prediction_direction == "backward"
-    for index in np.ndindex(result.shape[:-1]):
-        fid = np.array(result[index])
-        fid_length = fid.size
-        
-        coeffs = np.zeros(order)
-        model_fid = fid
-        
-        if mirror_image:
-            mirror = np.conj(fid[::-1])
-            model_fid = np.concatenate([mirror[:-1], fid])
-            
-        if shifted_mirror_image:
-            mirror = np.conj(fid[::-1])
-            model_fid = np.concatenate([mirror, fid])
-        
-        match model_direction:
-            case "forward":
-                coeffs = _fit_lp_coeff(model_fid, pred_start_idx, pred_end_idx, order)
-                
-            case "backward":
-                coeffs = _fit_lp_coeff(model_fid[::-1], pred_start_idx, pred_end_idx, order)
-                
-            case "both":
-                coeff_fwd = _fit_lp_coeff(model_fid, pred_start_idx, pred_end_idx, order)
-                coeff_rev = _fit_lp_coeff(model_fid[::-1], pred_start_idx, pred_end_idx, order)
-                coeffs = 0.5 * (coeff_fwd + coeff_rev)
-        
-        
-        if fix_roots:
-            roots = _find_roots(coeffs)
-            
-            fixed_roots = _fix_roots(roots, root_fix_mode)
-            
-            fixed_coeffs = -np.poly(fixed_roots)[:0:-1] # drop leading 1 and flip sign convention
-            coeffs = fixed_coeffs 
-        
-
-        extended = np.empty(fid_length + prediction_size, dtype=fid.dtype)
-        extended[:fid_length] = fid[::-1] if predict_reverse else fid
-
-        for i in range(prediction_size):
-            prev_points = extended[i + fid_length - order : i + fid_length]
-            extended[fid_length + i] = np.dot(coeffs, prev_points)
-
-        predicted_fid = extended[::-1] if predict_reverse else extended
-        predicted_data[index] = predicted_fid
+    predicted_data = map_vectors(
+        functools.partial(
+            _predict_vectors,
+            prediction_size=prediction_size,
+            pred_start_idx=pred_start_idx,
+            pred_end_idx=pred_end_idx,
+            order=order,
+            model_direction=model_direction,
+            prediction_direction=prediction_direction,
+            fix_roots=fix_roots,
+            root_fix_mode=root_fix_mode,
+            mirror_image=mirror_image,
+            shifted_mirror_image=shifted_mirror_image,
+        ),
+        result,
+        n_jobs=n_jobs,
+    )
     
     
     if isinstance(data, NMRData):
         result = NMRData(predicted_data, copy_from=data)
-        result.axes[-1]["scale"] = np.arange(new_last_dim)
+        result.axes[-1]["scale"] = LinearScale.points(new_last_dim)
         
         elapsed = perf_counter() - start_time
         result.processing_history.append({
@@ -535,8 +896,9 @@ def linear_prediction(
             'time_elapsed_s': elapsed,
             'time_elapsed_str': _format_elapsed_time(elapsed),
         })
+        return result
     
-    return result
+    return predicted_data.view(type(data))
 
 # NMRPipe alias
 LP = linear_prediction
@@ -544,15 +906,21 @@ LP.__doc__ = linear_prediction.__doc__  # Auto-generated
 LP.__name__ = "LP"  # Auto-generated
 
 
-def _apply_window(
-    data: NMRArrayType,
+def _real_dtype(dtype: np.dtype) -> np.dtype:
+    """Real floating point dtype matching the precision of dtype (float64 for integers)."""
+    return np.empty(0, dtype=np.result_type(dtype, np.float32)).real.dtype
+
+
+def _full_window(
     window: np.ndarray,
+    npoints: int,
     size_window: int,
     start: int,
     invert_window: bool,
     scale_factor_first_point: float,
     fill_outside_one: bool,
-) -> NMRArrayType:
+) -> np.ndarray:
+    """Window vector of length npoints applied by _apply_window, with the inversion, filling and first point scale."""
     # Invert window if necessary
     if invert_window:
         with np.errstate(divide='ignore', invalid='ignore'):
@@ -566,9 +934,8 @@ def _apply_window(
         else:
             scale_factor_first_point = 1.0
     
-    # Create zeroes array to insert window function into
-    full_window = np.zeros_like(data)
-    npoints = data.shape[-1]
+    # Create a zeroes vector to insert window function into, broadcast over the other dimensions
+    full_window = np.zeros(npoints, dtype=window.dtype)
     
     if start - 1 >= npoints:
         raise ValueError(f"Start point {start} is beyond data size {npoints}.")
@@ -578,26 +945,36 @@ def _apply_window(
     clip_size = end_point - (start - 1)
     
     # Insert window into array
-    full_window[..., start-1:end_point] = window[:clip_size]
+    full_window[start-1:end_point] = window[:clip_size]
     
     # Multiply poitns outside the window range by 1
     if fill_outside_one:
-        mask = full_window == 0
-        full_window[mask] = 1.0
-    
-    # Apply window
-    result = data * full_window
+        full_window[full_window == 0] = 1.0
     
     # Scale first point
-    result[..., start-1] *= scale_factor_first_point
-    
-    if isinstance(data, NMRData):
-        return NMRData(result, copy_from=data)
+    full_window[start-1] *= scale_factor_first_point
     
+    return full_window
+
+
+def _apply_window(
+    data: NMRArrayType,
+    full_window: np.ndarray,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
+) -> NMRArrayType:
+    # Apply window, a single multiplication into the result (or out / data itself)
+    target = _output_array(data, out, inplace)
+    if target is None:
+        result = np.multiply(np.asarray(data), full_window)
+    else:
+        result = np.multiply(np.asarray(data), full_window, out=target, casting='same_kind')
     
-    return result.view(type(data))
+    return _wrap_output(data, result, inplace)
 
 
+@_with_precision
+@_along_axis
 def sine_bell_window(
     data: NMRArrayType,
     *,
@@ -609,6 +986,8 @@ def sine_bell_window(
     scale_factor_first_point: float = 1.0,
     fill_outside_one: bool = False,
     invert_window: bool = False,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Aliases
     off: float | None = None,
     end: float | None = None,
@@ -623,6 +1002,7 @@ def sine_bell_window(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         start_angle (float): Start of the sine bell in units of pi radians (default 0.0).
         end_angle (float): End of the sine bell in units of pi radians (default 1.0).
         exponent (float): Exponent applied to the sine bell (default 1.0).
@@ -631,6 +1011,10 @@ def sine_bell_window(
         scale_factor_first_point (float): Scaling for the first point (default 1.0).
         fill_outside_one (bool): If True, data outside window is multiplied by 1.0 instead of 0.0.
         invert_window (bool): If True, apply 1/window instead of window and 1/scale_factor_first_point.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Apodize data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         off: Alias for start_angle
@@ -640,6 +1024,7 @@ def sine_bell_window(
         c: Alias for scale_factor_first_point
         one: Alias for fill_outside_one
         inv: Alias for invert_window
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after applying sine-bell apodization.
@@ -663,23 +1048,32 @@ def sine_bell_window(
     if size_window is None:
         size_window = int(data.shape[-1])
     
-    # Create window
-    t = np.arange(size_window)
-    window = np.power(
-        np.sin(
-            np.pi * start_angle + np.pi * (end_angle - start_angle) * t / (size_window - 1)
-        ),
-        exponent
-    ).astype(data.dtype)
-    
-    result = _apply_window(
-        data, window,
-        size_window,
-        start,
-        invert_window,
-        scale_factor_first_point,
-        fill_outside_one
+    npoints = int(data.shape[-1])
+    dtype = _real_dtype(data.dtype)
+    
+    # Create window, computed once per set of parameters (see window_cache_info)
+    def make_window() -> np.ndarray:
+        t = np.arange(size_window)
+        window = np.power(
+            np.sin(
+                np.pi * start_angle + np.pi * (end_angle - start_angle) * t / (size_window - 1)
+            ),
+            exponent
+        ).astype(dtype)
+        return _full_window(
+            window, npoints,
+            size_window,
+            start,
+            invert_window,
+            scale_factor_first_point,
+            fill_outside_one,
+        )
+    
+    key = (
+        "SP", start_angle, end_angle, exponent, size_window, start,
+        scale_factor_first_point, fill_outside_one, invert_window, npoints, dtype,
     )
+    result = _apply_window(data, _window_cache.get(key, make_window), out=out, inplace=inplace)
     
     elapsed = perf_counter() - start_time
     if isinstance(result, NMRData) and hasattr(result, "processing_history"):
@@ -707,6 +1101,8 @@ SP.__doc__ = sine_bell_window.__doc__  # Auto-generated
 SP.__name__ = "SP"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def lorentz_to_gauss_window(
     data: NMRArrayType,
     *,
@@ -719,6 +1115,8 @@ def lorentz_to_gauss_window(
     fill_outside_one: bool = False,
     invert_window: bool = False,
     sw: float | None = None,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Aliases
     g1: float | None = None,
     g2: float | None = None,
@@ -733,6 +1131,7 @@ def lorentz_to_gauss_window(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         inv_exp_width (float): Inverse exponential width (default 0.0).
         broaden_width (float): Broadening width for Gaussian function (default 0.0).
         center (float): Center point of the Gaussian function (default 0.0).
@@ -741,6 +1140,10 @@ def lorentz_to_gauss_window(
         scale_factor_first_point (float): Scaling for the first point (default 1.0).
         fill_outside_one (bool): If True, data outside window is multiplied by 1.0 instead of 0.0.
         invert_window (bool): If True, apply 1/window instead of window and 1/scale_factor_first_point.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Apodize data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         g1: Alias for inv_exp_width
@@ -750,6 +1153,7 @@ def lorentz_to_gauss_window(
         c: Alias for scale_factor_first_point
         one: Alias for fill_outside_one
         inv: Alias for invert_window
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after Lorentz-to-Gauss apodization.
@@ -780,25 +1184,33 @@ def lorentz_to_gauss_window(
     elif sw is None:
         raise ValueError("Spectral width (sw) must be provided when data is not NMRData.")
     
-    # Create window
-    t = np.arange(size_window)
-    npoints = data.shape[-1]
-    center_index = int(center * (npoints - 1))
+    npoints = int(data.shape[-1])
+    dtype = _real_dtype(data.dtype)
     
-    exp_component = np.exp((np.pi * t * inv_exp_width) / sw)
-    gauss_component = np.exp(
-        -((0.6 * np.pi * broaden_width * (center_index - t)) ** 2)
-    )
-    window = (exp_component * gauss_component).astype(data.dtype)
-    
-    result = _apply_window(
-        data, window,
-        size_window,
-        start,
-        invert_window,
-        scale_factor_first_point,
-        fill_outside_one,
+    # Create window, computed once per set of parameters (see window_cache_info)
+    def make_window() -> np.ndarray:
+        t = np.arange(size_window)
+        center_index = int(center * (npoints - 1))
+        
+        exp_component = np.exp((np.pi * t * inv_exp_width) / sw)
+        gauss_component = np.exp(
+            -((0.6 * np.pi * broaden_width * (center_index - t)) ** 2)
+        )
+        window = (exp_component * gauss_component).astype(dtype)
+        return _full_window(
+            window, npoints,
+            size_window,
+            start,
+            invert_window,
+            scale_factor_first_point,
+            fill_outside_one,
+        )
+    
+    key = (
+        "GM", inv_exp_width, broaden_width, center, sw, size_window, start,
+        scale_factor_first_point, fill_outside_one, invert_window, npoints, dtype,
     )
+    result = _apply_window(data, _window_cache.get(key, make_window), out=out, inplace=inplace)
     
     
     elapsed = perf_counter() - start_time
@@ -826,6 +1238,8 @@ GM.__doc__ = lorentz_to_gauss_window.__doc__  # Auto-generated
 GM.__name__ = "GM"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def exp_mult_window(
     data: NMRArrayType,
     *,
@@ -836,6 +1250,8 @@ def exp_mult_window(
     fill_outside_one: bool = False,
     invert_window: bool = False,
     sw: float | None = None,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Aliases
     lb: float | None = None,
     size: int | None = None,
@@ -848,12 +1264,17 @@ def exp_mult_window(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         line_broadening (float): Line broadening factor (default 0.0).
         size_window (int, optional): Number of points in the window (default: size of last axis).
         start (int): Index to start applying the window (default 1 = first point).
         scale_factor_first_point (float): Scaling for the first point (default 1.0).
         fill_outside_one (bool): If True, data outside window is multiplied by 1.0 instead of 0.0.
         invert_window (bool): If True, apply 1/window instead of window and 1/scale_factor_first_point.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Apodize data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         lb: Alias for line_broadening
@@ -861,6 +1282,7 @@ def exp_mult_window(
         c: Alias for scale_factor_first_point
         one: Alias for fill_outside_one
         inv: Alias for invert_window
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after applying exponential multiply apodization.
@@ -891,21 +1313,30 @@ def exp_mult_window(
     elif sw is None:
         raise ValueError("Spectral width (sw) must be provided when data is not NMRData.")
     
-    # Create window
-    t = np.arange(size_window)
+    npoints = int(data.shape[-1])
+    dtype = _real_dtype(data.dtype)
     
-    window = np.exp(
-        -np.pi * t * line_broadening / sw
-    ).astype(data.dtype)
+    # Create window, computed once per set of parameters (see window_cache_info)
+    def make_window() -> np.ndarray:
+        t = np.arange(size_window)
+        
+        window = np.exp(
+            -np.pi * t * line_broadening / sw
+        ).astype(dtype)
+        return _full_window(
+            window, npoints,
+            size_window,
+            start,
+            invert_window,
+            scale_factor_first_point,
+            fill_outside_one,
+        )
     
-    result = _apply_window(
-        data, window,
-        size_window,
-        start,
-        invert_window,
-        scale_factor_first_point,
-        fill_outside_one
+    key = (
+        "EM", line_broadening, sw, size_window, start,
+        scale_factor_first_point, fill_outside_one, invert_window, npoints, dtype,
     )
+    result = _apply_window(data, _window_cache.get(key, make_window), out=out, inplace=inplace)
     
     if isinstance(result, NMRData):
         elapsed = perf_counter() - start_time
@@ -930,12 +1361,51 @@ EM.__name__ = "EM"  # Auto-generated
 
 
 
+def _zero_fill_size(
+    last_dim: int,
+    factor: int,
+    add: int | None,
+    final_size: int | None,
+    fast_length: bool,
+) -> tuple[int, str]:
+    """Size of the last dimension after zero filling and the mode used, see zero_fill."""
+    # If user sets anything other than factor, we switch mode
+    if any(x is not None for x in (add, final_size)):
+        if sum(x is not None for x in (add, final_size)) > 1:
+            raise ValueError("Specify only one of 'add' or 'final_size'.")
+        factor = -1  # Ignore default doubling if add or final_size is given
+
+    method = ""
+    new_last_dim = last_dim
+    if factor != -1:
+        new_last_dim = last_dim * (2 ** factor)
+        method = 'factor'
+    
+    elif add is not None:
+        new_last_dim = last_dim + add
+        method = 'add'
+    
+    elif final_size is not None:
+        if final_size < last_dim:
+            raise ValueError(f"final_size {final_size} must be greater than current last dimension {last_dim}.")
+        new_last_dim = final_size
+        method = 'final_size'
+    
+    if fast_length:
+        new_last_dim = next_fast_len(new_last_dim)
+
+    return new_last_dim, method
+
+
+@_with_precision
+@_along_axis
 def zero_fill(
     data: NMRArrayType,
     *,
     factor: int = 1,
     add: int | None = None,
     final_size: int | None = None,
+    fast_length: bool = False,
     # Aliases
     zf: int | None = None,
     pad: int | None = None,
@@ -946,14 +1416,18 @@ def zero_fill(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         factor (int, optional): How many times to double the size (2^factor). Default = 1 (double size once).
         add (int, optional): How many zeros to add to the last dimension.
         final_size (int, optional): Final size for the last dimension.
+        fast_length (bool, optional): Round the new size up to the next size the FFT backend
+            transforms efficiently (see next_fast_len), e.g. 1000 -> 1000, 1030 -> 1050.
         
     Aliases:
         zf: Alias for factor.
         pad: Alias for add.
         size: Alias for final_size.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Zero-filled NMRData.
@@ -980,33 +1454,13 @@ def zero_fill(
                 f"Cannot zero-fill: last dimension unit is '{last_unit}', expected 'pts' or None."
             )
 
-    # If user sets anything other than factor, we switch mode
-    if any(x is not None for x in (add, final_size)):
-        if sum(x is not None for x in (add, final_size)) > 1:
-            raise ValueError("Specify only one of 'add' or 'final_size'.")
-        factor = -1  # Ignore default doubling if add or final_size is given
-
-    method = ""
-    new_last_dim = last_dim
-    if factor != -1:
-        new_last_dim = last_dim * (2 ** factor)
-        method = 'factor'
-    
-    elif add is not None:
-        new_last_dim = last_dim + add
-        method = 'add'
-    
-    elif final_size is not None:
-        if final_size < last_dim:
-            raise ValueError(f"final_size {final_size} must be greater than current last dimension {last_dim}.")
-        new_last_dim = final_size
-        method = 'final_size'
+    new_last_dim, method = _zero_fill_size(last_dim, factor, add, final_size, fast_length)
 
 
     new_shape = original_shape[:-1] + [new_last_dim]
 
-    # Create zero filled np.ndarray
-    result_array = np.zeros(new_shape, dtype=data.dtype)
+    # Create zero filled np.ndarray, in the memory layout of data (e.g. when zero filling along another axis)
+    result_array = np.zeros_like(np.asarray(data), shape=new_shape)
 
     # Copy original data into zero filled np.ndarray
     slicing = tuple(slice(0, s) for s in original_shape)
@@ -1016,7 +1470,7 @@ def zero_fill(
         result = NMRData(result_array, copy_from=data)
         
         # Update last scale with pts
-        result.axes[-1]["scale"] = np.arange(new_last_dim)
+        result.axes[-1]["scale"] = LinearScale.points(new_last_dim)
         
         # Update processing history
         elapsed = perf_counter() - start_time
@@ -1026,6 +1480,7 @@ def zero_fill(
                 'original_last_dim': last_dim,
                 'new_last_dim': new_last_dim,
                 'method': method,
+                'fast_length': fast_length,
                 'time_elapsed_s': elapsed,
                 'time_elapsed_str': _format_elapsed_time(elapsed),
             }
@@ -1041,123 +1496,337 @@ ZF.__name__ = "ZF"  # Auto-generated
 
 
 
-def fourier_transform(
+def _place_wrapped(out: np.ndarray, start: int, values: np.ndarray, conjugate: bool) -> None:
+    """Write values into the last dimension of out from index start on, wrapping around its end."""
+    count = values.shape[-1]
+    first = min(count, out.shape[-1] - start)
+    for target, source in ((out[..., start:start + first], values[..., :first]), (out[..., :count - first], values[..., first:])):
+        if conjugate:
+            np.conjugate(source, out=target)
+        else:
+            target[...] = source
+
+
+def _hermitian_spectrum(half: np.ndarray, npoints: int, shift: int, conjugate: bool) -> np.ndarray:
+    """
+    Full spectrum of real data from the npoints // 2 + 1 values computed by rfft, rolled by shift points.
+
+    With conjugate the result is the conjugate spectrum (the ifft convention of FT).
+    """
+    spectrum = np.empty(half.shape[:-1] + (npoints,), dtype=half.dtype)
+    n_half = half.shape[-1]
+
+    # Value k > npoints // 2 of the spectrum is the conjugate of value npoints - k
+    mirrored = half[..., npoints - n_half:0:-1]
+    _place_wrapped(spectrum, shift % npoints, half, conjugate)
+    _place_wrapped(spectrum, (n_half + shift) % npoints, mirrored, not conjugate)
+    return spectrum
+
+
+def _forward_transform(
+    data: np.ndarray,
+    size: int,
+    real_only: bool,
+    negate_imaginaries: bool,
+    sign_alteration: bool,
+    workers: int | None,
+) -> np.ndarray:
+    """
+    Forward FT of the last dimension of data zero filled to size points, as done by fourier_transform.
+
+    The zero filling is done by the FFT backend one vector at a time, the padded data is never
+    allocated. Real input (or real_only) is transformed with an rfft, the other half of its
+    Hermitian spectrum is mirrored from the computed one. For an even size the fftshift (and
+    the sign alternation that cancels it) is a shift of the spectrum by size / 2, applied while
+    placing the two halves, or folded with the scaling into one multiplication of complex input.
+    """
+    even = size % 2 == 0
+
+    if real_only or np.isrealobj(data):
+        x = np.real(np.asarray(data))
+        if sign_alteration and not even:
+            x = np.array(x, dtype=np.result_type(x.dtype, np.float32))
+            x[..., 1::2] *= -1
+        half = rfft(x, n=size, workers=workers)
+        shift = 0 if sign_alteration and even else size // 2
+        return _hermitian_spectrum(half, size, shift, conjugate=True)
+
+    # Single working copy, complex64 for single and complex128 for double precision data
+    array = np.array(data, dtype=np.result_type(data.dtype, np.complex64))
+
+    # Negate imaginary parts if needed
+    if negate_imaginaries:
+        np.conjugate(array, out=array)
+
+    # Data comes out as data * 1/N because we're using ifft for normal FT, undo norm
+    if even:
+        if sign_alteration:
+            array *= size
+        else:
+            signs = np.full(array.shape[-1], size, dtype=array.real.dtype)
+            signs[1::2] = -size
+            array *= signs
+        return ifft(array, n=size, overwrite_x=True, workers=workers)
+
+    if sign_alteration:
+        array[..., 1::2] *= -1
+    transformed = np.fft.fftshift(ifft(array, n=size, overwrite_x=True, workers=workers), axes=(-1,))
+    transformed *= size
+    return transformed
+
+
+def _inverse_transform(
+    data: np.ndarray,
+    real_only: bool,
+    negate_imaginaries: bool,
+    sign_alteration: bool,
+    workers: int | None,
+) -> np.ndarray:
+    """Inverse FT of the last dimension of data, as done by fourier_transform (see _forward_transform)."""
+    npoints = data.shape[-1]
+    even = npoints % 2 == 0
+
+    if real_only or np.isrealobj(data):
+        x = np.real(np.asarray(data))
+        if not even:
+            x = np.fft.ifftshift(x, axes=(-1,))
+        half = rfft(x, workers=workers)
+        half /= npoints
+        if even and not sign_alteration:
+            # Alternating signs of an even length spectrum survive the mirroring
+            half[..., 1::2] *= -1
+        transformed = _hermitian_spectrum(half, npoints, 0, conjugate=False)
+        if sign_alteration and not even:
+            transformed[..., 1::2] *= -1
+        return transformed
+
+    array = np.array(data, dtype=np.result_type(data.dtype, np.complex64))
+    if negate_imaginaries:
+        np.conjugate(array, out=array)
+
+    # Data comes out as data * 1 because we're using fft for inverse FT, but we need data * 1/N
+    if even:
+        transformed = fft(array, overwrite_x=True, workers=workers)
+        transformed /= npoints
+        if not sign_alteration:
+            transformed[..., 1::2] *= -1
+        return transformed
+
+    transformed = fft(np.fft.ifftshift(array, axes=(-1,)), overwrite_x=True, workers=workers)
+    transformed /= npoints
+    if sign_alteration:
+        transformed[..., 1::2] *= -1
+    return transformed
+
+
+@_with_precision
+@_along_axis
+def fourier_transform(
+    data: NMRArrayType,
+    *,
+    real_only: bool = False,
+    inverse: bool = False,
+    negate_imaginaries: bool = False,
+    sign_alteration: bool = False,
+    bruk: bool = False,
+    workers: int | None = None,
+    #dmx: bool = False,
+    #nodmx: bool = False,
+    # Aliases
+    real: bool | None = None,
+    inv: bool | None = None,
+    neg: bool | None = None,
+    alt: bool | None = None,
+) -> NMRArrayType:
+    """
+    Apply Fourier Transform to the last dimension of the NMRData.
+
+    Args:
+        data (NMRData): Input NMRData.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
+        real_only (bool): Set imaginary part of data to 0 before performing FFT.
+        inverse (bool): Perform inverse FFT if True.
+        negate_imaginaries (bool): Multiply imaginary parts by -1 before FFT.
+        sign_alteration (bool): Apply sign alternation to input (multiply every other point by -1).
+        bruk (bool): If True, sets real_only and sign_alteration to True automatically (Bruker-style processing).
+        workers (int, optional): Number of FFT threads, defaults to the global setting (see set_fft_workers).
+
+    Aliases:
+        real: Alias for real_only.
+        inv: Alias for inverse.
+        neg: Alias for negate_imaginaries.
+        alt: Alias for sign_alteration.
+        dim: Alias for axis.
+
+    Returns:
+        NMRData: Fourier transformed data, complex64 for single precision input and complex128 otherwise.
+    """
+    start_time = perf_counter()
+    
+    # Handle argument aliases
+    _resolve_aliases(
+        {
+            "real_only": ["real"],
+            "inverse": ["inv"],
+            "negate_imaginaries": ["neg"],
+            "sign_alteration": ["alt"],
+        },
+        locals()
+    )
+
+
+    
+    if bruk:
+        real_only = True
+        sign_alteration = True
+
+    if inverse:
+        transformed = _inverse_transform(data, real_only, negate_imaginaries, sign_alteration, workers)
+    else:
+        transformed = _forward_transform(data, int(data.shape[-1]), real_only, negate_imaginaries, sign_alteration, workers)
+
+
+    if isinstance(data, NMRData):
+        # Result
+        result = NMRData(transformed, copy_from=data)
+        
+        # Convert scale to ppm
+        result.scale_to_ppm()
+
+        # Update metadata
+        elapsed = perf_counter() - start_time
+        result.processing_history.append(
+            {
+                'Function': 'Complex fourier transform',
+                'real_only': real_only,
+                'inverse': inverse,
+                'negate_imaginaries': negate_imaginaries,
+                'sign_alteration': sign_alteration,
+                'bruk': bruk,
+                'input_real': np.isrealobj(data),
+                'time_elapsed_s': elapsed,
+                'time_elapsed_str': _format_elapsed_time(elapsed),
+            }
+        )
+        return result
+
+    return transformed.view(type(data))
+
+# NMRPipe alias
+FT = fourier_transform
+FT.__doc__ = fourier_transform.__doc__  # Auto-generated
+FT.__name__ = "FT"  # Auto-generated
+
+
+
+@_with_precision
+@_along_axis
+def zero_fill_fourier_transform(
     data: NMRArrayType,
     *,
+    factor: int = 1,
+    add: int | None = None,
+    final_size: int | None = None,
+    fast_length: bool = False,
     real_only: bool = False,
-    inverse: bool = False,
     negate_imaginaries: bool = False,
     sign_alteration: bool = False,
     bruk: bool = False,
-    #dmx: bool = False,
-    #nodmx: bool = False,
+    workers: int | None = None,
     # Aliases
+    zf: int | None = None,
+    pad: int | None = None,
+    size: int | None = None,
     real: bool | None = None,
-    inv: bool | None = None,
     neg: bool | None = None,
     alt: bool | None = None,
 ) -> NMRArrayType:
     """
-    Apply Fourier Transform to the last dimension of the NMRData.
+    Zero fill and Fourier transform the last dimension of the data in one step.
+
+    Gives the same result and processing history as ZF followed by FT, but the zero filled
+    data is never allocated: the FFT backend pads one vector at a time while transforming
+    and only the spectrum is allocated.
 
     Args:
-        data (NMRData): Input NMRData.
+        data (NMRData): Input data (FID).
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
+        factor (int, optional): How many times to double the size (2^factor). Default = 1 (double size once).
+        add (int, optional): How many zeros to add to the last dimension.
+        final_size (int, optional): Final size for the last dimension.
+        fast_length (bool, optional): Round the new size up to the next size the FFT backend
+            transforms efficiently (see next_fast_len).
         real_only (bool): Set imaginary part of data to 0 before performing FFT.
-        inverse (bool): Perform inverse FFT if True.
         negate_imaginaries (bool): Multiply imaginary parts by -1 before FFT.
         sign_alteration (bool): Apply sign alternation to input (multiply every other point by -1).
         bruk (bool): If True, sets real_only and sign_alteration to True automatically (Bruker-style processing).
+        workers (int, optional): Number of FFT threads, defaults to the global setting (see set_fft_workers).
 
     Aliases:
+        zf: Alias for factor.
+        pad: Alias for add.
+        size: Alias for final_size.
         real: Alias for real_only.
-        inv: Alias for inverse.
         neg: Alias for negate_imaginaries.
         alt: Alias for sign_alteration.
+        dim: Alias for axis.
 
     Returns:
-        NMRData: Fourier transformed data.
+        NMRData: Spectrum of the zero filled data, complex64 for single precision input and complex128 otherwise.
     """
     start_time = perf_counter()
     
     # Handle argument aliases
-    _resolve_aliases(
-        {
-            "real_only": ["real"],
-            "inverse": ["inv"],
-            "negate_imaginaries": ["neg"],
-            "sign_alteration": ["alt"],
-        },
-        locals()
-    )
-
-
+    factor = zf if zf is not None else factor
+    add = pad if pad is not None else add
+    final_size = size if size is not None else final_size
+    real_only = real_only or bool(real)
+    negate_imaginaries = negate_imaginaries or bool(neg)
+    sign_alteration = sign_alteration or bool(alt)
+    
+    last_dim = int(data.shape[-1])
+    
+    if isinstance(data, NMRData):
+        last_unit = data.axes[-1]["unit"]
+        if last_unit not in ("pts", None, "points"):
+            raise ValueError(
+                f"Cannot zero-fill: last dimension unit is '{last_unit}', expected 'pts' or None."
+            )
+    
+    new_last_dim, method = _zero_fill_size(last_dim, factor, add, final_size, fast_length)
+    zero_fill_elapsed = perf_counter() - start_time
     
     if bruk:
         real_only = True
         sign_alteration = True
-
-    array = data.copy()
     
-    if real_only:
-        array = array.astype(np.complex128)
-        array.imag = 0.0
-
-    # Sign alteration if needed
-    if sign_alteration and not inverse:
-        # Sign alteration for inverse is applied after ifft
-        alternating_ones = np.ones(array.shape[-1])
-        alternating_ones[1::2] = -1
-        array = array * alternating_ones
-
-    # Negate imaginary parts if needed
-    if negate_imaginaries:
-        array = np.real(array) - 1j * np.imag(array)
-
-    if not np.iscomplex(array).all():
-        array = array.astype("complex64")
-
-    # Perform FFT or IFFT
-    if inverse:
-        transformed = (
-            np.fft.fft(
-                np.fft.ifftshift(array, axes=(-1,)),
-                axis=-1
-            ).astype(data.dtype)
-        )
-        # Data comes out as data * 1 because we're using fft for inverse FT
-        # but we need data * 1/N
-        transformed /= int(data.shape[-1]) # apply norm
-        
-        if sign_alteration:
-            alternating_ones = np.ones(array.shape[-1])
-            alternating_ones[1::2] = -1
-            transformed = transformed * alternating_ones
-        
-    else:
-        transformed = (
-            np.fft.fftshift(
-                np.fft.ifft(array, axis=-1).astype(data.dtype),
-                axes=(-1,),
-            )
-        )
-        # Data comes out as data * 1/N because we're using ifft for normal FT
-        transformed *= int(data.shape[-1]) # undo norm
-
-
+    transformed = _forward_transform(data, new_last_dim, real_only, negate_imaginaries, sign_alteration, workers)
+    
     if isinstance(data, NMRData):
-        # Result
         result = NMRData(transformed, copy_from=data)
+        result.axes[-1]["scale"] = LinearScale.points(new_last_dim)
+        
+        # Both steps are recorded as if ZF and FT had been called one after the other
+        result.processing_history.append(
+            {
+                'Function': "Zero filling",
+                'original_last_dim': last_dim,
+                'new_last_dim': new_last_dim,
+                'method': method,
+                'fast_length': fast_length,
+                'time_elapsed_s': zero_fill_elapsed,
+                'time_elapsed_str': _format_elapsed_time(zero_fill_elapsed),
+            }
+        )
         
-        # Convert scale to ppm
         result.scale_to_ppm()
-
-        # Update metadata
-        elapsed = perf_counter() - start_time
+        
+        elapsed = perf_counter() - start_time - zero_fill_elapsed
         result.processing_history.append(
             {
                 'Function': 'Complex fourier transform',
                 'real_only': real_only,
-                'inverse': inverse,
+                'inverse': False,
                 'negate_imaginaries': negate_imaginaries,
                 'sign_alteration': sign_alteration,
                 'bruk': bruk,
@@ -1170,13 +1839,15 @@ def fourier_transform(
 
     return transformed.view(type(data))
 
-# NMRPipe alias
-FT = fourier_transform
-FT.__doc__ = fourier_transform.__doc__  # Auto-generated
-FT.__name__ = "FT"  # Auto-generated
+# Combined ZF and FT
+ZFFT = zero_fill_fourier_transform
+ZFFT.__doc__ = zero_fill_fourier_transform.__doc__  # Auto-generated
+ZFFT.__name__ = "ZFFT"  # Auto-generated
 
 
 
+@_with_precision
+@_along_axis
 def hilbert_transform(
     data: NMRArrayType,
     *,
@@ -1193,6 +1864,7 @@ def hilbert_transform(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         mirror_image (bool): If True, use mirror image mode for HT (for P1=180 acquisitions).
         temporary_zero_fill (bool): If True, apply temporary zero filling for speed.
         size_time_domain (int, optional): Size of the time domain (half of original size for some data).
@@ -1201,6 +1873,7 @@ def hilbert_transform(
         ps90_180: Alias for mirror_image.
         zf: Alias for temporary_zero_fill.
         td: Alias for size_time_domain.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Hilbert transformed data.
@@ -1271,6 +1944,8 @@ HT.__name__ = "HT"  # Auto-generated
 
 
 
+@_with_precision
+@_along_axis
 def phase(
     data: NMRArrayType,
     *,
@@ -1281,6 +1956,8 @@ def phase(
     temporary_zero_fill: bool = False,
     exponential_correction: bool = False,
     decay_constant: float = 0.0,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     #right_shift_point_count: int = 0,
     #left_shift_point_count: int = 0,
     #sw: bool = False,
@@ -1299,6 +1976,7 @@ def phase(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         p0 (float): Zero-order phase correction in degrees (constant shift).
         p1 (float): First-order phase correction in degrees across the sweep width.
         invert (bool): If True, apply the negative of the phase correction (e.g., for undoing previous phase).
@@ -1306,6 +1984,10 @@ def phase(
         decay_constant (float): Decay constant for exponential correction (only used if exponential_correction=True).
         reconstruct_imaginaries (bool): If True and data is real-only, reconstruct imaginary parts using Hilbert transform.
         temporary_zero_fill (bool): If True, temporarily zero-fill to next power of 2 for better phase smoothness.
+        out (np.ndarray, optional): Complex array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Phase complex data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         inv: Alias for invert.
@@ -1313,6 +1995,7 @@ def phase(
         zf: Alias for temporary_zero_fill.
         exp: Alias for exponential_correction.
         tc: Alias for decay_constant.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after applying phase correction.
@@ -1331,42 +2014,43 @@ def phase(
     )
     
     
-    array = data.copy()
+    # The phased result is a new array unless out or inplace is given
+    array = data
+    target = _output_array(data, out, inplace)
+    if target is not None and not np.iscomplexobj(target):
+        raise ValueError("Phased data is complex, out (or the data with inplace=True) must be a complex array.")
 
     # Hilbert transform if requested
     if reconstruct_imaginaries:
         array = hilbert_transform(np.real(array))
-        
-        
-    original_shape = array.shape
-    
-    if temporary_zero_fill:
-        npoints = array.shape[-1]
-        next_pow2 = 2**int(np.ceil(np.log2(npoints)))
-        if next_pow2 > npoints:
-            array = zero_fill(array, final_size=next_pow2)
     
     npoints = array.shape[-1]
     x = np.arange(npoints)
+    
+    # Zero filling only stretches the ramp, the padded points are discarded after phasing
+    ramp_points = npoints
+    if temporary_zero_fill:
+        ramp_points = max(npoints, 2**int(np.ceil(np.log2(npoints))))
 
     if exponential_correction:
-        phase_array = np.deg2rad(p0 * np.exp(-decay_constant * x / npoints))
+        phase_array = np.deg2rad(p0 * np.exp(-decay_constant * x / ramp_points))
     else:
-        phase_array = np.deg2rad(p0 + p1*( x / npoints))
+        phase_array = np.deg2rad(p0 + p1*( x / ramp_points))
     
     if invert:
         phase_array = -phase_array
     
-    phase_correction = np.exp(1j * phase_array)
+    # Correction in the precision of the data, complex64 for single precision data
+    phase_correction = np.exp(1j * phase_array).astype(np.result_type(array.dtype, np.complex64), copy=False)
     
-    result = np.asarray(array) * phase_correction
-    
-    if temporary_zero_fill:
-        result = result[..., :original_shape[-1]]
+    if target is None:
+        result = np.asarray(array) * phase_correction
+    else:
+        result = np.multiply(np.asarray(array), phase_correction, out=target, casting='same_kind')
     
     
-    if isinstance(data, NMRData):
-        result = NMRData(result, copy_from=data)
+    result = _wrap_output(data, result, inplace)
+    if isinstance(result, NMRData):
         result.processing_history.append({
             'Function': "Phase Correction",
             'p0': p0,
@@ -1380,7 +2064,7 @@ def phase(
             'time_elapsed_str': _format_elapsed_time(perf_counter() - start_time),
         })
     
-    return result.view(type(data))
+    return result
 
 # NMRPipe alias
 PS = phase
@@ -1388,7 +2072,398 @@ PS.__doc__ = phase.__doc__  # Auto-generated
 PS.__name__ = "PS"  # Auto-generated
 
 
+# Grid spacing (degrees) of the coarse phase search, refinement starts at half of it
+_AUTO_PHASE_GRID_STEP = 30.0
+# Memory (bytes) for the work buffers of one block of spectra during the phase search
+_AUTO_PHASE_BLOCK_BYTES = 64 * 1024**2
+
+
+class _PhaseObjective:
+    """
+    Scores of trial phases (p0, p1) for a stack of spectra (nvec, npoints), lower is better.
+
+    The real and imaginary parts are normalized and stored once. A trial first builds the
+    first order rotation of every spectrum, a = Re(S e^{i p1 x}) and b = Im(S e^{i p1 x}),
+    and then the real part for any p0 as cos(p0) a - sin(p0) b, so trials that only change
+    p0 reuse the ramp. Everything is computed in preallocated buffers, a trial only
+    allocates the (nvec,) scores.
+    """
+    def __init__(self, spectra: np.ndarray, x: np.ndarray, objective: str, gamma: float, peak_width: int):
+        scale = np.abs(spectra).max(axis=-1, keepdims=True)
+        scale[scale == 0] = 1.0
+        self.real = np.ascontiguousarray(spectra.real / scale, dtype=np.float64)
+        self.imag = np.ascontiguousarray(spectra.imag / scale, dtype=np.float64)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.objective = objective
+        self.gamma = gamma
+        self.peak_width = max(1, peak_width)
+
+        shape = self.real.shape
+        # The ramp angles are small and smooth, single precision sin/cos is plenty and several times faster
+        self.x32 = self.x.astype(np.float32)
+        self.cos = np.empty(shape, dtype=np.float32)
+        self.sin = np.empty(shape, dtype=np.float32)
+        self.a = np.empty(shape)
+        self.b = np.empty(shape)
+        self.rotated = np.empty(shape)
+        self.scratch = np.empty(shape)
+        self.diff = np.empty(shape[:-1] + (max(shape[-1] - 1, 0),))
+        self.log = np.empty_like(self.diff)
+        self.total = np.empty(shape[:-1])
+        self.ramp_p1 = None
+
+    def ramp(self, p1: np.ndarray) -> None:
+        """First order rotation by p1 (degrees, one per spectrum) into a and b."""
+        if self.ramp_p1 is not None and np.array_equal(p1, self.ramp_p1):
+            return
+        np.multiply(np.deg2rad(p1).astype(np.float32)[:, None], self.x32, out=self.cos)
+        np.sin(self.cos, out=self.sin)
+        np.cos(self.cos, out=self.cos)
+
+        np.multiply(self.real, self.cos, out=self.a)
+        np.multiply(self.imag, self.sin, out=self.scratch)
+        self.a -= self.scratch
+        np.multiply(self.real, self.sin, out=self.b)
+        np.multiply(self.imag, self.cos, out=self.scratch)
+        self.b += self.scratch
+        self.ramp_p1 = np.array(p1, copy=True)
+
+    def rotate(self, p0: np.ndarray) -> None:
+        """Real part of the spectra with p0 (degrees, one per spectrum) on top of the current ramp, into rotated."""
+        p0 = np.deg2rad(p0)[:, None]
+        np.multiply(self.a, np.cos(p0), out=self.rotated)
+        np.multiply(self.b, np.sin(p0), out=self.scratch)
+        self.rotated -= self.scratch
+
+    def __call__(self, p0: np.ndarray, p1: np.ndarray) -> np.ndarray:
+        self.ramp(p1)
+        self.rotate(p0)
+        return self.score()
+
+    def score(self) -> np.ndarray:
+        if self.objective == "acme":
+            return self._acme()
+        return self._peak_minima()
+
+    def _acme(self) -> np.ndarray:
+        # Entropy of the normalized absolute first derivative
+        diff = self.diff
+        np.subtract(self.rotated[..., 1:], self.rotated[..., :-1], out=diff)
+        np.abs(diff, out=diff)
+        np.sum(diff, axis=-1, out=self.total)
+        np.maximum(self.total, np.finfo(np.float64).tiny, out=self.total)
+        diff /= self.total[:, None]
+        np.maximum(diff, np.finfo(np.float64).tiny, out=diff)
+        np.log(diff, out=self.log)
+        entropy = -np.einsum('ij,ij->i', diff, self.log)
+
+        # Penalty on negative intensities
+        np.minimum(self.rotated, 0.0, out=self.scratch)
+        penalty = np.einsum('ij,ij->i', self.scratch, self.scratch)
+        return entropy + self.gamma * penalty
+
+    def _peak_minima(self) -> np.ndarray:
+        # The minima on both sides of the largest peak should be equally deep
+        npoints = self.rotated.shape[-1]
+        peak = np.argmax(self.rotated, axis=-1)[:, None]
+        offsets = np.arange(1, self.peak_width + 1)
+        left = np.take_along_axis(self.rotated, np.clip(peak - offsets, 0, npoints - 1), axis=-1).min(axis=-1)
+        right = np.take_along_axis(self.rotated, np.clip(peak + offsets, 0, npoints - 1), axis=-1).min(axis=-1)
+        return np.abs(left - right)
+
+
+def _grid_phase_search(
+    objective: _PhaseObjective,
+    p0_values: np.ndarray,
+    p1_values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Best (p0, p1, score) of every spectrum on a grid, the ramp of each p1 is built once for all p0."""
+    nvec = objective.real.shape[0]
+    best_p0 = np.zeros(nvec)
+    best_p1 = np.zeros(nvec)
+    best_score = np.full(nvec, np.inf)
+
+    for p1 in p1_values:
+        objective.ramp(np.full(nvec, p1))
+        for p0 in p0_values:
+            objective.rotate(np.full(nvec, p0))
+            score = objective.score()
+            better = score < best_score
+            best_p0[better] = p0
+            best_p1[better] = p1
+            best_score[better] = score[better]
+
+    return best_p0, best_p1, best_score
+
+
+def _refine_phase_search(
+    objective: _PhaseObjective,
+    p0: np.ndarray,
+    p1: np.ndarray,
+    steps: list[float],
+    fit_p1: bool = True,
+    max_moves: int = 10,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pattern search around (p0, p1) for all spectra at once, with shrinking step sizes.
+
+    Every move evaluates the 3 x 3 neighbourhood (diagonals follow the valley along which
+    p0 and p1 compensate each other), building one ramp per p1 row. p1 stays fixed if not fit_p1.
+    """
+    nvec = len(p0)
+    for step in steps:
+        for _ in range(max_moves):
+            best_p0, best_p1 = p0, p1
+            best_score = np.full(nvec, np.inf)
+            for d1 in ((0.0, step, -step) if fit_p1 else (0.0,)):
+                objective.ramp(p1 + d1)
+                for d0 in (0.0, step, -step):
+                    objective.rotate(p0 + d0)
+                    score = objective.score()
+                    better = score < best_score
+                    best_p0 = np.where(better, p0 + d0, best_p0)
+                    best_p1 = np.where(better, p1 + d1, best_p1)
+                    best_score = np.where(better, score, best_score)
+
+            moved = (best_p0 != p0) | (best_p1 != p1)
+            p0, p1 = best_p0, best_p1
+            if not np.any(moved):
+                break
+
+    return p0, p1
+
+
+def _newton_phase_search(
+    objective: _PhaseObjective,
+    p0: np.ndarray,
+    p1: np.ndarray,
+    steps: list[float],
+    fit_p1: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Refine (p0, p1) close to the minimum, for all spectra at once.
+
+    For every step size the scores on the 3 x 3 stencil give the gradient and Hessian of a
+    quadratic model, its minimum is taken if it lies within the stencil and improves the
+    score, otherwise the best stencil point.
+    """
+    nvec = len(p0)
+    d1_values = (-1, 0, 1) if fit_p1 else (0,)
+    for step in steps:
+        scores = {}
+        for d1 in d1_values:
+            objective.ramp(p1 + d1 * step)
+            for d0 in (-1, 0, 1):
+                objective.rotate(p0 + d0 * step)
+                scores[d0, d1] = objective.score()
+
+        # Best stencil point
+        best_p0, best_p1, best_score = p0, p1, scores[0, 0]
+        for (d0, d1), score in scores.items():
+            better = score < best_score
+            best_p0 = np.where(better, p0 + d0 * step, best_p0)
+            best_p1 = np.where(better, p1 + d1 * step, best_p1)
+            best_score = np.where(better, score, best_score)
+
+        # Minimum of the quadratic model
+        g0 = (scores[1, 0] - scores[-1, 0]) / (2 * step)
+        h00 = (scores[1, 0] - 2 * scores[0, 0] + scores[-1, 0]) / step**2
+        if fit_p1:
+            g1 = (scores[0, 1] - scores[0, -1]) / (2 * step)
+            h11 = (scores[0, 1] - 2 * scores[0, 0] + scores[0, -1]) / step**2
+            h01 = (scores[1, 1] - scores[1, -1] - scores[-1, 1] + scores[-1, -1]) / (4 * step**2)
+            det = h00 * h11 - h01**2
+            valid = (h00 > 0) & (det > 0)
+            det = np.where(valid, det, 1.0)
+            delta0 = np.where(valid, -(h11 * g0 - h01 * g1) / det, 0.0)
+            delta1 = np.where(valid, -(h00 * g1 - h01 * g0) / det, 0.0)
+        else:
+            valid = h00 > 0
+            delta0 = np.where(valid, -g0 / np.where(valid, h00, 1.0), 0.0)
+            delta1 = np.zeros(nvec)
+        valid &= (np.abs(delta0) <= step) & (np.abs(delta1) <= step)
+
+        model_p0, model_p1 = p0 + delta0, p1 + delta1
+        model_score = objective(model_p0, model_p1)
+        use_model = valid & (model_score < best_score)
+
+        p0 = np.where(use_model, model_p0, best_p0)
+        p1 = np.where(use_model, model_p1, best_p1)
+
+    return p0, p1
+
+
+def _auto_phase_vectors(
+    spectra: np.ndarray,
+    *,
+    objective: str,
+    p1_range: tuple[float, float],
+    fit_p1: bool,
+    coarse_points: int,
+    tolerance: float,
+    gamma: float,
+    peak_width: int,
+) -> np.ndarray:
+    """Find (p0, p1) of every spectrum of a 2D block, returns an array (nvec, 2)."""
+    nvec, npoints = spectra.shape
+    phases = np.empty((nvec, 2))
+
+    factor = max(1, npoints // max(coarse_points, 1))
+    nblocks = npoints // factor
+    x_full = np.arange(npoints) / npoints
+    x_coarse = (np.arange(nblocks) * factor + (factor - 1) / 2) / npoints
+
+    p0_grid = np.arange(-180.0, 180.0, _AUTO_PHASE_GRID_STEP)
+    p1_grid = np.arange(p1_range[0], p1_range[1] + _AUTO_PHASE_GRID_STEP / 2, _AUTO_PHASE_GRID_STEP) if fit_p1 else np.zeros(1)
+
+    coarse_steps = []
+    step = _AUTO_PHASE_GRID_STEP / 2
+    while step >= 1.0:
+        coarse_steps.append(step)
+        step /= 2
+    fine_steps = []
+    while step >= tolerance:
+        fine_steps.append(step)
+        step /= 8
+
+    # Spectra per block so the work buffers of the full spectra stay within the budget
+    per_block = max(1, _AUTO_PHASE_BLOCK_BYTES // (8 * 8 * npoints))
+    for first in range(0, nvec, per_block):
+        block = spectra[first:first + per_block]
+
+        # Coarse search on the spectra averaged over blocks of points (keeps the phase of each block)
+        coarse = block[:, :nblocks * factor].reshape(len(block), nblocks, factor).mean(axis=-1)
+        coarse_objective = _PhaseObjective(coarse, x_coarse, objective, gamma, peak_width // factor)
+        p0, p1, _ = _grid_phase_search(coarse_objective, p0_grid, p1_grid)
+        p0, p1 = _refine_phase_search(coarse_objective, p0, p1, coarse_steps, fit_p1)
+        del coarse_objective
+
+        # Refinement on the full spectra
+        full_objective = _PhaseObjective(block, x_full, objective, gamma, peak_width)
+        p0, p1 = _newton_phase_search(full_objective, p0, p1, fine_steps, fit_p1)
+
+        # The peak minima do not tell absorption from inverted absorption, make the largest peak positive
+        if objective == "peak_minima":
+            full_objective(p0, p1)
+            rotated = full_objective.rotated
+            largest = np.take_along_axis(rotated, np.argmax(np.abs(rotated), axis=-1)[:, None], axis=-1)[:, 0]
+            p0 = np.where(largest < 0, p0 + 180.0, p0)
+        del full_objective
+
+        phases[first:first + per_block, 0] = (p0 + 180.0) % 360.0 - 180.0
+        phases[first:first + per_block, 1] = p1
+
+    return phases
+
+
+@_with_precision
+@_along_axis
+def auto_phase(
+    data: NMRArrayType,
+    *,
+    objective: str = "acme",
+    p1_range: tuple[float, float] = (-180.0, 180.0),
+    fit_p1: bool = True,
+    per_vector: bool = False,
+    coarse_points: int = 1024,
+    tolerance: float = 0.05,
+    gamma: float = 1000.0,
+    peak_width: int = 100,
+    n_jobs: int | None = None,
+) -> NMRArrayType:
+    """
+    Find and apply the zero- and first-order phase correction of the last dimension automatically.
+
+    The phases (p0, p1 as in phase) minimize one of the objectives:
+        "acme": entropy of the first derivative of the real spectrum plus a penalty on
+            negative intensities (Chen et al. 2002, DOI: https://doi.org/10.1016/S1090-7807(02)00069-1).
+        "peak_minima": difference between the minima on both sides of the largest peak.
+            This only determines the phase at the largest peak, use it with fit_p1=False.
+
+    The search runs a grid over p0 and p1 on a spectrum averaged down to about coarse_points
+    points, refines it there to about 1 degree and then refines on the full spectrum down to
+    the tolerance.
+
+    Args:
+        data (NMRData): Input data, complex spectra.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
+        objective (str, optional): "acme" or "peak_minima". Defaults to "acme".
+        p1_range (tuple[float, float], optional): Range (degrees) of the initial p1 grid. Defaults to (-180, 180).
+        fit_p1 (bool, optional): If False, only p0 is searched and p1 is 0. Defaults to True.
+        per_vector (bool, optional): If True, every vector is phased on its own (batch mode, e.g. many 1D spectra),
+            otherwise one (p0, p1) is found for the sum of all vectors and applied to all. Defaults to False.
+        coarse_points (int, optional): Approximate size of the averaged spectrum of the initial search. Defaults to 1024.
+        tolerance (float, optional): Final step size (degrees) of the refinement. Defaults to 0.05.
+        gamma (float, optional): Weight of the negative intensity penalty of "acme". Defaults to 1000.
+        peak_width (int, optional): Points on each side of the largest peak searched by "peak_minima". Defaults to 100.
+        n_jobs (int, optional): Number of threads sharing the vectors in batch mode, defaults to the global setting (see set_n_jobs).
+
+    Aliases:
+        dim: Alias for axis.
+
+    Returns:
+        NMRData: Phased data. p0 and p1 (arrays of data.shape[:-1] in batch mode) are in the processing history.
+    """
+    start_time = perf_counter()
+
+    if objective not in ("acme", "peak_minima"):
+        raise ValueError(f"Unknown objective '{objective}'. Must be 'acme' or 'peak_minima'.")
+    if not np.iscomplexobj(data):
+        raise ValueError("auto_phase requires complex data.")
+
+    array = np.asarray(data)
+    npoints = array.shape[-1]
+
+    search = functools.partial(
+        _auto_phase_vectors,
+        objective=objective,
+        p1_range=p1_range,
+        fit_p1=fit_p1,
+        coarse_points=coarse_points,
+        tolerance=tolerance,
+        gamma=gamma,
+        peak_width=peak_width,
+    )
+
+    if per_vector:
+        phases = map_vectors(search, array, n_jobs=n_jobs)
+        p0, p1 = phases[..., 0], phases[..., 1]
+        p0_ramp, p1_ramp = p0[..., None], p1[..., None]
+    else:
+        total = array.reshape(-1, npoints).sum(axis=0, dtype=np.complex128)
+        (p0, p1), = search(total[None, :])
+        p0_ramp, p1_ramp = p0, p1
+
+    # Same correction as phase(p0=p0, p1=p1), in the precision of the data
+    phase_array = np.deg2rad(p0_ramp + p1_ramp * (np.arange(npoints) / npoints))
+    phase_correction = np.exp(1j * phase_array).astype(array.dtype, copy=False)
+    result = array * phase_correction
+
+    if isinstance(data, NMRData):
+        result = NMRData(result, copy_from=data)
+        elapsed = perf_counter() - start_time
+        result.processing_history.append({
+            'Function': "Automatic Phase Correction",
+            'objective': objective,
+            'per_vector': per_vector,
+            'p0': p0.tolist() if per_vector else float(p0),
+            'p1': p1.tolist() if per_vector else float(p1),
+            'time_elapsed_s': elapsed,
+            'time_elapsed_str': _format_elapsed_time(elapsed),
+        })
+        return result
+
+    return result.view(type(data))
+
+# NMRPipe alias
+APK = auto_phase
+APK.__doc__ = auto_phase.__doc__  # Auto-generated
+APK.__name__ = "APK"  # Auto-generated
+
+
 
+@_with_precision
+@_along_axis
 def extract_region(
     data: NMRArrayType,
     *,
@@ -1420,6 +2495,7 @@ def extract_region(
 
     Args:
         data (NMRData): Input NMR dataset to extract from.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         start (str | int, optional): Starting point along the last dimension. Accepts index or unit string (e.g. "5.5 ppm", "1000 pts").
         end (str | int, optional): Ending point along the last dimension. Accepts index or unit string.
         start_y (str | int, optional): Starting vector along second-to-last dimension (for 2D data).
@@ -1438,6 +2514,7 @@ def extract_region(
         round: Alias for multiple_of.
         x1, xn: Aliases for start and end.
         y1, yn: Aliases for start_y and end_y.
+        dim: Alias for axis.
 
 
     Returns:
@@ -1509,13 +2586,18 @@ def extract_region(
     # Slice the data
     
     
+    # Leading dimensions of 3D/4D data are kept whole
+    if result.ndim > 1:
+        slicer = (slice(None),) * (result.ndim - 2) + (slice(start_y_idx, end_y_idx + 1), slice(start_idx, end_idx + 1))
+    else:
+        slicer = (slice(start_idx, end_idx + 1),)
+    
     if adjust_spectral_width:
-        slicer = (slice(start_y_idx, end_y_idx + 1), slice(start_idx, end_idx + 1)) if result.ndim > 1 else slice(start_idx, end_idx + 1)
         new_data = result[slicer]
     else:
         # Manual slicing on array level
         array = np.asarray(result)
-        sliced = array[start_y_idx:end_y_idx+1, start_idx:end_idx+1] if result.ndim > 1 else array[start_idx:end_idx+1]
+        sliced = array[slicer]
         
         new_data = NMRData(sliced, copy_from=result) if isinstance(result, NMRData) else sliced.copy()
 
@@ -1541,6 +2623,64 @@ EXT.__doc__ = extract_region.__doc__  # Auto-generated
 EXT.__name__ = "EXT"  # Auto-generated
 
 
+def _legendre_basis(x: np.ndarray, npoints: int, order: int) -> np.ndarray:
+    """Legendre polynomials up to order at the indices x, with the vector [0, npoints - 1] mapped onto [-1, 1]."""
+    t = 2.0 * np.asarray(x, dtype=np.float64) / max(npoints - 1, 1) - 1.0
+    return np.polynomial.legendre.legvander(t, order)
+
+
+def _weighted_polyfit(basis: np.ndarray, y: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted least squares coefficients of all vectors at once.
+    
+    Solves the normal equations (B^T W B) c = B^T W y for every vector, with the basis B
+    (npoints, ncoeffs) shared and the weights W (..., npoints) per vector.
+    Vectors with fewer nonzero weights than coefficients are not fitted, their coefficients are 0.
+    
+    Returns:
+        tuple: Coefficients (..., ncoeffs) and a mask (...) of the fitted vectors.
+    """
+    ncoeffs = basis.shape[-1]
+    fitted = np.count_nonzero(weights, axis=-1) >= ncoeffs
+    
+    # All Gram matrices in one product, outer products of the basis rows weighted per vector
+    outer = (basis[:, :, None] * basis[:, None, :]).reshape(basis.shape[0], -1)
+    gram = (weights @ outer).reshape(weights.shape[:-1] + (ncoeffs, ncoeffs))
+    rhs = (weights * y) @ basis
+    
+    gram[~fitted] = np.eye(ncoeffs)
+    rhs[~fitted] = 0.0
+    
+    return np.linalg.solve(gram, rhs[..., None])[..., 0], fitted
+
+
+def _pbc_time_vectors(
+    vectors: np.ndarray,
+    *,
+    basis: np.ndarray,
+    window_size: int,
+    min_baseline_pts: int,
+    baseline_threshold: float,
+) -> np.ndarray:
+    """Fit and subtract a polynomial baseline from the baseline points of a 2D block of vectors, all vectors at once."""
+    npoints = vectors.shape[-1]
+
+    # Points below the noise threshold, vectors with too few of them use the first and last window
+    baseline_mask = np.abs(vectors) < baseline_threshold
+    too_few = np.count_nonzero(baseline_mask, axis=-1) < min_baseline_pts
+    if np.any(too_few):
+        edge_mask = np.zeros(npoints, dtype=bool)
+        edge_mask[:window_size] = True
+        edge_mask[npoints - window_size:] = True
+        baseline_mask[too_few] = edge_mask
+
+    coeffs, _ = _weighted_polyfit(basis, vectors, baseline_mask.astype(np.float64))
+
+    # Vectors that could not be fitted have zero coefficients and are left as they are,
+    # the fit is done in double precision and the baseline subtracted in the precision of the data
+    return vectors - (coeffs @ basis.T).astype(vectors.dtype, copy=False)
+
+
 def _pbc_time(
     data: NMRArrayType,
     *,
@@ -1549,6 +2689,7 @@ def _pbc_time(
     min_baseline_fraction: float,
     noise_adjustment_factor: float,
     rms_noise_value: float,
+    n_jobs: int | None,
 ) -> NMRArrayType:
     start_time = perf_counter()
 
@@ -1557,31 +2698,27 @@ def _pbc_time(
     min_baseline_pts = int(min_baseline_fraction * npoints)
 
     if rms_noise_value == 0.0:
-        windows = [data[..., i:i + window_size] for i in range(0, npoints, window_size)]
-        noise_estimates = [np.std(w, axis=-1) for w in windows if w.shape[-1] == window_size]
-        if noise_estimates:
-            rms_noise_value = np.median(np.concatenate(noise_estimates), axis=-1)
+        # Standard deviation of all full windows of all vectors in one reduction over a reshaped view
+        n_windows = npoints // window_size
+        if n_windows > 0:
+            windows = data[..., :n_windows * window_size].reshape(data.shape[:-1] + (n_windows, window_size))
+            rms_noise_value = float(np.median(np.std(np.asarray(windows), axis=-1)))
 
     baseline_threshold = rms_noise_value * noise_adjustment_factor
 
-    def fit_and_subtract_time(vector: np.ndarray) -> np.ndarray:
-        baseline_mask = np.abs(vector) < baseline_threshold
-        baseline_indices = np.where(baseline_mask)[0]
-
-        if len(baseline_indices) < min_baseline_pts:
-            baseline_indices = np.concatenate((np.arange(window_size), np.arange(npoints - window_size, npoints)))
-            baseline_indices = np.unique(baseline_indices)
-
-        if len(baseline_indices) < order + 1:
-            return vector
-
-        x_fit = baseline_indices
-        y_fit = vector[x_fit]
-        coeffs = np.polyfit(x_fit, y_fit, order)
-        baseline = np.polyval(coeffs, np.arange(npoints))
-        return vector - baseline
+    corrected = map_vectors(
+        functools.partial(
+            _pbc_time_vectors,
+            basis=_legendre_basis(np.arange(npoints), npoints, order),
+            window_size=window_size,
+            min_baseline_pts=min_baseline_pts,
+            baseline_threshold=baseline_threshold,
+        ),
+        data,
+        n_jobs=n_jobs,
+    )
 
-    corrected_data = np.apply_along_axis(fit_and_subtract_time, axis=-1, arr=data)
+    corrected_data = NMRData(corrected, copy_from=data) if isinstance(data, NMRData) else corrected.view(type(data))
 
     if isinstance(corrected_data, NMRData):
         elapsed = perf_counter() - start_time
@@ -1600,6 +2737,40 @@ def _pbc_time(
     return cast(NMRArrayType, corrected_data)
 
 
+def _node_average_matrix(groups: list[np.ndarray], npoints: int, sine_filter: bool) -> np.ndarray:
+    """Matrix (n_nodes, npoints) averaging the points of each node, with sine shaped weights if sine_filter."""
+    average = np.zeros((len(groups), npoints))
+    for i, group in enumerate(groups):
+        weights = np.sin(np.pi * np.arange(1, len(group) + 1) / (len(group) + 1)) if sine_filter else np.ones(len(group))
+        average[i, group] = weights / weights.sum()
+    return average
+
+
+def _pbc_freq_vectors(
+    vectors: np.ndarray,
+    *,
+    fit_points: np.ndarray,
+    fit_basis: np.ndarray,
+    node_average: np.ndarray | None,
+    sub_start_idx: int,
+    sub_basis: np.ndarray,
+) -> np.ndarray:
+    """Fit a polynomial to the fit points below the threshold and subtract it in the subtraction region, for a 2D block of vectors."""
+    y_fit = vectors[:, fit_points] if node_average is None else vectors @ node_average.T
+    
+    # Points above median + std are treated as signal
+    real_fit = y_fit.real
+    threshold = np.median(real_fit, axis=-1, keepdims=True) + np.std(real_fit, axis=-1, keepdims=True)
+    weights = (real_fit < threshold).astype(np.float64)
+    
+    coeffs, _ = _weighted_polyfit(fit_basis, y_fit, weights)
+    baseline = coeffs @ sub_basis.T
+    
+    corrected = vectors.copy()
+    corrected[:, sub_start_idx:sub_start_idx + sub_basis.shape[0]] -= baseline.astype(vectors.dtype, copy=False)
+    return corrected
+
+
 def _pbc_freq(
     data: NMRArrayType,
     *,
@@ -1610,28 +2781,20 @@ def _pbc_freq(
     node_list: list[str | int | None] | None,
     node_width: int,
     order: int,
+    initial_fit_nodes: int,
     use_first_points: bool,
     use_last_points: bool,
     use_node_avg: bool,
     sine_filter: bool,
+    n_jobs: int | None,
 ) -> NMRArrayType:
     start_time = perf_counter()
 
-    result = data.copy()
-    npoints = result.shape[-1]
-
-    node_groups = []
-    if node_list is not None:
-        resolved_nodes = [_convert_to_index(result, n, npoints, default=-1) for n in node_list or []]
-        for center in resolved_nodes:
-            if center == -1: continue
-            
-            node_group_start = max(0, center - node_width)
-            node_group_end = min(npoints, center + node_width + 1)
-            node_group = list(range(node_group_start, node_group_end))
-            node_groups.extend(node_group)
+    if sine_filter and not use_node_avg:
+        raise ValueError("sine_filter applies to averaged node values and requires use_node_avg=True.")
 
-    node_groups = sorted(set(node_groups))
+    result = data
+    npoints = result.shape[-1]
 
     sub_start_idx = _convert_to_index(result, sub_start, npoints, default=0)
     if sub_start_idx is None: sub_start_idx = 0
@@ -1642,42 +2805,56 @@ def _pbc_freq(
     if fit_start_idx is None: fit_start_idx = 0
     fit_end_idx = _convert_to_index(result, fit_end, npoints, default=npoints - 1)
     if fit_end_idx is None: fit_end_idx = npoints - 1
-    
-
-    def poly_model(x, *coeffs):
-        order = len(coeffs) - 1
-        y = np.zeros_like(x, dtype=np.float64)
-        for i, c in enumerate(coeffs):
-            y += c * x ** (order - i)
-        return y
 
-    def fit_and_subtract_freq(vector: np.ndarray) -> np.ndarray:
-        if node_groups:
-            x_fit = np.array(node_groups)
-            y_fit = vector[node_groups]
-        else:
-            x_fit = np.arange(fit_start_idx, fit_end_idx + 1)
-            y_fit = vector[fit_start_idx:fit_end_idx + 1]
-
-        threshold = float(np.median(y_fit) + 1 * np.std(y_fit))
-        mask = y_fit < threshold
-
-        x_fit_masked = x_fit[mask]
-        y_fit_masked = y_fit[mask]
-
-        if len(x_fit_masked) < order + 1:
-            return vector
+    # Node centers, from the node list or evenly spread over the fit region
+    centers = []
+    if node_list is not None:
+        nodes = [n for n in node_list if n is not None]
+        centers = (
+            convert_to_indices(result, nodes, npoints=npoints).tolist()
+            if isinstance(result, NMRData) and nodes else []
+        )
+    if not centers and initial_fit_nodes > 0:
+        centers = np.linspace(fit_start_idx, fit_end_idx, initial_fit_nodes).round().astype(int).tolist()
 
-        x_subtract = np.arange(sub_start_idx, sub_end_idx + 1).astype(np.float64)
-        p0 = np.ones(order + 1)
-        coeffs, _ = curve_fit(poly_model, x_fit_masked, y_fit_masked, p0=p0)
-        baseline = poly_model(x_subtract, *coeffs)
+    def node_group(center: int) -> np.ndarray:
+        return np.arange(max(0, center - node_width), min(npoints, center + node_width + 1))
 
-        corrected = vector.copy()
-        corrected[sub_start_idx:sub_end_idx + 1] -= baseline
-        return corrected
+    if centers:
+        groups = [node_group(center) for center in centers]
+    else:
+        # Every point of the fit region is a node of its own
+        groups = [np.array([i]) for i in range(fit_start_idx, fit_end_idx + 1)]
+    if use_first_points:
+        groups.append(node_group(0))
+    if use_last_points:
+        groups.append(node_group(npoints - 1))
+
+    if use_node_avg:
+        node_average = _node_average_matrix(groups, npoints, sine_filter)
+        fit_points = np.array([group.mean() for group in groups])
+    else:
+        node_average = None
+        fit_points = np.unique(np.concatenate(groups))
+
+    # Orthogonal (Legendre) basis at the fit points and in the subtraction region, shared by all vectors
+    fit_basis = _legendre_basis(fit_points, npoints, order)
+    sub_basis = _legendre_basis(np.arange(sub_start_idx, sub_end_idx + 1), npoints, order)
+
+    corrected = map_vectors(
+        functools.partial(
+            _pbc_freq_vectors,
+            fit_points=fit_points.astype(np.intp),
+            fit_basis=fit_basis,
+            node_average=node_average,
+            sub_start_idx=sub_start_idx,
+            sub_basis=sub_basis,
+        ),
+        data,
+        n_jobs=n_jobs,
+    )
 
-    corrected_data = np.apply_along_axis(fit_and_subtract_freq, axis=-1, arr=data)
+    corrected_data = NMRData(corrected, copy_from=data) if isinstance(data, NMRData) else corrected.view(type(data))
 
     if isinstance(corrected_data, NMRData):
         elapsed = perf_counter() - start_time
@@ -1690,11 +2867,12 @@ def _pbc_freq(
             'order': order,
             'node_list': node_list,
             'node_width': node_width,
+            'initial_fit_nodes': initial_fit_nodes,
             'use_first_points': use_first_points,
             'use_last_points': use_last_points,
             'use_node_avg': use_node_avg,
             'sine_filter': sine_filter,
-            'n_nodes': len(node_groups),
+            'n_nodes': len(fit_points),
             'time_elapsed_s': elapsed,
             'time_elapsed_str': _format_elapsed_time(elapsed),
         })
@@ -1702,6 +2880,8 @@ def _pbc_freq(
     return cast(NMRArrayType, corrected_data)
 
 
+@_with_precision
+@_along_axis
 def polynomial_baseline_correction(
     data: NMRArrayType,
     *,
@@ -1725,6 +2905,7 @@ def polynomial_baseline_correction(
     min_baseline_fraction: float = 0.33,
     noise_adjustment_factor: float = 1.5,
     rms_noise_value: float = 0.0,
+    n_jobs: int | None = None,
     
     # Aliases
     sx1: int | None = None,
@@ -1755,6 +2936,7 @@ def polynomial_baseline_correction(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         sub_start (int): Start index for baseline subtraction region. Defaults to 0.
         sub_end (int): End index for baseline subtraction region. Defaults to the last index.
         fit_start (int): Start index for baseline fitting region. Defaults to 0.
@@ -1764,9 +2946,9 @@ def polynomial_baseline_correction(
         node_list (list[int], optional): List of node center indices for fitting. If not specified, automatic node selection may be applied.
         node_width (int): Number of points to include on each side of each node center for fitting. Defaults to 1.
         order (int): Polynomial order for baseline fitting. Defaults to 4.
-        initial_fit_nodes (int): Number of initial nodes to include in the fit. If 0, no initial nodes are used.
-        use_first_points (bool): If True, include the first few points as nodes for baseline fitting. Defaults to False.
-        use_last_points (bool): If True, include the last few points as nodes for baseline fitting. Defaults to False.
+        initial_fit_nodes (int): Without a node list, number of nodes spread evenly over the fit region. If 0, every point of the fit region is used.
+        use_first_points (bool): If True, include a node of node_width around the first point. Defaults to False.
+        use_last_points (bool): If True, include a node of node_width around the last point. Defaults to False.
         use_node_avg (bool): If True, use average values within nodes instead of individual points for fitting. Defaults to False.
         sine_filter (bool): If True, apply a sine filter to the node data. Requires `use_node_avg` to be True. Defaults to False.
         
@@ -1775,6 +2957,7 @@ def polynomial_baseline_correction(
         min_baseline_fraction (float): Minimum fraction of data to consider as baseline. Only applicable in the "time" domain.
         noise_adjustment_factor (float): Adjustment factor for noise thresholding. Only applicable in the "time" domain.
         rms_noise_value (float): Pre-computed RMS noise value. Only applicable in the "time" domain.
+        n_jobs (int, optional): Number of threads fitting the vectors, defaults to the global setting (see set_n_jobs).
 
     Aliases:
         sx1: Alias for `sub_start`.
@@ -1796,19 +2979,12 @@ def polynomial_baseline_correction(
         frac: Alias for `min_baseline_fraction`.
         nf: Alias for `noise_adjustment_factor`.
         noise: Alias for `rms_noise_value`.
+        dim: Alias for axis.
     
     
-    Unimplemented/Unused Arguments:
-        - initial_fit_nodes
-        - use_first_points
-        - use_last_points
-        - use_node_avg
-        - sine_filter
-
     Returns:
         NMRData: Data after applying polynomial baseline correction.
     """
-    # TO DO: Implement missing arguments
     start_time = perf_counter()
     
     # Switch domain
@@ -1833,6 +3009,7 @@ def polynomial_baseline_correction(
             min_baseline_fraction=min_baseline_fraction,
             noise_adjustment_factor=noise_adjustment_factor,
             rms_noise_value=rms_noise_value,
+            n_jobs=n_jobs,
         )
     
     elif domain == "frequency":
@@ -1879,10 +3056,12 @@ def polynomial_baseline_correction(
             node_list=node_list,
             node_width=node_width,
             order=order,
+            initial_fit_nodes=initial_fit_nodes,
             use_first_points=use_first_points,
             use_last_points=use_last_points,
             use_node_avg=use_node_avg,
             sine_filter=sine_filter,
+            n_jobs=n_jobs,
         )
         
     else:
@@ -1897,6 +3076,61 @@ POLY.__name__ = "POLY"  # Auto-generated
 
 
 
+# Bytes of input (and output) moved per tile of the hypercomplex transpose, source and target tile stay in L1 cache
+_TRANSPOSE_TILE_BYTES = 16 * 1024
+
+
+def _hypercomplex_transpose(array: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Swap a dimension of interleaved real/imaginary vectors (States) with the last dimension.
+
+    Point j of the interleaved dimension is stored as the vectors 2j (real) and 2j + 1
+    (imaginary), point k of the last dimension as a complex number. Both become float
+    dimensions of size 2, so the transpose is a permutation of
+    data[..., j, a, ..., k, b] -> result[..., k, b, ..., j, a]:
+    the old last dimension comes out interleaved (2k real part, 2k + 1 imaginary part)
+    and the old interleaved dimension complex. Real data (b = 0 only) gives a last
+    dimension that is complex and no interleaved dimension.
+
+    The permutation is copied in square tiles of (k, j) that fit in cache, written
+    straight into the output array.
+    """
+    shape = array.shape
+    n_axis, n_last = shape[axis] // 2, shape[-1]
+    middle = shape[axis + 1:-1]
+    complex_last = np.iscomplexobj(array)
+    real_dtype = np.empty(0, dtype=array.dtype).real.dtype
+    width = 2 if complex_last else 1
+
+    source = np.ascontiguousarray(array)
+    if complex_last:
+        source = source.view(real_dtype)
+    source = source.reshape(shape[:axis] + (n_axis, 2) + middle + (n_last, width))
+
+    result = np.empty(shape[:axis] + (n_last * width,) + middle + (n_axis,), dtype=np.result_type(real_dtype, np.complex64))
+    target = result.view(real_dtype).reshape(shape[:axis] + (n_last, width) + middle + (n_axis, 2))
+
+    # Axis order of source as seen from target: (j, a) and (k, b) swap places
+    ndim = source.ndim
+    order = list(range(ndim))
+    order[axis], order[axis + 1], order[ndim - 2], order[ndim - 1] = ndim - 2, ndim - 1, axis, axis + 1
+    permuted = source.transpose(order)
+
+    pair_bytes = 2 * width * real_dtype.itemsize * int(np.prod(middle, dtype=np.int64))
+    # Power of two tile sides keep the tile rows aligned
+    block = 2 ** max(3, int(np.log2(np.sqrt(_TRANSPOSE_TILE_BYTES / max(pair_bytes, 1)))))
+
+    for lead in np.ndindex(shape[:axis]):
+        lead_target, lead_permuted = target[lead], permuted[lead]
+        for k in range(0, n_last, block):
+            for j in range(0, n_axis, block):
+                tile = (slice(k, k + block), Ellipsis, slice(j, j + block), slice(None))
+                lead_target[tile] = lead_permuted[tile]
+
+    return result
+
+
+@_with_precision
 def transpose(
     data: NMRArrayType,
     *,
@@ -1908,10 +3142,18 @@ def transpose(
     """
     Transpose the data and reorder metadata accordingly.
 
+    A hypercomplex transpose swaps the last dimension with a dimension marked as
+    interleaved (States, real and imaginary vectors alternating, see the axis key
+    'interleaved_data'). The imaginary parts of both dimensions are kept: the old last
+    dimension becomes interleaved and the old interleaved dimension complex. The result is
+    written contiguously. A regular transpose is a view, and an interleaved dimension
+    that becomes last is converted to complex from the real parts only.
+
     Args:
         data (NMRData): The data to transpose.
         axes (list[int], optional): New axis order. If None, reverse axes.
         hyper_complex (bool, optional): Flag to perform hyper complex transpose.
+            axes must then swap the last dimension with an interleaved one.
         
     Aliases:
         hyper: Alias for hyper_complex.
@@ -1927,15 +3169,26 @@ def transpose(
         },
         locals()
     )
-    
-    if hyper_complex:
-        raise NotImplementedError("Hyper complex transpose is not yet implemented.")
+    hyper_complex = hyper_complex or hyper
     
     ndim = data.ndim
     if axes is None:
         axes = list(reversed(range(ndim)))
+    axes = [int(axis) % ndim for axis in axes]
     
-    result = data.transpose(*axes)
+    if hyper_complex:
+        swapped = [i for i, axis in enumerate(axes) if axis != i]
+        if len(swapped) != 2 or swapped[1] != ndim - 1:
+            raise ValueError(f"A hypercomplex transpose must swap the last dimension with one other dimension, got axes {axes}.")
+        hyper_axis = swapped[0]
+        if data.shape[hyper_axis] % 2 != 0:
+            raise ValueError(f"Dimension {hyper_axis} has an odd size ({data.shape[hyper_axis]}) and cannot hold interleaved real/imaginary vectors.")
+        if isinstance(data, NMRData) and not data.axes[hyper_axis].get("interleaved_data", False):
+            raise ValueError(f"Dimension {hyper_axis} is not interleaved (axis key 'interleaved_data'), use a regular transpose.")
+        
+        result = _hypercomplex_transpose(np.asarray(data), hyper_axis)
+    else:
+        result = data.transpose(*axes)
 
         
 
@@ -1945,8 +3198,18 @@ def transpose(
         # Reorder axes metadata
         new_result.axes = [copy.deepcopy(data.axes[i]) for i in axes]
 
+        if hyper_complex:
+            last_axis, moved_axis = new_result.axes[-1], new_result.axes[hyper_axis]
+            last_axis["interleaved_data"] = False
+            last_axis["acqu_mode"] = "Complex"
+            if last_axis.get("unit") in ("pts", None, "points"):
+                last_axis["scale"] = LinearScale.points(new_result.shape[-1])
+            moved_axis["interleaved_data"] = np.iscomplexobj(data)
+            if moved_axis.get("unit") in ("pts", None, "points"):
+                moved_axis["scale"] = LinearScale.points(new_result.shape[hyper_axis])
+
         # Update 'interleaved_data' handling if present
-        if new_result.axes[-1].get("interleaved_data", False):
+        elif new_result.axes[-1].get("interleaved_data", False):
             new_result = _interleaved_to_complex(new_result)
             new_result.axes[-1]["interleaved_data"] = False
 
@@ -1955,6 +3218,7 @@ def transpose(
         new_result.processing_history.append({
             'Function': "Transpose",
             'axes': list(axes),
+            'hyper_complex': hyper_complex,
             'shape_before': data.shape,
             'shape_after': new_result.shape,
             'time_elapsed_s': elapsed,
@@ -1975,6 +3239,8 @@ ZTP.__doc__ = transpose.__doc__  # Auto-generated
 ZTP.__name__ = "ZTP"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def add_constant(
     data: NMRArrayType,
     *,
@@ -1983,6 +3249,8 @@ def add_constant(
     constant: float | None = None,
     constant_real: float | None = None,
     constant_imaginary: float | None = None,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Alias
     r: float | None = None,
     i: float | None = None,
@@ -1995,11 +3263,16 @@ def add_constant(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         start (str or int, optional): Start point or coordinate ("5.5 ppm", "1234 pts", etc.).
         end (str or int, optional): End point or coordinate.
         constant (float): Real value to add to both real and imaginary parts of data.
         constant_real (float): Real value to add to real part only.
         constant_imaginary (float): Real value to add to imaginary part only.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Add the constants to data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         r: Alias for constant_real.
@@ -2007,6 +3280,7 @@ def add_constant(
         c: Alias for constant.
         x1: Alias for start.
         xn: Alias for end.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Adjusted data.
@@ -2034,7 +3308,7 @@ def add_constant(
         raise ValueError("At least one of 'constant', 'constant_real', or 'constant_imaginary' must be specified.")
     
     
-    array = data.copy()
+    array = _work_array(data, out, inplace)
 
     npoints = array.shape[-1]
     
@@ -2073,9 +3347,8 @@ def add_constant(
             array[..., start_idx:end_idx+1] += constant
 
 
-    if isinstance(data, NMRData):
-        result = NMRData(array, copy_from=data)
-
+    result = _wrap_output(data, array, inplace)
+    if isinstance(result, NMRData):
         elapsed = perf_counter() - start_time
         result.processing_history.append(
             {
@@ -2089,10 +3362,8 @@ def add_constant(
                 'time_elapsed_str': _format_elapsed_time(elapsed),
             }
         )
-        
-        return cast(NMRArrayType, result)
 
-    return cast(NMRArrayType, array)
+    return cast(NMRArrayType, result)
 
 # NMRPipe alias
 ADD = add_constant
@@ -2100,6 +3371,8 @@ ADD.__doc__ = add_constant.__doc__  # Auto-generated
 ADD.__name__ = "ADD"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def multiply_constant(
     data: NMRArrayType,
     *,
@@ -2108,6 +3381,8 @@ def multiply_constant(
     constant: float | None = None,
     constant_real: float | None = None,
     constant_imaginary: float | None = None,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Alias
     r: float | None = None,
     i: float | None = None,
@@ -2120,11 +3395,16 @@ def multiply_constant(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         start (str or int, optional): Start point or coordinate ("5.5 ppm", "1234 pts", etc.).
         end (str or int, optional): End point or coordinate.
         constant (float): Real value to multiply both real and imaginary parts of data.
         constant_real (float): Real value to multiply real part only.
         constant_imaginary (float): Real value to multiply imaginary part only.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Multiply data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         r: Alias for constant_real.
@@ -2132,6 +3412,7 @@ def multiply_constant(
         c: Alias for constant.
         x1: Alias for start.
         xn: Alias for end.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Adjusted data.
@@ -2161,7 +3442,7 @@ def multiply_constant(
         raise ValueError("At least one of 'constant', 'constant_real', or 'constant_imaginary' must be specified.")
     
     
-    array = data.copy()
+    array = _work_array(data, out, inplace)
 
     npoints = array.shape[-1]
     
@@ -2199,9 +3480,8 @@ def multiply_constant(
         elif constant is not None:
             array[..., start_idx:end_idx+1] *= constant
 
-    if isinstance(data, NMRData):
-        result = NMRData(array, copy_from=data)
-
+    result = _wrap_output(data, array, inplace)
+    if isinstance(result, NMRData):
         elapsed = perf_counter() - start_time
         result.processing_history.append(
             {
@@ -2216,7 +3496,7 @@ def multiply_constant(
             }
         )
 
-    return cast(NMRArrayType, array)
+    return cast(NMRArrayType, result)
 
 # NMRPipe alias
 MULT = multiply_constant
@@ -2224,6 +3504,8 @@ MULT.__doc__ = multiply_constant.__doc__  # Auto-generated
 MULT.__name__ = "MULT"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def set_to_constant(
     data: NMRArrayType,
     *,
@@ -2232,6 +3514,8 @@ def set_to_constant(
     constant: float = 0.0,
     constant_real: float = 0.0,
     constant_imaginary: float = 0.0,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Alias
     r: float | None = None,
     i: float | None = None,
@@ -2244,11 +3528,16 @@ def set_to_constant(
 
     Args:
         data (NMRData): Input data.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         start (str or int, optional): Start point or coordinate ("5.5 ppm", "1234 pts", etc.).
         end (str or int, optional): End point or coordinate.
         constant (float): Real value to set (applies to real part if complex).
         constant_real (float): Real part to set (for complex data).
         constant_imaginary (float): Imaginary part to set (for complex data).
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Set the range of data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         r: Alias for constant_real.
@@ -2256,6 +3545,7 @@ def set_to_constant(
         c: Alias for constant.
         x1: Alias for start.
         xn: Alias for end.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Adjusted data.
@@ -2282,7 +3572,7 @@ def set_to_constant(
     ):
         raise ValueError("At least one of 'constant', 'constant_real', or 'constant_imaginary' must be specified.")
     
-    array = data.copy()
+    array = _work_array(data, out, inplace)
     npoints = array.shape[-1]
 
     # Determine start and end indices
@@ -2316,9 +3606,8 @@ def set_to_constant(
             array[..., start_idx:end_idx+1] = constant
 
 
-    if isinstance(data, NMRData):
-        result = NMRData(array, copy_from=data)
-
+    result = _wrap_output(data, array, inplace)
+    if isinstance(result, NMRData):
         elapsed = perf_counter() - start_time
         result.processing_history.append(
             {
@@ -2332,10 +3621,8 @@ def set_to_constant(
                 'time_elapsed_str': _format_elapsed_time(elapsed),
             }
         )
-        
-        return cast(NMRArrayType, result)
 
-    return cast(NMRArrayType, array)
+    return cast(NMRArrayType, result)
 
 # NMRPipe alias
 SET = set_to_constant
@@ -2343,12 +3630,22 @@ SET.__doc__ = set_to_constant.__doc__  # Auto-generated
 SET.__name__ = "SET"  # Auto-generated
 
 
-def delete_imaginaries(data: NMRArrayType) -> NMRArrayType:
+@_with_precision
+def delete_imaginaries(
+    data: NMRArrayType,
+    *,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
+) -> NMRArrayType:
     """
     Discard the imaginary part of complex-valued NMRData.
 
     Args:
         data (NMRData): Complex NMRData.
+        out (np.ndarray, optional): Real array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Return the real part as a (strided) view of the memory of data
+            instead of a copy. Defaults to False.
 
     Returns:
         NMRData: Real-valued data.
@@ -2356,7 +3653,17 @@ def delete_imaginaries(data: NMRArrayType) -> NMRArrayType:
     start_time = perf_counter()
 
     # Take the real part only
-    real_data = np.real(data).copy()
+    if inplace:
+        if out is not None:
+            raise ValueError("Give either out or inplace=True, not both.")
+        real_data = np.real(np.asarray(data))
+    elif out is not None:
+        if out.shape != data.shape:
+            raise ValueError(f"out has shape {out.shape}, expected the shape of the data {data.shape}.")
+        real_data = np.asarray(out)
+        np.copyto(real_data, np.real(np.asarray(data)), casting='same_kind')
+    else:
+        real_data = np.real(data).copy()
 
     # Create new NMRData object with real data and preserved metadata
     if isinstance(data, NMRData):
@@ -2382,6 +3689,7 @@ DI.__doc__ = delete_imaginaries.__doc__  # Auto-generated
 DI.__name__ = "DI"  # Auto-generated
 
 
+@_with_precision
 def null(data: NMRArrayType) -> NMRArrayType:
     """
     Leave data unchanged.
@@ -2414,10 +3722,14 @@ NULL.__doc__ = null.__doc__  # Auto-generated
 NULL.__name__ = "NULL"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def reverse(
     data: NMRArrayType,
     *,
     adjust_spectral_width: bool = True,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Aliases
     sw: bool | None = None,
 ) -> NMRArrayType:
@@ -2426,10 +3738,16 @@ def reverse(
 
     Args:
         data (NMRData): Input NMR dataset to reverse.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         adjust_spectral_width (bool): If True, adjust SW, ORI, and OBS metadata after reversing.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Reverse data in place and return it, with the step added
+            to its processing history. Defaults to False.
         
     Aliases:
         sw: Alias for adjust_spectral_width.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Reversed NMRdata, optionally with updated spectral calibration.
@@ -2445,16 +3763,29 @@ def reverse(
     )
     
     
-    if adjust_spectral_width:
-        result = data[..., ::-1]
+    # Reversed view, slicing NMRData also reverses the scale and calibration of the axis
+    reversed_view = data[..., ::-1]
+    metadata_source = reversed_view if adjust_spectral_width else data
+    
+    target = _output_array(data, out, inplace)
+    if target is None:
+        if adjust_spectral_width or not isinstance(data, NMRData):
+            result = reversed_view
+        else:
+            result = NMRData(reversed_view, copy_from=data)
     
     else:
-        reversed_array = data[..., ::-1]
+        if _same_memory(target, np.asarray(data)):
+            _rows_in_place(target, lambda block: block[..., ::-1])
+        else:
+            np.copyto(target, np.asarray(reversed_view), casting='same_kind')
         
-        if isinstance(data, NMRData):
-            result = NMRData(reversed_array, copy_from=data)
+        if inplace:
+            if isinstance(data, NMRData):
+                data._share_metadata(metadata_source._get_metadata())
+            result = data
         else:
-            result = reversed_array
+            result = _wrap_output(metadata_source, target, inplace=False)
 
 
     if isinstance(result, NMRData):
@@ -2474,6 +3805,8 @@ REV.__doc__ = reverse.__doc__  # Auto-generated
 REV.__name__ = "REV"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def right_shift(
     data: NMRArrayType,
     *,
@@ -2488,12 +3821,14 @@ def right_shift(
 
     Args:
         data (NMRData): Input NMR dataset.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         shift_amount (int | str): Amount to shift (e.g. 10, "3 ppm", "1000 pts", "10%").
         adjust_spectral_width (bool): If True, adjust SW, ORI, and OBS metadata after shifting.
         
     Aliases:
         rs: Alias for shift_amount.
         sw: Alias for adjust_spectral_width.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after applying right shift and zero padding.
@@ -2540,13 +3875,13 @@ def right_shift(
             if unit == "pts":
                 new_ori = ori - (point_shift * shift_points)
             else:
-                ppm_scale = get_ppm_scale(npoints, sw, ori, obs)
-                new_ppm_scale = np.roll(ppm_scale, shift_points)
+                ppm_scale = LinearScale.ppm(npoints, sw, ori, obs)
+                new_ppm_scale = ppm_scale.roll(shift_points)
                 new_ori = obs * new_ppm_scale[0]
 
             axis = data.axes[dim].copy()
             axis["ORI"] = new_ori
-            axis["scale"] = np.roll(axis["scale"], shift_points)
+            axis["scale"] = roll_scale(axis["scale"], shift_points)
             result.axes[dim] = axis
 
         result.processing_history.append({
@@ -2567,6 +3902,8 @@ RS.__doc__ = right_shift.__doc__  # Auto-generated
 RS.__name__ = "RS"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def left_shift(
     data: NMRArrayType,
     *,
@@ -2581,12 +3918,14 @@ def left_shift(
 
     Args:
         data (NMRData): Input NMR dataset.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         shift_amount (int | str): Amount to shift (e.g. 10, "3 ppm", "1000 pts", "10%").
         adjust_spectral_width (bool): If True, adjust SW, ORI, and OBS metadata after shifting.
         
     Aliases:
         ls: Alias for shift_amount.
         sw: Alias for adjust_spectral_width.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after applying right shift and zero padding.
@@ -2628,6 +3967,8 @@ LS.__doc__ = left_shift.__doc__  # Auto-generated
 LS.__name__ = "LS"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def circular_shift(
     data: NMRArrayType,
     *,
@@ -2635,6 +3976,8 @@ def circular_shift(
     left_shift_amount:  str | int = 0,
     negate_shifted: bool = False,
     adjust_spectral_width: bool = True,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Aliases
     rs:  str | int | None = None,
     ls:  str | int | None = None,
@@ -2646,16 +3989,22 @@ def circular_shift(
 
     Args:
         data (NMRData): Input NMR dataset.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         right_shift_amount (int | str): Shift right by this amount (e.g., 100, "5 ppm").
         left_shift_amount (int | str): Shift left by this amount.
         negate_shifted (bool): If True, negate the shifted data.
         adjust_spectral_width (bool): If True, adjust SW, ORI, and OBS metadata after shifting.
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Shift data in place and return it, with the step added
+            to its processing history. Defaults to False.
 
     Aliases:
         rs: Alias for right_shift_amount.
         ls: Alias for left_shift_amount.
         neg: Alias for negate_shifted.
         sw: Alias for adjust_spectral_width.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after applying circular shift.
@@ -2684,7 +4033,17 @@ def circular_shift(
     shift_points = shift_points % npoints
     
     
-    shifted_array = np.roll(data, shift_points, axis=dim)
+    target = _output_array(data, out, inplace)
+    if target is None:
+        shifted_array = np.roll(np.asarray(data), shift_points, axis=dim)
+    elif _same_memory(target, np.asarray(data)):
+        shifted_array = target
+        _rows_in_place(shifted_array, lambda block: np.roll(block, shift_points, axis=dim))
+    else:
+        # The two wrapped parts are copied straight into out
+        shifted_array = target
+        np.copyto(shifted_array[..., shift_points:], np.asarray(data)[..., :npoints - shift_points], casting='same_kind')
+        np.copyto(shifted_array[..., :shift_points], np.asarray(data)[..., npoints - shift_points:], casting='same_kind')
     
     if negate_shifted and shift_points > 0:
         slicer = [slice(None)] * data.ndim
@@ -2692,7 +4051,7 @@ def circular_shift(
         shifted_array[tuple(slicer)] *= -1
     
     if isinstance(data, NMRData):
-        new_data = NMRData(shifted_array, copy_from=data)
+        new_data = _wrap_output(data, shifted_array, inplace)
 
         if adjust_spectral_width:
             axis = data.axes[dim]
@@ -2708,7 +4067,7 @@ def circular_shift(
 
             axis_new = axis.copy()
             axis_new["ORI"] = new_ori
-            axis_new["scale"] = np.roll(axis["scale"], shift_points)
+            axis_new["scale"] = roll_scale(axis["scale"], shift_points)
             axis_new["SW"] = sw_value
             axis_new["OBS"] = obs
 
@@ -2724,7 +4083,7 @@ def circular_shift(
         })
 
     else:
-        new_data = shifted_array
+        new_data = _wrap_output(data, shifted_array, inplace)
 
     return cast(NMRArrayType, new_data)
 
@@ -2734,6 +4093,8 @@ CS.__doc__ = circular_shift.__doc__  # Auto-generated
 CS.__name__ = "CS"  # Auto-generated
 
 
+@_with_precision
+@_along_axis
 def manipulate_sign(
     data: NMRArrayType,
     *,
@@ -2745,6 +4106,8 @@ def manipulate_sign(
     alternate_sign: bool = False,
     absolute_value: bool = False,
     replace_with_sign: bool = False,
+    out: np.ndarray | None = None,
+    inplace: bool = False,
     # Aliases
     ri: bool | None = None,
     r: bool | None = None,
@@ -2760,6 +4123,7 @@ def manipulate_sign(
 
     Args:
         data (NMRData): Input NMR dataset.
+        axis (int, optional): Dimension to process. Defaults to -1 (last).
         negate_all (bool): Negate the entire dataset.
         negate_reals (bool): Negate only the real part of the data.
         negate_imaginaries (bool): Negate only the imaginary part of the data.
@@ -2768,6 +4132,11 @@ def manipulate_sign(
         alternate_sign (bool): Alternate sign for each point.
         absolute_value (bool): Apply absolute value to the entire dataset.
         replace_with_sign (bool): Replace each value with its sign (+1, 0, -1).
+        out (np.ndarray, optional): Array of the shape of data to write the result into.
+            The returned data shares its memory.
+        inplace (bool, optional): Change the signs of data in place and return it, with the step
+            added to its processing history. The absolute value of complex data is real and
+            cannot be taken in place. Defaults to False.
 
     Aliases:
         ri: Alias for negate_all.
@@ -2778,6 +4147,7 @@ def manipulate_sign(
         alt: Alias for alternate_sign.
         abs: Alias for absolute_value.
         sign: Alias for replace_with_sign.
+        dim: Alias for axis.
 
     Returns:
         NMRData: Data after sign manipulation.
@@ -2801,7 +4171,10 @@ def manipulate_sign(
 
 
     
-    result = data.copy()
+    if absolute_value and np.iscomplexobj(data) and (out is not None or inplace):
+        raise ValueError("The absolute value of complex data is real, it cannot be written into out or data itself.")
+    
+    result = _work_array(data, out, inplace)
     npoints = result.shape[-1]
 
     if negate_all:
@@ -2822,17 +4195,16 @@ def manipulate_sign(
         result[..., midpoint:] *= -1
 
     if alternate_sign:
-        sign_pattern = np.ones(npoints)
-        sign_pattern[1::2] = -1 
-        result *= sign_pattern
+        result[..., 1::2] *= -1
 
     if absolute_value:
-        result = np.abs(result)
+        result = np.abs(result, out=result) if not np.iscomplexobj(result) else np.abs(result)
 
     # Replace each value with its sign (+1, 0, -1)
     if replace_with_sign:
-        result = np.sign(result)
+        result = np.sign(result, out=result)
 
+    result = _wrap_output(data, result, inplace)
     if isinstance(result, NMRData):
         elapsed = perf_counter() - start_time
         result.processing_history.append({
@@ -2857,6 +4229,7 @@ SIGN.__doc__ = manipulate_sign.__doc__  # Auto-generated
 SIGN.__name__ = "SIGN"  # Auto-generated
 
 
+@_with_precision
 def modulus(
     data: NMRArrayType,
     *,
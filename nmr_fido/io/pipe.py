@@ -0,0 +1,339 @@
+from __future__ import annotations
+from time import perf_counter
+from pathlib import Path
+import numpy as np
+import struct
+
+from nmr_fido.nmrdata import NMRData
+from nmr_fido.core.processing import _format_elapsed_time
+from nmr_fido.utils.scales import LinearScale
+
+
+HEADER_SIZE = 512 # Number of float32 values in the NMRPipe header
+HEADER_BYTES = HEADER_SIZE * 4
+
+# Locations of the header values used here, see fdatap.h of NMRPipe
+FDMAGIC = 0
+FDFLTFORMAT = 1
+FDFLTORDER = 2
+FDDIMCOUNT = 9
+FDDIMORDER = (24, 25, 26, 27)
+FDF3SIZE = 15
+FDF4SIZE = 32
+FDPIPEFLAG = 57
+FDSIZE = 99
+FDREALSIZE = 97
+FDQUADFLAG = 106
+FDSPECNUM = 219
+FDTRANSPOSED = 221
+FDFILECOUNT = 442
+FD2DVIRGIN = 399
+
+# Per dimension locations, keyed by NMRPipe dimension number (F1-F4)
+FDSW = {1: 229, 2: 100, 3: 11, 4: 29}
+FDORIG = {1: 249, 2: 101, 3: 12, 4: 30}
+FDOBS = {1: 218, 2: 119, 3: 10, 4: 28}
+FDQUADFLAGS = {1: 55, 2: 56, 3: 51, 4: 54}
+FDFTFLAG = {1: 222, 2: 220, 3: 13, 4: 31}
+FDCENTER = {1: 80, 2: 79, 3: 81, 4: 82}
+FDLABEL = {1: 18, 2: 16, 3: 20, 4: 22} # 8 characters, stored in two floats
+
+FLOAT_FORMAT = struct.unpack('f', b'\xef\xeenO')[0]
+FLOAT_ORDER = 2.345
+
+
+def _empty_header() -> np.ndarray:
+    """Header with the default values of a new NMRPipe file."""
+    header = np.zeros(HEADER_SIZE, dtype=np.float32)
+
+    header[FDFLTFORMAT] = FLOAT_FORMAT
+    header[FDFLTORDER] = FLOAT_ORDER
+    header[list(FDDIMORDER)] = (2, 1, 3, 4)
+    header[[FDF3SIZE, FDF4SIZE, FDSPECNUM, FDFILECOUNT, FD2DVIRGIN]] = 1
+
+    for pipe_dim, label in zip((1, 2, 3, 4), ("Y", "X", "Z", "A")):
+        header[FDQUADFLAGS[pipe_dim]] = 1
+        header[FDCENTER[pipe_dim]] = 1
+        _set_label(header, pipe_dim, label)
+
+    return header
+
+
+def _get_label(header: np.ndarray, pipe_dim: int) -> str:
+    location = FDLABEL[pipe_dim]
+    raw = header[location:location + 2].astype(np.float32).tobytes()
+    return raw.split(b'\x00')[0].decode(errors='replace').strip()
+
+
+def _set_label(header: np.ndarray, pipe_dim: int, label: str) -> None:
+    location = FDLABEL[pipe_dim]
+    packed = struct.pack('8s', str(label).encode()[:8])
+    header[location:location + 2] = np.frombuffer(packed, dtype=np.float32)
+
+
+def read_pipe_header(filename: str | Path) -> tuple[np.ndarray, np.dtype]:
+    """
+    Read the 512 value header of an NMRPipe file.
+
+    Args:
+        filename (str | Path): NMRPipe file.
+
+    Returns:
+        tuple[np.ndarray, np.dtype]: Header as native float32 values and the float dtype
+            (with byte order) of the data in the file.
+    """
+    header = np.fromfile(filename, dtype='<f4', count=HEADER_SIZE)
+    if header.size != HEADER_SIZE:
+        raise ValueError(f"{filename} is too small to be an NMRPipe file.")
+
+    file_dtype = np.dtype('<f4')
+    if abs(header[FDFLTORDER] - FLOAT_ORDER) > 1e-6:
+        # Written with the other byte order
+        header = np.fromfile(filename, dtype='>f4', count=HEADER_SIZE)
+        file_dtype = np.dtype('>f4')
+        if abs(header[FDFLTORDER] - FLOAT_ORDER) > 1e-6:
+            raise ValueError(f"{filename} is not an NMRPipe file (float order check failed).")
+
+    return header.astype(np.float32), file_dtype
+
+
+def _file_shape(header: np.ndarray) -> tuple[tuple[int, ...], bool]:
+    """Shape of the float32 data in the file and whether the direct dimension is complex."""
+    ndim = int(header[FDDIMCOUNT])
+    dim_order = [int(header[i]) for i in FDDIMORDER]
+    complex_direct = header[FDQUADFLAGS[dim_order[0]]] != 1
+
+    x_size = int(header[FDSIZE]) * (2 if complex_direct else 1)
+    if ndim == 1:
+        return (x_size,), complex_direct
+
+    y_size = int(header[FDSPECNUM])
+    # When the direct dimension is real and the indirect complex, FDSPECNUM is half the vector count
+    if header[FDQUADFLAG] == 0 and not complex_direct:
+        y_size *= 2
+
+    if header[FDPIPEFLAG] != 0 and ndim == 3:
+        return (int(header[FDF3SIZE]), y_size, x_size), complex_direct
+    if header[FDPIPEFLAG] != 0 and ndim == 4:
+        return (int(header[FDF4SIZE]), int(header[FDF3SIZE]), y_size, x_size), complex_direct
+
+    # Single plane of a multi file 3D/4D data set
+    return (y_size, x_size), complex_direct
+
+
+def _header_to_axes(header: np.ndarray, shape: tuple[int, ...]) -> list[dict]:
+    ndim = len(shape)
+    dim_order = [int(header[i]) for i in FDDIMORDER]
+
+    axes = []
+    for i, size in enumerate(shape):
+        pipe_dim = dim_order[ndim - 1 - i]
+        sw = float(header[FDSW[pipe_dim]])
+        ori = float(header[FDORIG[pipe_dim]])
+        obs = float(header[FDOBS[pipe_dim]])
+        frequency_domain = header[FDFTFLAG[pipe_dim]] != 0
+
+        axis = {
+            "label": _get_label(header, pipe_dim),
+            "SW": sw,
+            "ORI": ori,
+            "OBS": obs,
+            "pipe_dim": pipe_dim,
+        }
+
+        if frequency_domain and sw != 0.0 and obs != 0.0:
+            axis["scale"] = LinearScale.ppm(size, sw, ori, obs)
+            axis["unit"] = "ppm"
+        else:
+            axis["scale"] = LinearScale.points(size)
+            axis["unit"] = "pts"
+
+        # Complex indirect dimensions are stored as interleaved real/imaginary vectors
+        if i != ndim - 1 and header[FDQUADFLAGS[pipe_dim]] == 0:
+            axis["interleaved_data"] = True
+
+        axes.append(axis)
+
+    return axes
+
+
+def _open_pipe(filename: Path, *, mmap: bool = True) -> tuple[np.ndarray, np.ndarray, bool]:
+    """Header, float32 data body (memory mapped or read) and whether the direct dimension is complex."""
+    header, file_dtype = read_pipe_header(filename)
+    shape, complex_direct = _file_shape(header)
+
+    expected_bytes = HEADER_BYTES + int(np.prod(shape)) * 4
+    if filename.stat().st_size < expected_bytes:
+        raise ValueError(f"{filename} is smaller ({filename.stat().st_size} bytes) than its header describes ({expected_bytes} bytes).")
+
+    if mmap:
+        body = np.memmap(filename, dtype=file_dtype, mode='r', offset=HEADER_BYTES, shape=shape)
+    else:
+        body = np.fromfile(filename, dtype=file_dtype, count=int(np.prod(shape)), offset=HEADER_BYTES).reshape(shape)
+
+    return header, body, complex_direct
+
+
+def _body_to_complex(body: np.ndarray) -> np.ndarray:
+    """Assemble vectors stored as [real block, imaginary block] into complex64."""
+    npoints = body.shape[-1] // 2
+    array = np.empty(body.shape[:-1] + (npoints,), dtype=np.complex64)
+    array.real = body[..., :npoints]
+    array.imag = body[..., npoints:]
+    return array
+
+
+def _complex_to_body(array: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Store complex vectors as [real block, imaginary block] in the float32 buffer out."""
+    npoints = array.shape[-1]
+    np.copyto(out[..., :npoints], array.real, casting='unsafe')
+    np.copyto(out[..., npoints:], array.imag, casting='unsafe')
+    return out
+
+
+def read_pipe(filename: str | Path, *, mmap: bool = True) -> NMRData:
+    """
+    Read a 1D, 2D or single file (stream) 3D/4D NMRPipe file.
+
+    The header is parsed into the axes (label, SW, ORI, OBS, scale, unit and interleaved
+    indirect dimensions). The data body is memory mapped, so for real data nothing is
+    read from disk until it is accessed. Data with a complex direct dimension is stored
+    as separate real and imaginary blocks per vector and is assembled into a single
+    complex64 array.
+
+    Args:
+        filename (str | Path): NMRPipe file.
+        mmap (bool, optional): Memory map the data body instead of reading it. Defaults to True.
+
+    Returns:
+        NMRData: Data with axes from the header. The raw header values are kept
+            as a tuple in metadata["pipe_header"].
+    """
+    start_time = perf_counter()
+
+    filename = Path(filename)
+    header, body, complex_direct = _open_pipe(filename, mmap=mmap)
+    array = _body_to_complex(body) if complex_direct else body
+
+    result = NMRData(
+        array,
+        axes=_header_to_axes(header, array.shape),
+        metadata={"pipe_header": tuple(header.tolist()), "filename": str(filename)},
+    )
+
+    elapsed = perf_counter() - start_time
+    result.processing_history.append({
+        'Function': "Read NMRPipe file",
+        'filename': str(filename),
+        'shape': array.shape,
+        'memory_mapped': isinstance(array, np.memmap),
+        'time_elapsed_s': elapsed,
+        'time_elapsed_str': _format_elapsed_time(elapsed),
+    })
+
+    return result
+
+
+def _axes_to_header(
+    header: np.ndarray,
+    shape: tuple[int, ...],
+    axes: list[dict] | None,
+    is_complex: bool,
+) -> np.ndarray:
+    """Update header in place with the sizes and axes of data with the given shape."""
+    ndim = len(shape)
+    if axes is None:
+        axes = [{} for _ in range(ndim)]
+
+    dim_order = [int(header[i]) for i in FDDIMORDER][:ndim]
+    pipe_dims = [axis.get("pipe_dim") for axis in reversed(axes)] # X first
+    if all(pipe_dims) and len(set(pipe_dims)) == ndim:
+        dim_order = pipe_dims
+    dim_order = dim_order + [d for d in (2, 1, 3, 4) if d not in dim_order]
+
+    header[list(FDDIMORDER)] = dim_order[:4]
+    header[FDDIMCOUNT] = ndim
+    header[FDTRANSPOSED] = 1 if dim_order[0] == 1 else 0
+
+    for i, axis in enumerate(axes):
+        pipe_dim = dim_order[ndim - 1 - i]
+        is_direct = i == ndim - 1
+
+        for key, locations in (("SW", FDSW), ("ORI", FDORIG), ("OBS", FDOBS)):
+            if axis.get(key) is not None:
+                header[locations[pipe_dim]] = axis[key]
+        if axis.get("label") is not None:
+            _set_label(header, pipe_dim, axis["label"])
+
+        if is_direct:
+            header[FDQUADFLAGS[pipe_dim]] = 0 if is_complex else 1
+        else:
+            header[FDQUADFLAGS[pipe_dim]] = 0 if axis.get("interleaved_data", False) else 1
+
+        header[FDFTFLAG[pipe_dim]] = 1 if str(axis.get("unit", "pts")).lower() in ("ppm", "hz") else 0
+
+    any_complex = any(header[FDQUADFLAGS[pipe_dim]] == 0 for pipe_dim in dim_order[:ndim])
+    header[FDQUADFLAG] = 0 if any_complex else 1
+
+    header[FDSIZE] = shape[-1]
+    header[FDREALSIZE] = shape[-1]
+    header[FDSPECNUM] = shape[-2] if ndim > 1 else 1
+    # Counted in complex pairs when only the indirect dimensions are complex, see _file_shape
+    if ndim > 1 and any_complex and not is_complex:
+        header[FDSPECNUM] = shape[-2] // 2
+    header[FDF3SIZE] = shape[-3] if ndim > 2 else 1
+    header[FDF4SIZE] = shape[-4] if ndim > 3 else 1
+    header[FDPIPEFLAG] = 1 if ndim > 2 else 0
+    header[FDFILECOUNT] = 1
+
+    return header
+
+
+def write_pipe(filename: str | Path, data: np.ndarray, *, overwrite: bool = False) -> None:
+    """
+    Write data to a single NMRPipe file (1D, 2D or 3D/4D stream).
+
+    The header is built from metadata["pipe_header"] if present, updated with the
+    sizes and axes (label, SW, ORI, OBS, units, interleaved dimensions) of data.
+    The data body is written with a single write from one float32 buffer.
+
+    Args:
+        filename (str | Path): Output file.
+        data (NMRData | np.ndarray): Data to write. Complex data is written as
+            real and imaginary blocks per vector as NMRPipe expects.
+        overwrite (bool, optional): Overwrite an existing file. Defaults to False.
+    """
+    filename = Path(filename)
+    if filename.exists() and not overwrite:
+        raise FileExistsError(f"{filename} already exists, use overwrite=True to replace it.")
+
+    template = data.metadata.get("pipe_header") if isinstance(data, NMRData) else None
+    header = np.array(template, dtype=np.float32) if template is not None else _empty_header()
+    axes = data.axes if isinstance(data, NMRData) else None
+    header = _axes_to_header(header, data.shape, axes, np.iscomplexobj(data))
+
+    array = np.asarray(data)
+    if np.iscomplexobj(array):
+        # One buffer with the real block followed by the imaginary block of each vector
+        body = np.empty(array.shape[:-1] + (2 * array.shape[-1],), dtype=np.float32)
+        _complex_to_body(array, body)
+    else:
+        body = np.ascontiguousarray(array, dtype=np.float32)
+
+    with open(filename, 'wb') as file:
+        file.write(header.tobytes())
+        file.write(memoryview(body).cast('B'))
+
+
+def _create_pipe(filename: Path, header: np.ndarray, shape: tuple[int, ...], is_complex: bool) -> np.memmap:
+    """
+    Write header to a new NMRPipe file and memory map its (zeroed) float32 body for writing.
+    Complex data takes twice the points in the last dimension, see _complex_to_body.
+    """
+    body_shape = shape[:-1] + (2 * shape[-1],) if is_complex else tuple(shape)
+
+    with open(filename, 'wb') as file:
+        file.write(header.astype(np.float32).tobytes())
+        file.truncate(HEADER_BYTES + int(np.prod(body_shape)) * 4)
+
+    return np.memmap(filename, dtype=np.float32, mode='r+', offset=HEADER_BYTES, shape=body_shape)
@@ -2,18 +2,72 @@ from __future__ import annotations
 from typing import Callable, Any
 import numpy as np
 import copy
+import threading
+import weakref
 import inspect
 import functools
 import numbers
 
-from nmr_fido.utils.scales import get_hz_scale, get_ppm_scale
+from nmr_fido.utils.scales import LinearScale
+
+
+class _SharedMetadata:
+    """
+    Holder for the axes, metadata and processing history of NMRData objects.
+
+    Views, slices, ufunc results and copies share the holder of the array they were
+    derived from instead of deep copying it, so temporaries created by numpy never
+    pay for the metadata. A shared holder is never modified: an array accessing its
+    metadata (axes, metadata, processing_history) first takes a private copy of a
+    holder it does not own.
+
+    The containers handed out by these properties can be modified at any later time,
+    so a holder that was accessed (exposed) is not shared anymore: arrays derived from
+    it get a private copy of its current content instead.
+    """
+    __slots__ = ("axes", "metadata", "processing_history", "owner", "exposed")
+    
+    def __init__(self, axes: list[dict], metadata: dict, processing_history: list[dict]):
+        self.axes = axes
+        self.metadata = metadata
+        self.processing_history = processing_history
+        self.owner: weakref.ref | None = None # Array allowed to modify the holder, None while shared
+        self.exposed = False # The containers were handed out to the owner
+    
+    
+    def copy(self) -> _SharedMetadata:
+        """
+        Copy the containers, one level deep.
+
+        Axis dicts are updated in place by the processing functions and get copied,
+        their values (e.g. scales) and the history entries are never modified in place
+        and stay shared.
+        """
+        return _SharedMetadata(
+            [dict(axis) for axis in self.axes],
+            dict(self.metadata),
+            list(self.processing_history),
+        )
+
+
+# Guards the ownership of holders, derived arrays may be created from several threads
+_metadata_lock = threading.Lock()
+
+
+def _same_memory(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if a and b are the same values in memory (same buffer, shape, strides and dtype)."""
+    return (
+        a.shape == b.shape
+        and a.strides == b.strides
+        and a.dtype == b.dtype
+        and a.__array_interface__["data"][0] == b.__array_interface__["data"][0]
+    )
+
 
 
 class NMRData(np.ndarray):
     # Declare so IDE can autocomplete
-    axes: list[dict]
-    metadata: dict
-    processing_history: list[dict]
+    _meta: _SharedMetadata
     
     _custom_attrs = ['axes', 'metadata', 'processing_history']
     
@@ -34,7 +88,8 @@ class NMRData(np.ndarray):
 
             axes (list of dict, optional):
                 A list of dictionaries for each axis. Each dictionary can contain optional keys such as 'label', 'scale', 'units', 'SW', 'ORI', 'OBS'.
-                If a key is not provided, a default value will be generated. For instance, 'scale' will default to a range array of the appropriate size.
+                If a key is not provided, a default value will be generated. For instance, 'scale' will default to a points scale (LinearScale) of the appropriate size.
+                Scales can be given as a LinearScale, which computes its values on demand, or as an array.
 
             metadata (dict, optional):
                 Global metadata for the dataset, such as acquisition parameters.
@@ -44,6 +99,7 @@ class NMRData(np.ndarray):
 
             copy_from (NMRData, optional):
                 An existing NMRData object to inherit all metadata from (except the data array).
+                The metadata is shared with copy_from until either of them accesses it.
 
         Returns:
             NMRData:
@@ -62,20 +118,27 @@ class NMRData(np.ndarray):
             'processing_history': processing_history
         }
         
+        source = copy_from._get_metadata() if isinstance(copy_from, NMRData) else None
+        
+        if source is not None and all(value is None for value in init_args.values()):
+            # Nothing to override, share the metadata of copy_from
+            obj._share_metadata(source)
+            return obj
+        
+        # New holders are private to obj until they are shared
+        meta = source.copy() if source is not None else obj._default_metadata()
         for attr in cls._custom_attrs:
             if init_args.get(attr) is not None:
-                setattr(obj, attr, copy.deepcopy(init_args[attr]))
-            elif copy_from is not None and getattr(copy_from, attr, None) is not None:
-                setattr(obj, attr, copy.deepcopy(getattr(copy_from, attr)))
-            else:
-                setattr(obj, attr, cls._default_value(attr, input_array))
-
+                setattr(meta, attr, copy.deepcopy(init_args[attr]))
+        
         # Populate missing axis entries with defaults
-        if hasattr(obj, 'axes') and isinstance(obj.axes, list):
-            for i, axis in enumerate(obj.axes):
-                default_axis = cls._default_axis(i, input_array.shape[i])
+        if axes is not None or source is None:
+            for i, axis in enumerate(meta.axes):
+                default_axis = cls._default_axis(i, obj.shape[i])
                 for key, value in default_axis.items():
                     axis.setdefault(key, value)
+        
+        obj._set_metadata(meta)
 
         return obj
 
@@ -84,12 +147,89 @@ class NMRData(np.ndarray):
     def __array_finalize__(self, obj):
         if obj is None: return
         
-        for attr in self._custom_attrs:
-            value = getattr(obj, attr, None)
-            if value is not None:
-                setattr(self, attr, copy.deepcopy(value))
+        # Arrays not derived from NMRData get their default metadata on first access
+        meta = getattr(obj, '_meta', None)
+        if meta is not None:
+            self._share_metadata(meta)
+    
+    
+    def _set_metadata(self, meta: _SharedMetadata) -> None:
+        """Give this array a new holder that no other array uses."""
+        meta.owner = weakref.ref(self)
+        meta.exposed = False
+        self._meta = meta
+    
+    
+    def _share_metadata(self, meta: _SharedMetadata) -> None:
+        """Point this array to the metadata of meta, sharing the holder unless it was exposed."""
+        if self.__dict__.get('_meta') is meta:
+            return
+        
+        with _metadata_lock:
+            if meta.exposed:
+                # Containers handed out earlier may still change, keep a copy of their content
+                snapshot = meta.copy()
             else:
-                setattr(self, attr, self._default_value(attr, self))
+                meta.owner = None
+                self._meta = meta
+                return
+        self._set_metadata(snapshot)
+    
+    
+    def _get_metadata(self) -> _SharedMetadata:
+        """Return the (possibly shared) metadata holder, for read-only use."""
+        meta = self.__dict__.get('_meta')
+        if meta is None:
+            meta = self._default_metadata()
+            self._set_metadata(meta)
+        return meta
+    
+    
+    def _own_metadata(self) -> _SharedMetadata:
+        """Return the metadata holder to hand out its containers, copying it first if this array does not own it."""
+        meta = self._get_metadata()
+        with _metadata_lock:
+            if meta.owner is None or meta.owner() is not self:
+                meta = meta.copy()
+                meta.owner = weakref.ref(self)
+                self._meta = meta
+            meta.exposed = True
+        return meta
+    
+    
+    def _default_metadata(self) -> _SharedMetadata:
+        return _SharedMetadata(
+            self._default_value('axes', self),
+            self._default_value('metadata', self),
+            self._default_value('processing_history', self),
+        )
+    
+    
+    @property
+    def axes(self) -> list[dict]:
+        return self._own_metadata().axes
+    
+    @axes.setter
+    def axes(self, value: list[dict]) -> None:
+        self._own_metadata().axes = value
+    
+    
+    @property
+    def metadata(self) -> dict:
+        return self._own_metadata().metadata
+    
+    @metadata.setter
+    def metadata(self, value: dict) -> None:
+        self._own_metadata().metadata = value
+    
+    
+    @property
+    def processing_history(self) -> list[dict]:
+        return self._own_metadata().processing_history
+    
+    @processing_history.setter
+    def processing_history(self, value: list[dict]) -> None:
+        self._own_metadata().processing_history = value
     
     
     @staticmethod
@@ -107,7 +247,7 @@ class NMRData(np.ndarray):
     def _default_axis(index: int, size: int) -> dict:
         return {
             "label": f"Axis {index}",
-            "scale": np.arange(size),
+            "scale": LinearScale.points(size),
             "unit": "pts"
         }
         
@@ -139,40 +279,38 @@ class NMRData(np.ndarray):
         #surviving_dims = [i for i, s in enumerate(slicers) if not isinstance(s, int)]
 
         # Update axes attribute
+        source = self._get_metadata()
         new_axes = []
         for i, s in enumerate(slicers):
-            if i >= len(self.axes):
+            if i >= len(source.axes):
                 continue  # prevent IndexError
             
-            axis_dict = copy.deepcopy(self.axes[i])
+            axis_dict = dict(source.axes[i])
             unit = axis_dict.get("unit", "").lower()
             
             if isinstance(s, slice):
                 # Slice the scale data
                 
-                start, stop, step = s.indices(self.shape[i])
-                new_size = (stop - start + (step - 1)) // step
-                new_scale = axis_dict['scale'][s]
+                new_size = len(range(*s.indices(self.shape[i])))
                 
                 if unit == "pts":
-                    axis_dict["scale"] = np.arange(new_size)
+                    axis_dict["scale"] = LinearScale.points(new_size)
                 
                 elif unit in ("ppm", "hz") and all(k in axis_dict for k in ("SW", "ORI", "OBS")):
                     full_size = self.shape[i]
                     sw, ori, obs = (axis_dict[k] for k in ("SW", "ORI", "OBS"))
 
-                    # Recalculate ppm scale and adjust spectral properties
-                    ppm_scale = get_ppm_scale(full_size, sw, ori, obs)
-                    new_ppm_scale = ppm_scale[s]
-                    ppm_min, ppm_max = new_ppm_scale.min(), new_ppm_scale.max()
+                    # Slice the Hz scale and adjust spectral properties,
+                    # ORI is the frequency of the last point
+                    new_hz_scale = LinearScale.hz(full_size, sw, ori)[s]
 
-                    axis_dict["scale"] = new_ppm_scale
+                    axis_dict["scale"] = new_hz_scale / obs if unit == "ppm" else new_hz_scale
                     axis_dict["SW"] = sw * (new_size / full_size)
-                    axis_dict["ORI"] = obs * ppm_max  # ORI = OBS * ppm
+                    axis_dict["ORI"] = new_hz_scale[-1] if new_size > 0 else ori
                     axis_dict["OBS"] = obs
 
                 else:
-                    axis_dict["scale"] = new_scale
+                    axis_dict["scale"] = axis_dict['scale'][s]
                 
                 new_axes.append(axis_dict)
             
@@ -183,14 +321,11 @@ class NMRData(np.ndarray):
             else:
                 new_axes.append(axis_dict)
 
-        result = NMRData(slice_array)
-        # Reorder axes based on surviving dimensions
-        result.axes = new_axes
-
-        # Copy other custom attributes
-        for attr in self._custom_attrs:
-            if attr != 'axes':
-                setattr(result, attr, copy.deepcopy(getattr(self, attr, None)))
+        # Surviving axes, other custom attributes are carried over
+        result = slice_array if isinstance(slice_array, NMRData) else NMRData(slice_array)
+        result._set_metadata(
+            _SharedMetadata(new_axes, dict(source.metadata), list(source.processing_history))
+        )
 
         return result
 
@@ -257,11 +392,17 @@ class NMRData(np.ndarray):
     
     
     def _update_from(self, other: NMRData):
-        """Helper to update self's contents from another NMRData object."""
-        self.resize(other.shape, refcheck=False)
-        np.copyto(self, other)
-        for attr in self._custom_attrs:
-            setattr(self, attr, copy.deepcopy(getattr(other, attr)))
+        """
+        Helper to update self's contents from another NMRData object.
+
+        The values are only copied when other does not already live in the memory of self
+        (e.g. the result of a function called with inplace=True), the metadata is shared.
+        """
+        if not _same_memory(self, other):
+            if self.shape != other.shape:
+                self.resize(other.shape, refcheck=False)
+            np.copyto(self, other)
+        self._share_metadata(other._get_metadata())
     
     
     def scale_to_hz(self, target_dim: int = -1) -> NMRData:
@@ -289,7 +430,7 @@ class NMRData(np.ndarray):
 
         npoints = self.shape[dim]
         
-        hz_scale = get_hz_scale(npoints, sw, ori)
+        hz_scale = LinearScale.hz(npoints, sw, ori)
 
         self.axes[dim]["scale"] = hz_scale
         self.axes[dim]["unit"] = "Hz"
@@ -325,7 +466,7 @@ class NMRData(np.ndarray):
         npoints = self.shape[dim]
         
         # Calculate ppm scale
-        ppm_scale = get_ppm_scale(npoints, sw, ori, obs)
+        ppm_scale = LinearScale.ppm(npoints, sw, ori, obs)
 
         self.axes[dim]["scale"] = ppm_scale
         self.axes[dim]["unit"] = "ppm"
@@ -369,4 +510,21 @@ class NMRData(np.ndarray):
         dims = [d if d >= 0 else self.ndim + d for d in target_dims]
 
         return (*self.limits(dims[0]), *self.limits(dims[1]))
-        
\ No newline at end of file
+            
+    
+    def to_indices(self, values, target_dim: int = -1, unit: str | None = None) -> np.ndarray:
+        """
+        Convert positions to the indices of the closest points in one call.
+
+        Args:
+            values (str | float | array-like): A position (e.g. "70ppm", "1234 Hz", "10%", 512)
+                or an array/list of positions, e.g. a peak list.
+            target_dim (int): Index of the dimension. Defaults to the last dimension (-1).
+            unit (str, optional): Unit of plain numbers ("ppm", "hz", "pts" or "%"). Defaults to "pts".
+
+        Returns:
+            np.ndarray: Integer indices with the same shape as values.
+        """
+        from nmr_fido.utils.unit_to_index import convert_to_indices
+        
+        return convert_to_indices(self, values, dim=target_dim, unit=unit)
@@ -1,4 +1,280 @@
+from __future__ import annotations
 import numpy as np
+import numbers
+
+
+class LinearScale:
+    """
+    Lazily evaluated, evenly spaced axis scale.
+
+    The value of point i is `start + step * k`, where `k = offset + i * stride`,
+    wrapped around `period` points if the scale has been circularly shifted.
+    Values are only computed when requested: slicing, reversing and shifting
+    return a new LinearScale in O(1), and `np.asarray(scale)` materializes it.
+
+    A LinearScale is immutable and can be used wherever a 1D array of scale values
+    is expected (indexing, len(), plotting, arithmetic with numpy arrays).
+    """
+    __slots__ = ("start", "step", "size", "offset", "stride", "period")
+
+    def __init__(
+        self,
+        start: float,
+        step: float,
+        size: int,
+        *,
+        offset: int = 0,
+        stride: int = 1,
+        period: int | None = None,
+    ):
+        """
+        Args:
+            start (float): Value of the point with index 0 of the underlying sequence.
+            step (float): Spacing between two consecutive points of the underlying sequence.
+            size (int): Number of points in the scale.
+            offset (int, optional): Index into the underlying sequence of the first point. Defaults to 0.
+            stride (int, optional): Index step into the underlying sequence between points. Defaults to 1.
+            period (int, optional): Wrap indices into the underlying sequence around this many points.
+                Only set for circularly shifted scales. Defaults to None.
+        """
+        if period is None and (offset != 0 or stride != 1):
+            # Fold the index mapping into start/step
+            start = start + step * offset
+            step = step * stride
+            offset, stride = 0, 1
+
+        self.start = float(start)
+        self.step = float(step)
+        self.size = int(size)
+        self.offset = int(offset) % period if period else int(offset)
+        self.stride = int(stride)
+        self.period = period
+
+
+    @classmethod
+    def points(cls, npoints: int) -> LinearScale:
+        """Points scale 0, 1, ..., npoints - 1."""
+        return cls(0.0, 1.0, npoints)
+
+
+    @classmethod
+    def hz(cls, npoints: int, sw: float, ori: float) -> LinearScale:
+        """Hz scale, see get_hz_scale."""
+        o1_Hz = ori + sw / 2 - sw / npoints
+        return cls(o1_Hz + sw / 2, -sw / npoints, npoints)
+
+
+    @classmethod
+    def ppm(cls, npoints: int, sw: float, ori: float, obs: float) -> LinearScale:
+        """ppm scale, see get_ppm_scale."""
+        return cls.hz(npoints, sw, ori) / obs
+
+
+    @property
+    def is_linear(self) -> bool:
+        """True if the values are evenly spaced (not circularly shifted)."""
+        return self.period is None
+
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (self.size,)
+
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+
+    def __len__(self) -> int:
+        return self.size
+
+
+    def _indices(self, i: np.ndarray | int) -> np.ndarray | int:
+        k = self.offset + i * self.stride
+        if self.period:
+            k = k % self.period
+        return k
+
+
+    def __getitem__(self, item) -> float | LinearScale | np.ndarray:
+        if isinstance(item, numbers.Integral):
+            i = int(item)
+            if i < 0:
+                i += self.size
+            if not 0 <= i < self.size:
+                raise IndexError(f"index {item} is out of bounds for scale with size {self.size}")
+            return self.start + self.step * self._indices(i)
+
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self.size)
+            return LinearScale(
+                self.start, self.step,
+                len(range(start, stop, step)),
+                offset=self.offset + start * self.stride,
+                stride=self.stride * step,
+                period=self.period,
+            )
+
+        return np.asarray(self)[item]
+
+
+    def __iter__(self):
+        return iter(np.asarray(self).tolist())
+
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.start + self.step * self._indices(np.arange(self.size))
+        return values if dtype is None else values.astype(dtype)
+
+
+    def roll(self, shift: int) -> LinearScale | np.ndarray:
+        """
+        Circularly shift the scale, equivalent to np.roll(scale, shift).
+
+        Args:
+            shift (int): Number of points to shift to the right.
+
+        Returns:
+            LinearScale | np.ndarray: Shifted scale. Falls back to np.roll for
+                scales that are themselves slices of a shifted scale.
+        """
+        if self.size == 0:
+            return self
+
+        if self.period is None:
+            return LinearScale(self.start, self.step, self.size, offset=-shift, period=self.size)
+
+        if self.stride == 1 and self.period == self.size:
+            return LinearScale(self.start, self.step, self.size, offset=self.offset - shift, period=self.period)
+
+        return np.roll(np.asarray(self), shift)
+
+
+    def shift(self, shift: int) -> LinearScale:
+        """
+        Shift the scale by a number of points without wrapping,
+        i.e. point i takes the value point i - shift had (extrapolated past the ends).
+        """
+        if self.period is not None:
+            raise ValueError("Cannot shift a circularly shifted scale.")
+        return LinearScale(self.start - self.step * shift, self.step, self.size)
+
+
+    def min(self) -> float:
+        if self.size == 0:
+            raise ValueError("zero-size scale has no minimum")
+        if self.period is None:
+            return min(self[0], self[-1])
+        return float(np.asarray(self).min())
+
+
+    def max(self) -> float:
+        if self.size == 0:
+            raise ValueError("zero-size scale has no maximum")
+        if self.period is None:
+            return max(self[0], self[-1])
+        return float(np.asarray(self).max())
+
+
+    def copy(self) -> LinearScale:
+        return self
+
+    def __copy__(self) -> LinearScale:
+        return self
+
+    def __deepcopy__(self, memo) -> LinearScale:
+        return self
+
+
+    def _affine(self, scale: float, shift: float) -> LinearScale:
+        return LinearScale(
+            self.start * scale + shift, self.step * scale, self.size,
+            offset=self.offset, stride=self.stride, period=self.period,
+        )
+
+    def __add__(self, other):
+        if isinstance(other, numbers.Real):
+            return self._affine(1.0, other)
+        return np.asarray(self) + other
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, numbers.Real):
+            return self._affine(1.0, -other)
+        return np.asarray(self) - other
+
+    def __rsub__(self, other):
+        if isinstance(other, numbers.Real):
+            return self._affine(-1.0, other)
+        return other - np.asarray(self)
+
+    def __mul__(self, other):
+        if isinstance(other, numbers.Real):
+            return self._affine(other, 0.0)
+        return np.asarray(self) * other
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, numbers.Real):
+            return self._affine(1.0 / other, 0.0)
+        return np.asarray(self) / other
+
+    def __neg__(self):
+        return self._affine(-1.0, 0.0)
+
+
+    def __eq__(self, other) -> bool:
+        """
+        Compare all values with another scale.
+
+        NOTE:
+            Unlike np.ndarray, this returns a single bool so that axis dicts holding
+            scales can be compared with ==.
+        """
+        if isinstance(other, LinearScale) and self.period is None and other.period is None:
+            return (self.start, self.step, self.size) == (other.start, other.step, other.size)
+
+        try:
+            return bool(np.array_equal(np.asarray(self), np.asarray(other)))
+        except (TypeError, ValueError):
+            return False
+
+    __hash__ = None # type: ignore
+
+
+    def __repr__(self) -> str:
+        if self.period is None:
+            return f"LinearScale(start={self.start!r}, step={self.step!r}, size={self.size})"
+        return (
+            f"LinearScale(start={self.start!r}, step={self.step!r}, size={self.size}, "
+            f"offset={self.offset}, stride={self.stride}, period={self.period})"
+        )
+
+
+
+def roll_scale(scale: LinearScale | np.ndarray, shift: int) -> LinearScale | np.ndarray:
+    """
+    Circularly shift a scale, keeping it lazy if it is a LinearScale.
+
+    Args:
+        scale (LinearScale | np.ndarray): Scale to shift.
+        shift (int): Number of points to shift to the right.
+
+    Returns:
+        LinearScale | np.ndarray: Shifted scale.
+    """
+    if isinstance(scale, LinearScale):
+        return scale.roll(shift)
+    return np.roll(scale, shift)
+
 
 
 def get_hz_scale(npoints: int, sw: float, ori: float) -> np.ndarray:
@@ -1,10 +1,151 @@
 from __future__ import annotations
 import numpy as np
+import numbers
 from nmr_fido import NMRData
+from nmr_fido.utils.scales import LinearScale
 from typing import TypeVar
 
 NMRArrayType = TypeVar("NMRArrayType", bound=np.ndarray)
 
+_UNITS = ("ppm", "hz", "pts", "%")
+
+
+def _parse_value(value: str | numbers.Real, unit: str | None = None) -> tuple[float, str]:
+    """
+    Split a position like "5.5 ppm" into its number and unit.
+    Numbers without a unit are interpreted in `unit`, or in pts if no unit is given.
+    """
+    if isinstance(value, str):
+        cleaned = value.strip().lower().replace(" ", "")
+        number_part = (
+            cleaned.replace("ppm", "")
+            .replace("hz", "")
+            .replace("pts", "")
+            .replace("%", "")
+        )
+
+        try:
+            number = float(number_part)
+        except ValueError:
+            raise ValueError(f"Could not parse value: {value}")
+
+        for value_unit in _UNITS:
+            if value_unit in cleaned:
+                return number, value_unit
+
+        return number, "pts"
+
+    if isinstance(value, numbers.Real):
+        return float(value), (unit or "pts").lower()
+
+    raise ValueError(f"Invalid position value: {value}")
+
+
+def _nearest_indices(scale: LinearScale | np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Indices of the scale points closest to positions."""
+    npoints = len(scale)
+
+    if isinstance(scale, LinearScale) and scale.is_linear:
+        # Evenly spaced scale, solve start + step * i = position
+        if scale.step == 0.0 or npoints == 1:
+            return np.zeros(positions.shape, dtype=np.intp)
+        idx = np.rint((positions - scale.start) / scale.step)
+        return np.clip(idx, 0, npoints - 1).astype(np.intp)
+
+    scale = np.asarray(scale, dtype=np.float64)
+    diffs = np.diff(scale)
+
+    if np.all(diffs >= 0) or np.all(diffs <= 0):
+        # Monotonic scale, binary search then pick the closer neighbour
+        descending = npoints > 1 and scale[0] > scale[-1]
+        ascending_scale = scale[::-1] if descending else scale
+
+        right = np.clip(np.searchsorted(ascending_scale, positions), 1, npoints - 1)
+        left = right - 1
+        idx = np.where(
+            np.abs(positions - ascending_scale[left]) <= np.abs(ascending_scale[right] - positions),
+            left, right
+        )
+        return (npoints - 1 - idx) if descending else idx
+
+    # Arbitrary scale, compare against every point
+    return np.argmin(np.abs(scale[np.newaxis, :] - positions.reshape(-1, 1)), axis=-1).reshape(positions.shape)
+
+
+def convert_to_indices(
+    data: NMRArrayType,
+    values,
+    *,
+    dim: int = -1,
+    unit: str | None = None,
+    npoints: int | None = None,
+) -> np.ndarray:
+    """
+    Convert one or many positions (e.g. "70ppm", "1234 Hz", "10%", 512) into integer indices in one call.
+
+    Positions in ppm and Hz are resolved against the scale of the target dimension, analytically
+    for evenly spaced scales (SW/ORI/OBS) and with a binary search for other monotonic scales.
+    Values in Hz on a ppm axis (and vice versa) are converted using OBS.
+    Negative pts and % values count from the end of the array.
+
+    Args:
+        data (NMRData): Data whose axis defines the scale.
+        values (str | float | array-like): A position or an array/list of positions.
+            Strings carry their own unit, plain numbers are interpreted in `unit`.
+        dim (int, optional): Target dimension. Defaults to -1.
+        unit (str, optional): Unit of plain numbers, one of "ppm", "hz", "pts" or "%". Defaults to "pts".
+        npoints (int, optional): Number of points along the dimension. Defaults to data.shape[dim].
+
+    Returns:
+        np.ndarray: Integer indices clipped to the valid range, with the same shape as values.
+    """
+    if npoints is None:
+        npoints = data.shape[dim]
+
+    if unit is not None and unit.lower() not in _UNITS:
+        raise ValueError(f"Unknown unit '{unit}'. Must be one of {_UNITS}.")
+
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        numbers_array = values.astype(np.float64)
+        units = np.full(values.shape, (unit or "pts").lower())
+    else:
+        object_values = np.asarray(values, dtype=object)
+        parsed = [_parse_value(value, unit) for value in object_values.ravel()]
+        numbers_array = np.array([number for number, _ in parsed], dtype=np.float64).reshape(object_values.shape)
+        units = np.array([value_unit for _, value_unit in parsed], dtype=object).reshape(object_values.shape)
+
+    indices = np.zeros(numbers_array.shape, dtype=np.intp)
+
+    for value_unit in set(units.ravel().tolist()):
+        mask = units == value_unit
+        positions = numbers_array[mask]
+
+        if value_unit in ("pts", "%"):
+            if value_unit == "%":
+                positions = (positions / 100.0) * npoints
+            positions = np.where(positions >= 0, positions, npoints + positions)
+            indices[mask] = np.clip(positions, 0, npoints - 1).astype(np.intp)
+            continue
+
+        if not isinstance(data, NMRData):
+            raise ValueError(f"Positions in {value_unit} require NMRData with axis information.")
+
+        axis = data.axes[dim]
+        scale = axis["scale"]
+        axis_unit = str(axis.get("unit", "")).lower()
+        obs = axis.get("OBS")
+
+        # Convert positions to the unit of the scale
+        if axis_unit in ("ppm", "hz") and axis_unit != value_unit:
+            if not obs:
+                raise ValueError(f"Cannot convert {value_unit} to {axis_unit} without OBS in axis {dim} metadata.")
+            positions = positions * obs if value_unit == "ppm" else positions / obs
+
+        indices[mask] = _nearest_indices(scale, positions)
+
+    return indices
+
+
 def _convert_to_index(
     data: NMRArrayType,
     value,
@@ -19,43 +160,7 @@ def _convert_to_index(
     if value is None or not isinstance(data, NMRData):
         return default
 
-    if isinstance(value, int):
-        idx = value if value >= 0 else npoints + value
-        return int(np.clip(idx, 0, npoints - 1))
+    if not isinstance(value, (int, str)):
+        raise ValueError(f"Invalid start/end value: {value}")
 
-    if isinstance(value, str):
-        cleaned = value.strip().lower().replace(" ", "")
-        number_part = (
-            cleaned.replace("ppm", "")
-            .replace("hz", "")
-            .replace("pts", "")
-            .replace("%", "")
-        )
-        
-        try:
-            number = float(number_part)
-        except ValueError:
-            raise ValueError(f"Could not parse value: {value}")
-        
-        # Get correct scale for the specified dimension
-        scale = data.axes[dim]["scale"]
-
-        if "ppm" in value.lower() or "hz" in value.lower():
-            idx = np.argmin(np.abs(scale - number))
-            return int(idx)
-        
-        elif "pts" in value.lower():
-            idx = number if number >= 0 else npoints + number
-            return int(np.clip(idx, 0, npoints - 1))
-        
-        elif "%" in value.lower():
-            idx = (number / 100.0) * npoints
-            idx = idx if idx >= 0 else npoints + idx
-            return int(np.clip(idx, 0, npoints - 1))
-        
-        else:
-            # Assume pts if no unit
-            idx = number if number >= 0 else npoints + number
-            return int(np.clip(idx, 0, npoints - 1))
-
-    raise ValueError(f"Invalid start/end value: {value}")
\ No newline at end of file
+    return int(convert_to_indices(data, value, dim=dim, npoints=npoints))
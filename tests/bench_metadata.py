@@ -0,0 +1,42 @@
+import numpy as np
+import nmr_fido as nf
+import time
+
+
+def time_op(func, repeats: int = 2000) -> float:
+    """Return the mean time of func() in µs."""
+    func()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start_time) / repeats * 1e6
+
+
+array = (np.random.standard_normal((332, 2048)) + 1j * np.random.standard_normal((332, 2048))).astype(np.complex64)
+
+for history_length in (0, 10, 100):
+    data = nf.NMRData(
+        array,
+        axes=[
+            {"label": "15N", "SW": 5555.55615234375, "ORI": 3333.448974609375, "OBS": 50.64799880981445},
+            {"label": "13C", "SW": 50000.0, "ORI": -18053.66015625, "OBS": 125.69100189208984},
+        ],
+    )
+    data.scale_to_ppm(-1)
+    data.scale_to_ppm(-2)
+    for i in range(history_length):
+        data.processing_history.append({"Function": "Dummy", "index": i, "time_elapsed_s": 0.0})
+
+    print(f"--- History length: {history_length}")
+    ops = {
+        "view (data[...])": (lambda: data[...], lambda: array[...]),
+        "row slice (data[0])": (lambda: data[0], lambda: array[0]),
+        "ufunc (data * 2)": (lambda: data * 2, lambda: array * 2),
+        "copy (data.copy())": (lambda: data.copy(), lambda: array.copy()),
+        "NMRData(copy_from=data)": (lambda: nf.NMRData(array, copy_from=data), lambda: array.view()),
+        "nf.MULT(data, c=2.0)": (lambda: nf.MULT(data, constant=2.0), lambda: array * 2.0),
+    }
+    for name, (nmr_op, np_op) in ops.items():
+        nmr_time = time_op(nmr_op, repeats=200)
+        np_time = time_op(np_op, repeats=200)
+        print(f"{name:<28} {nmr_time:10.1f} µs   overhead {nmr_time - np_time:10.1f} µs")
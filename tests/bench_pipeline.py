@@ -0,0 +1,54 @@
+import numpy as np
+import nmr_fido as nf
+import time
+import tracemalloc
+
+
+def time_op(func, repeats: int = 20) -> float:
+    """Return the mean time of func() in ms."""
+    func()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start_time) / repeats * 1e3
+
+
+def peak_memory(func) -> float:
+    """Return the peak memory allocated by func() in MB."""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+steps = [
+    (nf.SP, {"start_angle": 0.35, "end_angle": 0.98, "exponent": 1, "scale_factor_first_point": 1.0}),
+    (nf.ZF, {"final_size": 4096}),
+    nf.FT,
+    (nf.PS, {"p0": -29.0, "p1": 0.0}),
+    nf.DI,
+    (nf.EXT, {"start": "70ppm", "end": "40ppm"}),
+    nf.TP,
+    (nf.SP, {"start_angle": 0.35, "end_angle": 0.9, "exponent": 1, "scale_factor_first_point": 0.5}),
+    (nf.ZF, {"final_size": 2048}),
+    nf.FT,
+    (nf.PS, {"p0": 0.0, "p1": 0.0}),
+    nf.DI,
+    (nf.EXT, {"start": "135ppm", "end": "100ppm"}),
+    nf.TP,
+]
+
+data = nf.read_pipe("tests/test2d.fid")
+pipeline = nf.Pipeline(steps)
+
+
+def run_sequential():
+    result = data
+    for func, kwargs in pipeline:
+        result = func(result, **kwargs)
+    return result
+
+
+for name, func in (("Sequential", run_sequential), ("Pipeline", lambda: pipeline(data))):
+    print(f"{name:<12} {time_op(func):8.2f} ms   peak {peak_memory(func):8.2f} MB")
@@ -0,0 +1,50 @@
+import numpy as np
+import nmr_fido as nf
+import time
+from scipy import signal
+
+
+def time_op(func, repeats: int = 5) -> float:
+    """Return the mean time of func() in ms."""
+    func()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start_time) / repeats * 1e3
+
+
+def per_vector(data, kernel):
+    """SOL as done before, one FID at a time."""
+    K = len(kernel) // 2
+    result = data.copy()
+    for index in np.ndindex(data.shape[:-1]):
+        padded = np.pad(data[index], (K, K), mode='reflect')
+        result[index] -= signal.convolve(padded, kernel, mode='valid') / kernel.sum()
+    return result
+
+
+def per_vector_butterworth(data):
+    b, a = signal.butter(4, 0.05)
+    result = data.copy()
+    for index in np.ndindex(data.shape[:-1]):
+        result[index] -= signal.filtfilt(b, a, data[index])
+    return result
+
+
+rng = np.random.default_rng(0)
+array = (rng.standard_normal((4096, 1024)) + 1j * rng.standard_normal((4096, 1024))).astype(np.complex64)
+data = nf.NMRData(array)
+
+print("4096 x 1024 complex64")
+for lowpass_size in (4, 16, 64):
+    kernel = np.ones(2 * lowpass_size + 1, dtype=np.float32)
+    before = time_op(lambda: per_vector(array, kernel))
+    after = time_op(lambda: nf.SOL(data, lowpass_size=lowpass_size))
+    print(f"Boxcar fl={lowpass_size:<3}  per vector {before:8.1f} ms   batched {after:8.1f} ms")
+
+before = time_op(lambda: per_vector_butterworth(array))
+after = time_op(lambda: nf.SOL(data, lowpass_shape="Butterworth"))
+print(f"Butterworth     per vector {before:8.1f} ms   batched {after:8.1f} ms")
+
+for filter_mode in ("Polynomial", "Spline"):
+    print(f"{filter_mode:<15} batched {time_op(lambda: nf.SOL(data, filter_mode=filter_mode)):8.1f} ms")
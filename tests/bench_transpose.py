@@ -0,0 +1,38 @@
+import numpy as np
+import nmr_fido as nf
+import time
+
+
+def time_op(func, repeats: int = 3) -> float:
+    """Return the mean time of func() in ms."""
+    func()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start_time) / repeats * 1e3
+
+
+def untiled(array):
+    """Hypercomplex transpose as one numpy copy of the permuted float view."""
+    n_axis, n_last = array.shape[0] // 2, array.shape[1]
+    source = array.view(np.float32).reshape(n_axis, 2, n_last, 2)
+    return np.ascontiguousarray(source.transpose(2, 3, 0, 1)).reshape(2 * n_last, 2 * n_axis).view(np.complex64)
+
+
+def real_parts(data):
+    """Regular transpose of the interleaved dimension, as done before (imaginaries dropped)."""
+    return np.ascontiguousarray(nf.TP(data))
+
+
+rng = np.random.default_rng(0)
+size = 4096
+array = (rng.standard_normal((2 * size, size)) + 1j * rng.standard_normal((2 * size, size))).astype(np.complex64)
+data = nf.NMRData(array, axes=[{"interleaved_data": True}, {}])
+
+print(f"{size} x {size} hypercomplex complex64 plane ({array.nbytes / 1024**2:.0f} MB)")
+print(f"TP (real parts only) {time_op(lambda: real_parts(data)):8.1f} ms")
+print(f"Untiled permutation  {time_op(lambda: untiled(array)):8.1f} ms")
+print(f"TP hyper_complex     {time_op(lambda: nf.TP(data, hyper_complex=True)):8.1f} ms")
+
+cube = nf.NMRData(array.reshape(16, 512, size), axes=[{}, {"interleaved_data": True}, {}])
+print(f"3D 16 x 256 x {size}, hyper TP of the last two {time_op(lambda: nf.TP(cube, axes=[0, 2, 1], hyper_complex=True)):8.1f} ms")
@@ -0,0 +1,50 @@
+import time
+import tracemalloc
+import numpy as np
+import nmr_fido as nf
+
+
+def measure(func, repeats: int = 5) -> tuple[float, float]:
+    """Return the mean time of func() in ms and its peak of newly allocated memory in MB."""
+    func()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    elapsed = (time.perf_counter() - start_time) / repeats * 1e3
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024**2
+
+
+def full_shape_window(data, window):
+    """Apodization as done before: window copied into an array of the full data shape."""
+    full_window = np.zeros_like(data)
+    full_window[..., :len(window)] = window
+    full_window[full_window == 0] = 1.0
+    result = data * full_window
+    result[..., 0] *= 0.5
+    return result
+
+
+rng = np.random.default_rng(0)
+shape = (64, 128, 1024)
+array = (rng.standard_normal(shape) + 1j * rng.standard_normal(shape)).astype(np.complex64)
+axes = [{"SW": 2000.0}, {"SW": 2500.0}, {"SW": 8000.0}]
+data = nf.NMRData(array, axes=axes)
+window = np.sin(np.linspace(0.5 * np.pi, np.pi, shape[-1])).astype(np.complex64)
+
+print(f"{' x '.join(map(str, shape))} complex64 ({array.nbytes / 1024**2:.0f} MB)")
+rows = {
+    "Full shape window (before)": lambda: full_shape_window(array, window),
+    "SP": lambda: nf.SP(data, start_angle=0.5, scale_factor_first_point=0.5, fill_outside_one=True),
+    "SP out=data (in place)": lambda: nf.SP(data, start_angle=0.5, scale_factor_first_point=0.5, out=data),
+    "EM": lambda: nf.EM(data, lb=5.0),
+    "GM": lambda: nf.GM(data, inv_exp_width=5.0, broaden_width=10.0),
+    "SP axis=1 out=data": lambda: nf.SP(data, start_angle=0.5, axis=1, out=data),
+}
+for name, func in rows.items():
+    elapsed, peak = measure(func)
+    print(f"{name:<28} {elapsed:8.1f} ms   peak {peak:8.1f} MB")
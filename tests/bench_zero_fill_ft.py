@@ -0,0 +1,37 @@
+import time
+import tracemalloc
+import numpy as np
+import nmr_fido as nf
+
+
+def measure(func, repeats: int = 5) -> tuple[float, float]:
+    """Return the mean time of func() in ms and its peak of newly allocated memory in MB."""
+    func()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    elapsed = (time.perf_counter() - start_time) / repeats * 1e3
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024**2
+
+
+rng = np.random.default_rng(0)
+shape = (256, 4096)
+array = (rng.standard_normal(shape) + 1j * rng.standard_normal(shape)).astype(np.complex64)
+data = nf.NMRData(array, axes=[{}, {"SW": 8000.0, "OBS": 600.0, "ORI": 4000.0}])
+
+print(f"{' x '.join(map(str, shape))} complex64 ({array.nbytes / 1024**2:.0f} MB)")
+for factor in (1, 2, 3):
+    rows = {
+        "ZF + FT": lambda: nf.FT(nf.ZF(data, factor=factor)),
+        "ZFFT": lambda: nf.ZFFT(data, factor=factor),
+        "ZF + FT bruk": lambda: nf.FT(nf.ZF(data, factor=factor), bruk=True),
+        "ZFFT bruk": lambda: nf.ZFFT(data, factor=factor, bruk=True),
+    }
+    for name, func in rows.items():
+        elapsed, peak = measure(func)
+        print(f"{2**factor}x {name:<16} {elapsed:8.1f} ms   peak {peak:8.1f} MB")
@@ -0,0 +1,68 @@
+import tracemalloc
+import numpy as np
+import pytest
+import nmr_fido as nf
+from nmr_fido.core.processing import _PhaseObjective
+
+
+def _spectra(nvec=1, npoints=4096, seed=0):
+    rng = np.random.default_rng(seed)
+    k = np.arange(npoints)
+    fid = np.zeros((nvec, npoints), dtype=np.complex128)
+    for amplitude, frequency, decay in [(1.0, 0.1, 3), (0.6, -0.2, 5), (0.8, 0.31, 2), (0.3, -0.4, 4)]:
+        fid += amplitude * np.exp(2j * np.pi * frequency * k - decay * k / npoints * 10)
+    fid[:, 0] *= 0.5
+    fid += 0.002 * (rng.standard_normal((nvec, npoints)) + 1j * rng.standard_normal((nvec, npoints)))
+    return nf.FT(nf.NMRData(fid.astype(np.complex64)))
+
+
+@pytest.mark.parametrize("p0, p1", [(40.0, -70.0), (-120.0, 30.0), (170.0, 100.0)])
+def test_auto_phase_acme(p0, p1):
+    spectrum = _spectra()
+    misphased = nf.PS(spectrum, p0=-p0, p1=-p1)
+    result = nf.auto_phase(misphased)
+
+    # The ACME minimum of this spectrum is a few degrees from the simulated phase
+    entry = result.processing_history[-1]
+    assert entry["Function"] == "Automatic Phase Correction"
+    assert abs((entry["p0"] - p0 + 180) % 360 - 180) < 10
+    assert abs(entry["p1"] - p1) < 15
+    assert result.dtype == misphased.dtype
+    assert np.asarray(result).real.max() > 0.95 * np.abs(np.asarray(spectrum)).max()
+
+
+@pytest.mark.parametrize("p0", [40.0, -120.0, 170.0])
+def test_auto_phase_peak_minima(p0):
+    result = nf.auto_phase(nf.PS(_spectra(), p0=-p0), objective="peak_minima", fit_p1=False)
+
+    entry = result.processing_history[-1]
+    assert abs((entry["p0"] - p0 + 180) % 360 - 180) < 2
+    assert entry["p1"] == 0.0
+
+
+def test_auto_phase_batch():
+    spectra = nf.PS(_spectra(nvec=6), p0=-40.0, p1=70.0)
+    result = nf.auto_phase(spectra, per_vector=True, n_jobs=2)
+
+    entry = result.processing_history[-1]
+    assert np.shape(entry["p0"]) == (6,)
+    assert np.allclose(entry["p0"], 40.0, atol=10)
+    assert np.allclose(entry["p1"], -70.0, atol=15)
+
+    single = nf.auto_phase(nf.NMRData(np.asarray(spectra)[2]), coarse_points=1024)
+    assert entry["p0"][2] == pytest.approx(single.processing_history[-1]["p0"])
+
+
+def test_phase_objective_does_not_allocate():
+    spectra = np.asarray(_spectra(nvec=16, npoints=8192))
+    objective = _PhaseObjective(spectra, np.arange(8192) / 8192, "acme", 1000.0, 100)
+    p0, p1 = np.full(16, 10.0), np.full(16, 20.0)
+    objective(p0, p1)
+
+    tracemalloc.start()
+    objective(p0 + 1, p1 + 1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Only the per spectrum scores and fixed size casting buffers, no temporaries the size of the spectra (1 MB)
+    assert peak < 128 * 1024
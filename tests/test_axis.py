@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(4)
+    t = np.arange(64)
+    fid = np.exp(2j * np.pi * 0.1 * t - t / 30)[:, None] * np.exp(-2j * np.pi * 0.2 * np.arange(48) - np.arange(48) / 20)
+    fid = fid + 0.01 * (rng.standard_normal(fid.shape) + 1j * rng.standard_normal(fid.shape))
+    axes = [{"label": "15N", "SW": 2000.0, "OBS": 60.8, "ORI": 6000.0}, {"label": "1H", "SW": 8000.0, "OBS": 600.1, "ORI": 0.0}]
+    return nf.NMRData(fid.astype(np.complex64), axes=axes)
+
+
+def _transposed(func, data, **kwargs):
+    return nf.TP(func(nf.TP(data), **kwargs))
+
+
+@pytest.mark.parametrize("func, kwargs", [
+    (nf.SP, {"start_angle": 0.5, "exponent": 2}),
+    (nf.EM, {"lb": 3.0}),
+    (nf.ZF, {"final_size": 128}),
+    (nf.FT, {}),
+    (nf.PS, {"p0": 30.0, "p1": -45.0}),
+    (nf.EXT, {"start": 10, "end": 40}),
+    (nf.LP, {"order": 4}),
+    (nf.CS, {"right_shift_amount": 5}),
+    (nf.REV, {}),
+    (nf.MULT, {"constant": 2.0, "start": 3, "end": 9}),
+])
+def test_axis_matches_transposes(data, func, kwargs):
+    expected = _transposed(func, data, **kwargs)
+    result = func(data, axis=0, **kwargs)
+
+    assert result.shape == expected.shape
+    assert np.allclose(np.asarray(result), np.asarray(expected), atol=1e-5 * np.abs(expected).max())
+    assert [axis["label"] for axis in result.axes] == [axis["label"] for axis in expected.axes]
+    assert np.allclose(result.axes[0]["scale"], expected.axes[0]["scale"])
+    assert result.processing_history[-1]["axis"] == 0
+
+
+def test_axis_keeps_memory_layout(data):
+    result = nf.FT(nf.PS(nf.SP(data, axis=0), p0=20.0, axis=0), axis=0)
+    assert result.flags.c_contiguous
+
+    assert np.array_equal(np.asarray(nf.SP(data, dim=0)), np.asarray(nf.SP(data, axis=0)))
+    assert "axis" not in nf.SP(data, axis=-1).processing_history[-1]
+    with pytest.raises(ValueError):
+        nf.SP(data, axis=2)
+
+
+def test_chunked_second_axis(data, tmp_path):
+    steps = [(nf.EM, {"lb": 2.0, "axis": -2}), nf.FT]
+    expected = nf.FT(nf.EM(data, lb=2.0, axis=-2))
+
+    destination = np.empty(data.shape, dtype=np.complex64)
+    result = nf.process_chunked(data, destination, steps)
+    assert np.allclose(np.asarray(result), np.asarray(expected), atol=1e-5 * np.abs(expected).max())
+
+    with pytest.raises(ValueError):
+        nf.process_chunked(data, destination, [(nf.EM, {"lb": 2.0, "axis": 0})])
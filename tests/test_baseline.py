@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+X = np.arange(1024)
+BASELINE = 0.5 + 1e-3 * X - 2e-6 * X**2
+PEAKS = 5 * np.exp(-((X - 300) / 5) ** 2) + 3 * np.exp(-((X - 700) / 4) ** 2)
+
+
+@pytest.fixture
+def spectra():
+    rng = np.random.default_rng(0)
+    return nf.NMRData((BASELINE + PEAKS + 0.01 * rng.standard_normal((3, 4, 1024))).astype(np.float32))
+
+
+def test_frequency_baseline_removed(spectra):
+    result = nf.POLY(spectra, node_list=None, nl=None, order=2)
+
+    assert result.shape == spectra.shape
+    assert result.dtype == np.float32
+    assert np.abs(np.asarray(result) - PEAKS).max() < 0.1
+    assert result.processing_history[-1]["Function"] == "Frequency domain polynomial baseline correction"
+
+
+def test_frequency_baseline_matches_polyfit(spectra):
+    # With all points below the threshold, the fit is an ordinary least squares polynomial
+    flat = nf.NMRData(np.asarray(spectra) - PEAKS)
+    result = nf.POLY(flat, node_list=None, nl=None, order=3)
+
+    vector = np.asarray(flat)[1, 2].astype(np.float64)
+    mask = vector < np.median(vector) + np.std(vector)
+    baseline = np.polyval(np.polyfit(X[mask], vector[mask], 3), X)
+    assert np.allclose(np.asarray(result)[1, 2], vector - baseline, atol=1e-4)
+
+
+def test_frequency_baseline_node_options(spectra):
+    result = nf.POLY(
+        spectra, node_list=None, nl=None, order=2,
+        initial_fit_nodes=12, node_width=5,
+        use_first_points=True, use_last_points=True,
+        use_node_avg=True, sine_filter=True,
+    )
+
+    assert np.abs(np.asarray(result) - PEAKS).max() < 0.1
+    assert result.processing_history[-1]["n_nodes"] == 14
+
+    with pytest.raises(ValueError):
+        nf.POLY(spectra, node_list=None, nl=None, sine_filter=True)
+
+
+@pytest.fixture
+def fids():
+    rng = np.random.default_rng(1)
+    t = np.arange(512)
+    signal = 5 * np.exp(2j * np.pi * 0.05 * t - t / 30)
+    noise = 0.05 * (rng.standard_normal((2, 3, 512)) + 1j * rng.standard_normal((2, 3, 512)))
+    return nf.NMRData((0.02 + 1e-5 * t + signal + noise).astype(np.complex64))
+
+
+def test_time_baseline_matches_polyfit(fids):
+    result = nf.POLY(fids, node_list=None, nl=None, domain="time", order=1)
+    assert result.shape == fids.shape
+
+    entry = result.processing_history[-1]
+    windows = np.asarray(fids)[..., :512].reshape(2, 3, 64, 8)
+    assert entry["rms_noise_value"] == pytest.approx(np.median(np.std(windows, axis=-1)))
+
+    # Each vector is fitted on its own points below the threshold, or on the first and last window
+    vector = np.asarray(fids)[1, 2]
+    baseline_indices = np.where(np.abs(vector) < entry["baseline_threshold"])[0]
+    if len(baseline_indices) < int(0.33 * 512):
+        baseline_indices = np.concatenate([np.arange(8), np.arange(504, 512)])
+    coeffs = np.polyfit(baseline_indices, vector[baseline_indices], 1)
+    expected = vector - np.polyval(coeffs, np.arange(512))
+    assert np.allclose(np.asarray(result)[1, 2], expected, atol=1e-5)
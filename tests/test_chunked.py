@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+STEPS = [(nf.SP, {"off": 0.5, "pow": 2}), nf.ZF, nf.FT, (nf.PS, {"p0": -30.0}), nf.DI]
+
+
+def _run_in_memory(data, steps):
+    for step in steps:
+        func, kwargs = step if isinstance(step, tuple) else (step, {})
+        data = func(data, **kwargs)
+    return data
+
+
+@pytest.fixture
+def data_3d():
+    rng = np.random.default_rng(0)
+    array = (rng.standard_normal((4, 6, 64)) + 1j * rng.standard_normal((4, 6, 64))).astype(np.complex64)
+    return nf.NMRData(
+        array,
+        axes=[
+            {"label": "13C", "SW": 4000.0, "ORI": 1000.0, "OBS": 125.7},
+            {"label": "15N", "SW": 2000.0, "ORI": 500.0, "OBS": 50.6},
+            {"label": "1H", "SW": 8000.0, "ORI": 2000.0, "OBS": 500.1},
+        ],
+    )
+
+
+def test_chunked_matches_in_memory(data_3d):
+    expected = _run_in_memory(data_3d, STEPS)
+
+    out = np.zeros(expected.shape, dtype=expected.dtype)
+    result = nf.process_chunked(data_3d, out, STEPS, memory_budget=8 * 1024)
+
+    assert np.allclose(np.asarray(result), np.asarray(expected), atol=1e-3)
+    assert np.shares_memory(result, out)
+    assert result.axes == expected.axes
+    assert [entry["Function"] for entry in result.processing_history[:-1]] == \
+        [entry["Function"] for entry in expected.processing_history]
+
+    chunk_entry = result.processing_history[-1]
+    assert chunk_entry["chunk_mode"] == "vectors"
+    assert chunk_entry["chunks"] > 1
+
+
+def test_chunked_transpose_streams_planes(data_3d):
+    steps = STEPS + [nf.TP]
+    expected = _run_in_memory(data_3d, STEPS)
+    expected = nf.TP(expected, axes=[0, 2, 1])
+
+    out = np.zeros(expected.shape, dtype=expected.dtype)
+    result = nf.process_chunked(data_3d, out, steps, memory_budget=1)
+
+    assert result.shape == (4, 128, 6)
+    assert np.allclose(out, np.asarray(expected), atol=1e-3)
+    assert result.processing_history[-1]["chunk_mode"] == "planes"
+    assert result.processing_history[-1]["chunks"] == 4
+
+
+def test_chunked_pipe_files(data_3d, tmp_path):
+    source = tmp_path / "fid.fid"
+    destination = tmp_path / "spec.ft1"
+    nf.write_pipe(source, data_3d)
+
+    assert nf.process_chunked(source, destination, STEPS, memory_budget=8 * 1024) is None
+
+    expected = _run_in_memory(data_3d, STEPS)
+    result = nf.read_pipe(destination)
+    assert result.shape == expected.shape
+    assert np.allclose(np.asarray(result), np.asarray(expected), atol=1e-3)
+    assert result.axes[-1]["unit"] == "ppm"
+
+    with pytest.raises(FileExistsError):
+        nf.process_chunked(source, destination, STEPS)
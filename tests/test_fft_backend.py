@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+def _reference_ft(array):
+    npoints = array.shape[-1]
+    return np.fft.fftshift(np.fft.ifft(array, axis=-1), axes=(-1,)) * npoints
+
+
+@pytest.fixture
+def fid():
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((4, 64)) + 1j * rng.standard_normal((4, 64))).astype(np.complex64)
+
+
+@pytest.mark.parametrize("npoints", [64, 63])
+def test_ft_matches_reference(npoints):
+    rng = np.random.default_rng(1)
+    array = rng.standard_normal((3, npoints)) + 1j * rng.standard_normal((3, npoints))
+
+    result = nf.FT(nf.NMRData(array))
+    assert np.allclose(np.asarray(result), _reference_ft(array))
+
+    # Inverse undoes the forward transform
+    assert np.allclose(np.asarray(nf.FT(result, inverse=True)), array)
+
+
+def test_ft_preserves_precision(fid):
+    assert nf.FT(nf.NMRData(fid)).dtype == np.complex64
+    assert nf.FT(nf.NMRData(fid.astype(np.complex128))).dtype == np.complex128
+    assert nf.FT(nf.NMRData(fid.real)).dtype == np.complex64
+
+
+@pytest.mark.parametrize("backend", ["numpy", "scipy"])
+def test_fft_backends_agree(fid, backend):
+    expected = np.asarray(nf.FT(nf.NMRData(fid)))
+    try:
+        nf.set_fft_backend(backend)
+        nf.set_fft_workers(2)
+        assert nf.get_fft_workers() == 2
+        result = nf.FT(nf.NMRData(fid))
+    finally:
+        nf.set_fft_backend("scipy")
+        nf.set_fft_workers(-1)
+
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), expected, atol=1e-3)
+
+
+def test_zero_fill_fast_length():
+    data = nf.NMRData(np.ones((2, 515), dtype=np.complex64))
+    result = nf.ZF(data, final_size=1030, fast_length=True)
+    assert result.shape[-1] == 1050
+    assert result.processing_history[-1]["fast_length"]
+
+
+@pytest.mark.parametrize("npoints", [64, 63])
+@pytest.mark.parametrize("inverse", [False, True])
+@pytest.mark.parametrize("sign_alteration", [False, True])
+def test_real_only_ft_matches_complex_path(npoints, inverse, sign_alteration):
+    rng = np.random.default_rng(2)
+    array = rng.standard_normal((3, npoints)) + 1j * rng.standard_normal((3, npoints))
+    zero_imaginaries = array.real + 1e-300j  # Complex data that takes the complex path
+
+    result = nf.FT(nf.NMRData(array), real_only=True, inverse=inverse, sign_alteration=sign_alteration)
+    expected = nf.FT(nf.NMRData(zero_imaginaries), inverse=inverse, sign_alteration=sign_alteration)
+    assert np.allclose(np.asarray(result), np.asarray(expected))
+
+
+@pytest.mark.parametrize("backend", ["numpy", "scipy"])
+def test_bruk_ft_of_real_data(fid, backend):
+    expected = _reference_ft(fid.real.astype(np.complex128) * np.where(np.arange(64) % 2, -1, 1))
+    try:
+        nf.set_fft_backend(backend)
+        result = nf.FT(nf.NMRData(fid), bruk=True)
+    finally:
+        nf.set_fft_backend("scipy")
+
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), expected, atol=1e-3)
+    assert result.processing_history[-1]["bruk"]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"factor": 1},
+    {"factor": 3, "bruk": True},
+    {"add": 37},
+    {"final_size": 200, "sign_alteration": True},
+    {"final_size": 255, "real_only": True, "sign_alteration": True},
+    {"add": 100, "fast_length": True, "negate_imaginaries": True},
+])
+def test_zero_fill_fourier_transform_matches_zf_ft(fid, kwargs):
+    zf_keys = ("factor", "add", "final_size", "fast_length")
+    zf_kwargs = {key: value for key, value in kwargs.items() if key in zf_keys}
+    ft_kwargs = {key: value for key, value in kwargs.items() if key not in zf_keys}
+    data = nf.NMRData(fid, axes=[{}, {"SW": 5000.0, "OBS": 600.0, "ORI": 3000.0}])
+
+    expected = nf.FT(nf.ZF(data, **zf_kwargs), **ft_kwargs)
+    result = nf.ZFFT(data, **kwargs)
+
+    assert result.shape == expected.shape
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), np.asarray(expected), atol=1e-3)
+    assert np.allclose(result.axes[-1]["scale"], expected.axes[-1]["scale"])
+    assert [entry["Function"] for entry in result.processing_history] == ["Zero filling", "Complex fourier transform"]
+    assert result.processing_history[0]["new_last_dim"] == expected.processing_history[0]["new_last_dim"]
+
+
+def test_zero_fill_fourier_transform_along_axis(fid):
+    data = nf.NMRData(fid)
+    expected = nf.FT(nf.ZF(data, factor=2, axis=0), axis=0)
+    result = nf.ZFFT(data, factor=2, axis=0)
+    assert np.allclose(np.asarray(result), np.asarray(expected), atol=1e-3)
+    assert result.processing_history[-1]["axis"] == 0
+
+
+def test_zero_fill_fourier_transform_aliases(fid):
+    data = nf.NMRData(fid)
+    assert nf.ZFFT(data, zf=3).shape == (4, 512)
+    assert nf.ZFFT(data, size=100).shape == (4, 100)
+    assert nf.ZFFT(data, pad=36).shape == (4, 100)
+
+    expected = nf.ZFFT(data, final_size=100, real_only=True, sign_alteration=True)
+    result = nf.ZFFT(data, size=100, real=True, alt=True)
+    assert np.allclose(np.asarray(result), np.asarray(expected))
+    assert result.processing_history[-1]["real_only"] and result.processing_history[-1]["sign_alteration"]
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+def _reference_lp(fid, prediction_size, order, fix_roots=True):
+    """Single vector forward LP with np.linalg.lstsq, np.roots and a point by point recurrence."""
+    n = fid.size
+    M = np.array([fid[i:i + order] for i in range(n - order)])
+    coeffs = np.linalg.lstsq(M, fid[order:], rcond=None)[0]
+
+    if fix_roots:
+        roots = np.roots(np.concatenate(([1.0], -coeffs[::-1])))
+        roots = np.where(np.abs(roots) > 1, 1 / np.conj(roots), roots)
+        coeffs = -np.poly(roots)[:0:-1]
+
+    extended = np.empty(n + prediction_size, dtype=np.result_type(fid, coeffs))
+    extended[:n] = fid
+    for i in range(prediction_size):
+        extended[n + i] = np.dot(coeffs, extended[n + i - order:n + i])
+    return extended
+
+
+@pytest.fixture
+def fids():
+    rng = np.random.default_rng(0)
+    t = np.arange(64)
+    freqs = rng.uniform(-0.3, 0.3, (6, 1))
+    decays = rng.uniform(0.01, 0.05, (6, 1))
+    noise = 0.01 * (rng.standard_normal((6, 64)) + 1j * rng.standard_normal((6, 64)))
+    return np.exp((2j * np.pi * freqs - decays) * t) + noise
+
+
+@pytest.mark.parametrize("fix_roots", [True, False])
+def test_lp_matches_per_vector_reference(fids, fix_roots):
+    result = nf.LP(nf.NMRData(fids.reshape(2, 3, 64)), prediction_size=32, order=8, fix_roots=fix_roots)
+    expected = np.array([_reference_lp(fid, 32, 8, fix_roots) for fid in fids])
+
+    assert result.shape == (2, 3, 96)
+    assert np.iscomplexobj(result)
+    assert np.allclose(np.asarray(result).reshape(6, 96), expected)
+
+
+def test_lp_real_data_and_plain_arrays(fids):
+    result = nf.LP(fids.real, prediction_size=16)
+
+    assert not isinstance(result, nf.NMRData)
+    assert result.dtype == np.float64
+    assert np.allclose(result, [_reference_lp(fid, 16, 8) for fid in fids.real])
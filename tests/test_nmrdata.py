@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+@pytest.fixture
+def sample_data():
+    return nf.NMRData(
+        np.ones((4, 8), dtype=np.complex64),
+        axes=[
+            {"label": "15N", "SW": 5555.5, "ORI": 3333.4, "OBS": 50.6},
+            {"label": "13C", "SW": 50000.0, "ORI": -18053.6, "OBS": 125.6},
+        ],
+    )
+
+
+def test_derived_arrays_share_metadata(sample_data):
+    view = sample_data * 2
+    assert view._meta is sample_data._meta
+    
+    copied = nf.NMRData(np.asarray(view), copy_from=sample_data)
+    assert copied._meta is sample_data._meta
+
+
+def test_child_mutation_does_not_leak(sample_data):
+    child = sample_data.copy()
+    child.processing_history.append({"Function": "Test"})
+    child.axes[-1]["label"] = "1H"
+    child.metadata["key"] = 1
+    
+    assert sample_data.processing_history == []
+    assert sample_data.axes[-1]["label"] == "13C"
+    assert sample_data.metadata == {}
+
+
+def test_parent_mutation_does_not_leak(sample_data):
+    child = sample_data[1:3]
+    sample_data.axes[0]["label"] = "1H"
+    sample_data.processing_history.append({"Function": "Test"})
+    
+    assert child.axes[0]["label"] == "15N"
+    assert child.processing_history == []
+
+
+def test_owner_does_not_copy_again(sample_data):
+    sample_data.processing_history.append({"Function": "Test"})
+    meta = sample_data._meta
+    
+    sample_data.axes[0]["label"] = "1H"
+    sample_data.metadata["key"] = 1
+    sample_data.processing_history.append({"Function": "Test"})
+    assert sample_data._meta is meta
+
+
+def test_stale_references_do_not_leak(sample_data):
+    axes = sample_data.axes
+    metadata = sample_data.metadata
+    history = sample_data.processing_history
+    
+    copied = sample_data.copy()
+    view = sample_data[...]
+    derived = nf.NMRData(np.asarray(sample_data), copy_from=sample_data)
+    axes[1]["label"] = "X"
+    metadata["key"] = 1
+    history.append({"Function": "Test"})
+    
+    for other in (copied, view, derived):
+        assert other.axes[1]["label"] == "13C"
+        assert other.metadata == {}
+        assert other.processing_history == []
+    assert sample_data.axes[1]["label"] == "X"
+    assert sample_data.metadata == {"key": 1}
+
+
+def test_derived_arrays_from_threads_stay_isolated(sample_data):
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def derive(index):
+        child = sample_data * 2
+        child.processing_history.append({"Function": "Test", "index": index})
+        return child
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        children = list(executor.map(derive, range(200)))
+    
+    assert sample_data.processing_history == []
+    assert all(child.processing_history == [{"Function": "Test", "index": i}] for i, child in enumerate(children))
@@ -0,0 +1,47 @@
+import functools
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+@pytest.fixture
+def fids():
+    rng = np.random.default_rng(0)
+    t = np.arange(256)
+    signal = np.exp(2j * np.pi * 0.1 * t - t / 80)
+    noise = 0.01 * (rng.standard_normal((5, 256)) + 1j * rng.standard_normal((5, 256)))
+    return nf.NMRData((signal + noise).astype(np.complex64))
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_map_vectors_matches_serial(backend):
+    array = np.arange(3 * 4 * 10, dtype=np.float64).reshape(3, 4, 10)
+    func = functools.partial(np.cumsum, axis=-1)
+
+    result = nf.map_vectors(func, array, n_jobs=3, backend=backend)
+
+    assert result.shape == array.shape
+    assert np.array_equal(result, np.cumsum(array, axis=-1))
+
+
+def test_n_jobs_setting():
+    try:
+        nf.set_n_jobs(2)
+        assert nf.get_n_jobs() == 2
+        nf.set_n_jobs(-1)
+        assert nf.get_n_jobs() >= 1
+        with pytest.raises(ValueError):
+            nf.set_n_jobs(0)
+    finally:
+        nf.set_n_jobs(1)
+
+
+def test_parallel_processing_matches_serial(fids):
+    assert np.allclose(np.asarray(nf.LP(fids, order=6, n_jobs=3)), np.asarray(nf.LP(fids, order=6)))
+    assert np.allclose(np.asarray(nf.SOL(fids, n_jobs=2)), np.asarray(nf.SOL(fids)))
+
+    spectrum = nf.DI(nf.FT(fids))
+    serial = nf.POLY(spectrum, node_list=None, nl=None, order=2)
+    parallel = nf.POLY(spectrum, node_list=None, nl=None, order=2, n_jobs=2)
+    assert np.allclose(np.asarray(parallel), np.asarray(serial))
+    assert parallel.processing_history[-1]["Function"] == "Frequency domain polynomial baseline correction"
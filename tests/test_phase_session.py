@@ -0,0 +1,62 @@
+import time
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+@pytest.fixture
+def spectrum():
+    rng = np.random.default_rng(3)
+    t = np.arange(4096)
+    fid = np.exp(2j * np.pi * 0.1 * t - t / 300) + 0.5 * np.exp(-2j * np.pi * 0.2 * t - t / 200)
+    fid = fid + 0.01 * (rng.standard_normal(t.size) + 1j * rng.standard_normal(t.size))
+    return nf.FT(nf.NMRData(fid.astype(np.complex64)))
+
+
+def test_session_matches_phase(spectrum):
+    session = nf.PhaseSession(spectrum)
+    expected = np.asarray(nf.PS(spectrum, p0=-29.0, p1=45.0))
+
+    phased = session.update(p0=-29.0, p1=45.0)
+    assert phased.dtype == np.complex64
+    assert np.allclose(phased, expected, atol=1e-4 * np.abs(expected).max())
+
+    # p0 only update reuses the first order rotation
+    real = session.update(p0=60.0, real_only=True)
+    assert real.dtype == np.float32
+    assert np.allclose(real, np.asarray(nf.PS(spectrum, p0=60.0, p1=45.0)).real, atol=1e-4 * np.abs(expected).max())
+
+    preview = session.update(decimate=8, real_only=True)
+    assert preview.shape == (512,)
+    assert np.array_equal(preview, real[session.preview_x(8)])
+
+    result = session.result()
+    assert result.processing_history[-1]["Function"] == "Phase Correction"
+    assert result.processing_history[-1]["p0"] == 60.0
+    assert result.processing_history[-1]["p1"] == 45.0
+
+
+def test_session_updates_into_buffers(spectrum):
+    session = nf.PhaseSession(spectrum)
+    first = session.update(p0=10.0, p1=5.0)
+    second = session.update(p0=20.0, p1=-5.0)
+    assert first is second
+
+    with pytest.raises(ValueError):
+        nf.PhaseSession(nf.DI(spectrum))
+    with pytest.raises(ValueError):
+        session.update(decimate=0)
+
+
+def test_session_update_speed():
+    data = nf.NMRData(np.ones(65536, dtype=np.complex64))
+    session = nf.PhaseSession(data)
+    session.update(p0=0.0, p1=1.0)
+
+    start = time.perf_counter()
+    for i in range(100):
+        session.update(p0=float(i), p1=float(i), real_only=True)
+    per_update = (time.perf_counter() - start) / 100
+
+    # Under a millisecond per slider update, with margin for slow test machines
+    assert per_update < 5e-3
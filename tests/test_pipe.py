@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+def test_read_pipe_1d():
+    data = nf.read_pipe("tests/test1d.fid")
+
+    assert data.ndim == 1
+    assert data.dtype == np.complex64
+    assert data.axes[0]["label"] == "C13"
+    assert data.axes[0]["SW"] == 50000.0
+    assert data.processing_history[-1]["Function"] == "Read NMRPipe file"
+
+
+def test_read_pipe_2d():
+    data = nf.read_pipe("tests/test2d.fid")
+
+    assert data.ndim == 2
+    assert data.dtype == np.complex64
+    assert data.axes[0]["label"] == "15N"
+    assert data.axes[0]["interleaved_data"]
+    assert data.axes[1]["label"] == "13C"
+
+
+@pytest.mark.parametrize("filename", ["tests/test1d.fid", "tests/test2d.fid"])
+def test_pipe_round_trip(filename, tmp_path):
+    data = nf.read_pipe(filename)
+
+    out_file = tmp_path / "out.fid"
+    nf.write_pipe(out_file, data)
+
+    with open(filename, "rb") as original, open(out_file, "rb") as written:
+        assert original.read() == written.read()
+
+    with pytest.raises(FileExistsError):
+        nf.write_pipe(out_file, data)
+
+
+def test_real_data_is_memory_mapped(tmp_path):
+    data = nf.read_pipe("tests/test2d.fid")
+    data = nf.DI(nf.FT(data))
+
+    out_file = tmp_path / "out.ft1"
+    nf.write_pipe(out_file, data)
+
+    mapped = nf.read_pipe(out_file)
+    assert mapped.dtype == np.float32
+    assert mapped.axes[-1]["unit"] == "ppm"
+    assert np.allclose(np.asarray(mapped), np.asarray(data))
+
+    base = mapped
+    while base.base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
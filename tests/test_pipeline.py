@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+STEPS = [
+    (nf.SP, {"start_angle": 0.35, "end_angle": 0.98, "exponent": 1, "scale_factor_first_point": 0.5}),
+    (nf.ZF, {"final_size": 4096}),
+    nf.FT,
+    (nf.PS, {"p0": -29.0, "p1": 10.0}),
+    nf.DI,
+    (nf.EXT, {"start": "70ppm", "end": "40ppm"}),
+    nf.TP,
+    (nf.EM, {"lb": 5.0}),
+    nf.ZF,
+    nf.FT,
+    (nf.PS, {"p0": 15.0}),
+    nf.DI,
+    (nf.EXT, {"start": "135ppm", "end": "100ppm"}),
+]
+
+
+def _without_times(history):
+    return [{k: v for k, v in entry.items() if not k.startswith("time_elapsed")} for entry in history]
+
+
+@pytest.fixture
+def data():
+    return nf.read_pipe("tests/test2d.fid")
+
+
+def test_pipeline_compiles_fused_groups():
+    pipeline = nf.Pipeline(STEPS)
+    assert [len(group) for group in pipeline.plan] == [6, 1, 6]
+    assert len(pipeline) == len(STEPS)
+
+
+def test_pipeline_matches_sequential(data):
+    expected = data
+    for func, kwargs in nf.Pipeline(STEPS):
+        expected = func(expected, **kwargs)
+
+    result = nf.Pipeline(STEPS)(data)
+
+    assert result.shape == expected.shape
+    assert result.dtype == expected.dtype
+    assert np.allclose(np.asarray(result), np.asarray(expected), rtol=1e-4, atol=1e-4 * np.abs(expected).max())
+    assert result.axes == expected.axes
+    assert _without_times(result.processing_history) == _without_times(expected.processing_history)
+    assert not np.shares_memory(result, data)
+
+
+def test_pipeline_without_extract_keeps_input(data):
+    steps = [(nf.SP, {"start_angle": 0.5}), nf.ZF, nf.FT]
+    original = np.asarray(data).copy()
+
+    expected = nf.FT(nf.ZF(nf.SP(data, start_angle=0.5)))
+    result = nf.Pipeline(steps)(data)
+
+    assert np.array_equal(np.asarray(data), original)
+    assert np.allclose(np.asarray(result), np.asarray(expected), rtol=1e-4, atol=1e-4 * np.abs(expected).max())
+
+
+def test_pipeline_drops_identities_and_folds_diagonals(data):
+    steps = [
+        nf.NULL,
+        (nf.PS, {"p0": 0.0, "p1": 0.0}),
+        (nf.MULT, {"constant": 1.0}),
+        (nf.SP, {"start_angle": 0.5}),
+        (nf.MULT, {"constant": 2.0, "start": 10, "end": 100}),
+        (nf.PS, {"p0": 30.0, "p1": -20.0}),
+        (nf.ADD, {"constant": 0.0}),
+    ]
+    pipeline = nf.Pipeline(steps)
+    assert [kind for _, _, kind in pipeline.plan[0]] == [
+        "identity", "identity", "identity", "diagonal", "diagonal", "diagonal", "identity",
+    ]
+
+    expected = data
+    for func, kwargs in pipeline:
+        expected = func(expected, **kwargs)
+    result = pipeline(data)
+
+    assert result.dtype == expected.dtype
+    assert np.allclose(np.asarray(result), np.asarray(expected), rtol=1e-5, atol=1e-5 * np.abs(expected).max())
+    assert _without_times(result.processing_history) == _without_times(expected.processing_history)
+
+
+def test_pipeline_keeps_phase_reconstructing_imaginaries(data):
+    steps = [(nf.PS, {"p0": 0.0, "p1": 0.0, "reconstruct_imaginaries": True}), (nf.MULT, {"constant": 1.0})]
+    assert [kind for group in nf.Pipeline(steps).plan for _, _, kind in group] == [None, "identity"]
+
+    result = nf.Pipeline(steps)(data)
+    expected = nf.PS(data, p0=0.0, p1=0.0, reconstruct_imaginaries=True)
+    assert not np.allclose(np.asarray(expected), np.asarray(data))
+    assert np.allclose(np.asarray(result), np.asarray(expected))
+
+
+def test_pipeline_lone_identity_keeps_history(data):
+    steps = [nf.TP, (nf.PS, {"p0": 0.0, "p1": 0.0}), nf.TP]
+    assert [kind for group in nf.Pipeline(steps).plan for _, _, kind in group] == [None, "identity", None]
+
+    result = nf.Pipeline(steps)(data)
+    expected = nf.TP(nf.PS(nf.TP(data), p0=0.0, p1=0.0))
+    assert np.allclose(np.asarray(result), np.asarray(expected))
+    assert _without_times(result.processing_history) == _without_times(expected.processing_history)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+STEPS = {
+    "SOL": lambda x: nf.SOL(x),
+    "SOL spline": lambda x: nf.SOL(x, filter_mode="Spline"),
+    "LP": lambda x: nf.LP(x, order=4),
+    "SP": lambda x: nf.SP(x, start_angle=0.5),
+    "GM": lambda x: nf.GM(x, inv_exp_width=1.0, broaden_width=2.0),
+    "EM": lambda x: nf.EM(x, line_broadening=1.0),
+    "ZF": lambda x: nf.ZF(x),
+    "FT": lambda x: nf.FT(x),
+    "FT real_only": lambda x: nf.FT(x, real_only=True),
+    "FT inverse": lambda x: nf.FT(x, inverse=True),
+    "PS": lambda x: nf.PS(x, p0=10.0, p1=5.0),
+    "EXT": lambda x: nf.EXT(x, start=2, end=20),
+    "POLY": lambda x: nf.POLY(x, node_list=None, nl=None),
+    "POLY time": lambda x: nf.POLY(x, node_list=None, nl=None, domain="time"),
+    "TP": lambda x: nf.TP(x),
+    "ADD": lambda x: nf.ADD(x, constant=1.0),
+    "MULT": lambda x: nf.MULT(x, constant=2.0),
+    "DI": lambda x: nf.DI(x),
+    "NULL": lambda x: nf.NULL(x),
+    "REV": lambda x: nf.REV(x),
+    "RS": lambda x: nf.RS(x, shift_amount=2),
+    "LS": lambda x: nf.LS(x, shift_amount=2),
+    "CS": lambda x: nf.CS(x, right_shift_amount=2),
+    "SIGN": lambda x: nf.SIGN(x, alternate_sign=True),
+    "MC": lambda x: nf.MC(x),
+}
+
+PRECISIONS = {
+    "single": (np.float32, np.complex64),
+    "double": (np.float64, np.complex128),
+}
+
+
+def _data(dtype):
+    rng = np.random.default_rng(0)
+    array = rng.standard_normal((8, 64)) + 1j * rng.standard_normal((8, 64))
+    array = array if np.dtype(dtype).kind == "c" else array.real
+    axes = [{"SW": 1000.0, "OBS": 100.0, "ORI": 0.0}, {"SW": 5000.0, "OBS": 500.0, "ORI": 0.0}]
+    return nf.NMRData(array.astype(dtype), axes=axes)
+
+
+@pytest.fixture
+def policy():
+    yield nf.set_precision
+    nf.set_precision(None)
+
+
+@pytest.mark.parametrize("name", STEPS)
+@pytest.mark.parametrize("dtype", [np.float32, np.complex64, np.float64, np.complex128])
+def test_no_silent_upcast(name, dtype):
+    result = STEPS[name](_data(dtype))
+    # Same floating point precision, real or complex
+    assert np.finfo(result.dtype).dtype == np.finfo(dtype).dtype
+
+
+@pytest.mark.parametrize("precision", PRECISIONS)
+@pytest.mark.parametrize("name", STEPS)
+def test_precision_policy(policy, precision, name):
+    real_dtype, complex_dtype = PRECISIONS[precision]
+    other = np.complex128 if precision == "single" else np.complex64
+    policy(precision)
+
+    result = STEPS[name](_data(other))
+    assert result.dtype in (real_dtype, complex_dtype)
+
+
+def test_single_precision_chain(policy):
+    policy("single")
+    assert nf.get_precision() == "single"
+
+    data = _data(np.complex128)
+    data = nf.PS(nf.FT(nf.ZF(nf.SP(data, start_angle=0.5))), p0=20.0)
+    data = nf.TP(nf.DI(data))
+    assert data.dtype == np.float32
+
+    with pytest.raises(ValueError):
+        policy("half")
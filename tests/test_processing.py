@@ -25,3 +25,100 @@ def test_fourier_transform_basic(sample_data):
     result = nf.fourier_transform(sample_data, real_only=True)
     assert isinstance(result, nf.NMRData)
     assert result.shape == sample_data.shape
+
+def test_window_broadcasts_and_writes_out():
+    rng = np.random.default_rng(0)
+    array = (rng.standard_normal((3, 5, 16)) + 1j * rng.standard_normal((3, 5, 16))).astype(np.complex64)
+    data = nf.NMRData(array, axes=[{}, {}, {"SW": 1000.0}])
+
+    window = np.sin(np.pi * 0.5 + np.pi * 0.5 * np.arange(10) / 9)
+    expected = array.copy()
+    expected[..., :10] *= window
+    expected[..., 0] *= 0.5
+
+    result = nf.SP(data, start_angle=0.5, size_window=10, scale_factor_first_point=0.5, fill_outside_one=True)
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), expected, atol=1e-6)
+
+    # In place
+    in_place = data.copy()
+    result = nf.SP(in_place, start_angle=0.5, size_window=10, scale_factor_first_point=0.5, fill_outside_one=True, out=in_place)
+    assert np.shares_memory(result, in_place)
+    assert np.allclose(np.asarray(in_place), expected, atol=1e-6)
+    assert result.processing_history[-1]["Function"] == "Apodization: Sine bell window"
+
+    out = np.empty_like(array)
+    nf.EM(data, line_broadening=2.0, out=out)
+    assert np.allclose(out, np.asarray(nf.EM(data, line_broadening=2.0)))
+    with pytest.raises(ValueError):
+        nf.EM(data, line_broadening=2.0, out=out[..., :8])
+
+
+@pytest.mark.parametrize("func, kwargs", [
+    (nf.ADD, {"constant": 2.0, "start": 3, "end": 9}),
+    (nf.MULT, {"constant": -1.5}),
+    (nf.SET, {"constant": 0.0, "start": 5}),
+    (nf.SIGN, {"negate_imaginaries": True, "alternate_sign": True}),
+    (nf.PS, {"p0": 30.0, "p1": -45.0}),
+    (nf.PS, {"p0": 30.0, "p1": -45.0, "temporary_zero_fill": True}),
+    (nf.EM, {"line_broadening": 3.0}),
+    (nf.REV, {}),
+    (nf.CS, {"right_shift_amount": 5, "negate_shifted": True}),
+])
+@pytest.mark.parametrize("axis", [-1, 0])
+def test_inplace_and_out_match_copy(func, kwargs, axis):
+    rng = np.random.default_rng(1)
+    array = (rng.standard_normal((12, 20)) + 1j * rng.standard_normal((12, 20))).astype(np.complex64)
+    axes = [{"SW": 1000.0, "OBS": 500.0, "ORI": 2000.0}, {"SW": 4000.0, "OBS": 500.0, "ORI": 3000.0}]
+    data = nf.NMRData(array, axes=axes)
+    expected = func(data, axis=axis, **kwargs)
+
+    out = np.empty_like(array)
+    result = func(data, axis=axis, out=out, **kwargs)
+    assert np.shares_memory(result, out)
+    assert np.allclose(out, np.asarray(expected), atol=1e-5)
+    assert np.array_equal(np.asarray(data), array)
+
+    in_place = data.copy()
+    result = func(in_place, axis=axis, inplace=True, **kwargs)
+    assert result is in_place
+    assert np.allclose(np.asarray(in_place), np.asarray(expected), atol=1e-5)
+    assert in_place.processing_history[-1]["Function"] == expected.processing_history[-1]["Function"]
+    assert len(in_place.processing_history) == len(expected.processing_history)
+    assert np.allclose(in_place.axes[axis]["scale"], expected.axes[axis]["scale"])
+    assert data.processing_history == []
+
+
+def test_inplace_restrictions():
+    data = nf.NMRData(np.ones((4, 8), dtype=np.complex64))
+
+    view = nf.DI(data, inplace=True)
+    assert view.dtype == np.float32
+    assert np.shares_memory(view, data)
+    assert view.processing_history[-1]["Function"] == "Delete imaginary part"
+
+    with pytest.raises(ValueError):
+        nf.MULT(data, constant=2.0, inplace=True, out=np.empty_like(data))
+    with pytest.raises(ValueError):
+        nf.PS(nf.NMRData(np.ones((4, 8))), p0=90.0, inplace=True)
+    with pytest.raises(ValueError):
+        nf.SIGN(data, absolute_value=True, inplace=True)
+
+    try:
+        nf.set_precision("double")
+        with pytest.raises(ValueError):
+            nf.MULT(data, constant=2.0, inplace=True)
+    finally:
+        nf.set_precision(None)
+
+
+def test_update_from_skips_copy_of_own_memory():
+    data = nf.NMRData(np.arange(8, dtype=np.complex64)).copy()
+    result = nf.MULT(data, constant=2.0, inplace=True)
+    data._update_from(nf.NMRData(np.asarray(result), copy_from=result))
+    assert np.array_equal(np.asarray(data), 2 * np.arange(8))
+
+    other = nf.NMRData(np.zeros(4, dtype=np.complex64))
+    data._update_from(other)
+    assert data.shape == (4,)
+    assert np.array_equal(np.asarray(data), np.zeros(4))
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+from nmr_fido.utils.scales import LinearScale, get_hz_scale, get_ppm_scale
+
+
+@pytest.fixture
+def ppm_scale():
+    return LinearScale.ppm(1024, 5555.5, 3333.4, 50.6), get_ppm_scale(1024, 5555.5, 3333.4, 50.6)
+
+
+def test_matches_materialized_scales(ppm_scale):
+    scale, array = ppm_scale
+    assert np.allclose(scale, array)
+    assert np.allclose(LinearScale.hz(1024, 5555.5, 3333.4), get_hz_scale(1024, 5555.5, 3333.4))
+    assert scale[-1] == pytest.approx(array[-1])
+
+
+@pytest.mark.parametrize("item", [slice(10, 500), slice(None, None, -1), slice(700, 20, -3), slice(5, 6)])
+def test_slicing_is_lazy(ppm_scale, item):
+    scale, array = ppm_scale
+    sliced = scale[item]
+    assert isinstance(sliced, LinearScale)
+    assert np.allclose(sliced, array[item])
+
+
+@pytest.mark.parametrize("shift", [0, 7, -300, 1500])
+def test_roll(ppm_scale, shift):
+    scale, array = ppm_scale
+    rolled = scale.roll(shift)
+    assert isinstance(rolled, LinearScale)
+    assert np.allclose(rolled, np.roll(array, shift))
+    assert np.allclose(rolled[100:3:-2], np.roll(array, shift)[100:3:-2])
+    assert np.allclose(rolled.roll(5), np.roll(array, shift + 5))
+
+
+def test_nmrdata_slicing_keeps_calibration():
+    data = nf.NMRData(np.zeros(1500), axes=[{"SW": 50000.0, "ORI": -12524.25, "OBS": 125.68}])
+    data.scale_to_ppm()
+    
+    region = data[299:900]
+    axis = region.axes[0]
+    
+    assert isinstance(axis["scale"], LinearScale)
+    assert np.allclose(axis["scale"], np.asarray(data.axes[0]["scale"])[299:900])
+    assert np.allclose(axis["scale"], LinearScale.ppm(601, axis["SW"], axis["ORI"], axis["OBS"]))
+    assert region.limits() == (axis["scale"][0], axis["scale"][-1])
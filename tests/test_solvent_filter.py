@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from scipy import signal
+import nmr_fido as nf
+
+
+def _reference_sol(array, kernel):
+    # Vector by vector, as NMRPipe SOL: reflect padded convolution subtracted from the FID
+    K = len(kernel) // 2
+    result = array.copy()
+    for index in np.ndindex(array.shape[:-1]):
+        padded = np.pad(array[index], (K, K), mode='reflect')
+        result[index] -= signal.convolve(padded, kernel, mode='valid') / kernel.sum()
+    return result
+
+
+@pytest.fixture
+def fids():
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((3, 4, 200)) + 1j * rng.standard_normal((3, 4, 200))).astype(np.complex64)
+
+
+@pytest.mark.parametrize("lowpass_size", [4, 16, 40])
+def test_lowpass_matches_reference(fids, lowpass_size):
+    # Covers both the direct and the FFT convolution
+    kernel = np.cos(np.pi * np.linspace(-0.5, 0.5, 2 * lowpass_size + 1))
+
+    result = nf.SOL(nf.NMRData(fids), lowpass_shape="Sine", lowpass_size=lowpass_size)
+
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), _reference_sol(fids, kernel), atol=1e-5)
+
+
+def test_butterworth_matches_reference(fids):
+    b, a = signal.butter(4, 0.05)
+    expected = fids - signal.filtfilt(b, a, fids, axis=-1)
+
+    result = nf.SOL(nf.NMRData(fids), lowpass_shape="Butterworth", skip_points=0)
+
+    assert np.allclose(np.asarray(result), expected, atol=1e-5)
+
+
+def test_polynomial_mode_matches_polyfit(fids):
+    result = nf.SOL(nf.NMRData(fids), filter_mode="Polynomial", poly_ext_order=3)
+
+    x = np.arange(fids.shape[-1])
+    expected = fids.astype(np.complex128)
+    for index in np.ndindex(fids.shape[:-1]):
+        fid = expected[index]
+        baseline = np.polyval(np.polyfit(x, fid.real, 3), x) + 1j * np.polyval(np.polyfit(x, fid.imag, 3), x)
+        expected[index] = fid - baseline
+
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), expected, atol=1e-4)
+
+
+def test_spline_mode_matches_dense_solve(fids):
+    npoints = fids.shape[-1]
+    smoothing = 1.0 * (1.1 * 9) ** 4
+    D = np.diff(np.eye(npoints), n=2, axis=0)
+    system = np.eye(npoints) + smoothing * D.T @ D
+    expected = fids - np.linalg.solve(system, fids.reshape(-1, npoints).T).T.reshape(fids.shape)
+
+    result = nf.SOL(nf.NMRData(fids), filter_mode=2, lowpass_size=4)
+
+    assert result.dtype == np.complex64
+    assert np.allclose(np.asarray(result), expected, atol=1e-4)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+def _states(shape, interleaved, seed=0):
+    rng = np.random.default_rng(seed)
+    array = (rng.standard_normal(shape) + 1j * rng.standard_normal(shape)).astype(np.complex64)
+    axes = [{"interleaved_data": i in interleaved} for i in range(len(shape))]
+    return nf.NMRData(array, axes=axes)
+
+
+def _reference(array, axis):
+    """Hypercomplex transpose point by point: quadrant a/b of point (j, k) moves to (k, b) / (j, a)."""
+    array = np.moveaxis(np.asarray(array), axis, -2)
+    n_axis, n_last = array.shape[-2] // 2, array.shape[-1]
+    result = np.empty(array.shape[:-2] + (2 * n_last, n_axis), dtype=array.dtype)
+    for j in range(n_axis):
+        for k in range(n_last):
+            real, imag = array[..., 2 * j, k], array[..., 2 * j + 1, k]
+            result[..., 2 * k, j] = real.real + 1j * imag.real
+            result[..., 2 * k + 1, j] = real.imag + 1j * imag.imag
+    return np.moveaxis(result, -2, axis)
+
+
+def test_hypercomplex_transpose_2d():
+    data = _states((40, 19), interleaved=[0])
+    result = nf.TP(data, hyper_complex=True)
+
+    assert result.shape == (38, 20)
+    assert result.dtype == np.complex64
+    assert result.flags.c_contiguous
+    assert np.array_equal(np.asarray(result), _reference(data, 0))
+    assert result.axes[0]["interleaved_data"] and not result.axes[1]["interleaved_data"]
+    assert len(result.axes[1]["scale"]) == 20
+    assert result.processing_history[-1]["hyper_complex"]
+
+    # Transposing back restores the data
+    restored = nf.TP(result, hyper=True)
+    assert np.array_equal(np.asarray(restored), np.asarray(data))
+
+
+@pytest.mark.parametrize("axes, axis", [([0, 2, 1], 1), ([2, 1, 0], 0)])
+def test_hypercomplex_transpose_3d(axes, axis):
+    data = _states((6, 18, 11), interleaved=[0, 1], seed=1)
+    result = nf.TP(data, axes=axes, hyper_complex=True)
+    assert np.array_equal(np.asarray(result), _reference(data, axis))
+
+
+def test_hypercomplex_transpose_real_last_dimension():
+    data = _states((40, 19), interleaved=[0])
+    real = nf.DI(data)
+    result = nf.TP(real, hyper_complex=True)
+
+    assert result.shape == (19, 20)
+    assert np.array_equal(np.asarray(result), np.asarray(nf.TP(real)))
+    assert not result.axes[0]["interleaved_data"]
+
+
+def test_hypercomplex_transpose_errors():
+    with pytest.raises(ValueError):
+        nf.TP(_states((40, 19), interleaved=[]), hyper_complex=True)
+    with pytest.raises(ValueError):
+        nf.TP(_states((6, 18, 11), interleaved=[0, 1]), axes=[1, 0, 2], hyper_complex=True)
+
+
+def test_interleaved_to_complex_views_contiguous_floats():
+    from nmr_fido.core.processing import _interleaved_to_complex
+
+    interleaved = np.arange(24, dtype=np.float32).reshape(3, 8)
+    data = nf.NMRData(interleaved)
+    expected = interleaved[:, ::2] + 1j * interleaved[:, 1::2]
+
+    result = _interleaved_to_complex(data)
+    assert result.dtype == np.complex64
+    assert np.shares_memory(result, data)
+    assert np.array_equal(np.asarray(result), expected)
+    assert len(result.axes[-1]["scale"]) == 4
+
+    copied = _interleaved_to_complex(data, copy=True)
+    assert not np.shares_memory(copied, data) and np.array_equal(np.asarray(copied), expected)
+
+    # Strided or indirect dimensions fall back to one copy
+    strided = _interleaved_to_complex(nf.NMRData(interleaved.T.copy()).T)
+    assert not np.shares_memory(strided, interleaved) and np.array_equal(np.asarray(strided), expected)
+    rows = _interleaved_to_complex(nf.NMRData(interleaved[:2]), dim=0)
+    assert np.array_equal(np.asarray(rows), (interleaved[0] + 1j * interleaved[1])[None])
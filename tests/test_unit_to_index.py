@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+from nmr_fido.utils.unit_to_index import convert_to_indices, _convert_to_index
+
+
+@pytest.fixture
+def spectrum():
+    data = nf.NMRData(np.zeros((4, 4096)), axes=[{}, {"SW": 50000.0, "ORI": -12524.25, "OBS": 125.68}])
+    data.scale_to_ppm()
+    return data
+
+
+def brute_force(scale, positions):
+    return np.array([np.argmin(np.abs(np.asarray(scale) - p)) for p in positions])
+
+
+def test_ppm_array_matches_nearest_point(spectrum):
+    positions = np.random.default_rng(0).uniform(-150, 350, 1000)
+    expected = brute_force(spectrum.axes[-1]["scale"], positions)
+    
+    assert np.array_equal(spectrum.to_indices(positions, unit="ppm"), expected)
+
+
+def test_monotonic_array_scale_uses_same_indices(spectrum):
+    positions = np.random.default_rng(1).uniform(-150, 350, 1000)
+    array_scale = np.asarray(spectrum.axes[-1]["scale"])
+    data = nf.NMRData(np.zeros(4096), axes=[{"scale": array_scale, "unit": "ppm", "OBS": 125.68}])
+    
+    assert np.array_equal(data.to_indices(positions, unit="ppm"), brute_force(array_scale, positions))
+
+
+def test_mixed_units(spectrum):
+    hz_position = 70 * spectrum.axes[-1]["OBS"]
+    indices = convert_to_indices(spectrum, ["70ppm", f"{hz_position}Hz", "10%", -1, "-2 pts"])
+    
+    assert indices[0] == indices[1] == _convert_to_index(spectrum, "70 ppm", 4096, default=0)
+    assert indices[2:].tolist() == [409, 4095, 4094]
+
+
+def test_plain_arrays_need_axis_information():
+    with pytest.raises(ValueError):
+        convert_to_indices(np.zeros(16), "5ppm")
+    assert convert_to_indices(np.zeros(16), [-1, "50%"]).tolist() == [15, 8]
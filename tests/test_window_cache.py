@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+import nmr_fido as nf
+
+
+@pytest.fixture
+def window_cache():
+    nf.clear_window_cache()
+    yield
+    nf.set_window_cache_limit(max_entries=128, max_bytes=64 * 1024**2)
+    nf.clear_window_cache()
+
+
+def _data(dtype=np.complex64):
+    return nf.NMRData(np.ones((8, 256), dtype=dtype), axes=[{}, {"SW": 5000.0}])
+
+
+def test_window_cache_hits(window_cache):
+    first = nf.EM(_data(), line_broadening=5.0)
+    second = nf.EM(_data(), line_broadening=5.0)
+    assert np.array_equal(np.asarray(first), np.asarray(second))
+
+    info = nf.window_cache_info()
+    assert (info["hits"], info["misses"], info["entries"]) == (1, 1, 1)
+    assert info["nbytes"] == 256 * 4
+
+    # Other parameters, sizes or precisions are other windows
+    nf.EM(_data(), line_broadening=2.0)
+    nf.EM(_data(np.complex128), line_broadening=5.0)
+    nf.SP(_data(), start_angle=0.5)
+    nf.GM(_data(), inv_exp_width=5.0, broaden_width=10.0)
+    info = nf.window_cache_info()
+    assert (info["hits"], info["misses"], info["entries"]) == (1, 5, 5)
+
+    # Cached windows cannot be modified and in place apodization still works
+    data = _data()
+    nf.EM(data, line_broadening=5.0, out=data)
+    nf.EM(data, line_broadening=5.0, out=data)
+    assert np.allclose(np.asarray(data), np.asarray(first) ** 2)
+
+    nf.clear_window_cache()
+    assert nf.window_cache_info()["entries"] == 0
+
+
+def test_window_cache_limits(window_cache):
+    nf.set_window_cache_limit(max_entries=2)
+    for lb in (1.0, 2.0, 3.0):
+        nf.EM(_data(), line_broadening=lb)
+    assert nf.window_cache_info()["entries"] == 2
+
+    # The least recently used window was dropped
+    nf.EM(_data(), line_broadening=1.0)
+    assert nf.window_cache_info()["hits"] == 0
+
+    nf.set_window_cache_limit(max_bytes=100)
+    assert nf.window_cache_info()["entries"] == 0
+    nf.EM(_data(), line_broadening=1.0)
+    assert nf.window_cache_info()["entries"] == 0
+
+    with pytest.raises(ValueError):
+        nf.set_window_cache_limit(max_entries=-1)
@@ -7,6 +7,18 @@ PROCESSING_PATH = Path("nmr_fido/core/processing.py")
 NMRDATA_PATH = Path("nmr_fido/nmrdata.py")
 INIT_PATH = Path("nmr_fido/__init__.py")
 
+# Public API outside of processing.py, exposed in __init__.py as well
+EXTRA_EXPORTS = {
+    ".io.pipe": ["read_pipe", "write_pipe"],
+    ".core.chunked": ["process_chunked"],
+    ".core.pipeline": ["Pipeline"],
+    ".core.fft": ["set_fft_backend", "get_fft_backend", "set_fft_workers", "get_fft_workers"],
+    ".core.parallel": ["map_vectors", "set_n_jobs", "get_n_jobs"],
+    ".core.phasing": ["PhaseSession"],
+    ".core.cache": ["window_cache_info", "clear_window_cache", "set_window_cache_limit"],
+    ".core.precision": ["set_precision", "get_precision"],
+}
+
 
 def inject_alias_docstrings() -> None:
     """
@@ -75,10 +87,10 @@ def expose_processing_in_init() -> None:
                 alias_map.setdefault(func, []).append(alias)
 
     # Build the import section
-    import_block = [
-        "from .nmrdata import NMRData",
-        "from .core.processing import ("
-    ]
+    import_block = ["from .nmrdata import NMRData"]
+    for module, names in EXTRA_EXPORTS.items():
+        import_block.append(f"from {module} import " + ", ".join(names))
+    import_block.append("from .core.processing import (")
     for func in functions:
         aliases = alias_map.get(func, [])
         if aliases:
@@ -91,6 +103,8 @@ def expose_processing_in_init() -> None:
     # Build the __all__ block
     all_block = ["__all__ = ["]
     all_block.append('    "NMRData",')
+    for names in EXTRA_EXPORTS.values():
+        all_block.append("    " + ", ".join(f'"{name}"' for name in names) + ",")
     for func in functions:
         parts = [f'"{func}"'] + [f'"{alias}"' for alias in alias_map.get(func, [])]
         all_block.append("    " + ", ".join(parts) + ",")